@@ -0,0 +1,95 @@
+# backend/benchmarks/bench_applicant_memory.py
+# Retained memory of an applicant set: StudentRanking objects vs. ApplicantPool vs. whole SchoolSnapshot
+#
+# Usage (from backend/): python -m benchmarks.bench_applicant_memory [--sizes 10000 50000]
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable, List
+from src.database import schemas
+from src.services.applicant_pool import ApplicantPool
+from src.services.application_snapshot_service import ApplicationSnapshotStore, SchoolSnapshot
+from src.utils import fast_json
+
+def applicant_rows(count: int) -> List[dict]:
+    return [
+        {
+            "student_id": str(index), "student_name": f"학생 {index}", "rank": index + 1, "percentile_rank": index / count * 100,
+            "is_priority_selection": index % 20 == 0, "priority_type": "WITHIN_QUOTA" if index % 20 == 0 else None,
+            "priority_category": "농어촌" if index % 40 == 0 else None, "school_name": f"school-{index % 45}",
+            "grade": 3, "class_number": index % 12 + 1, "number": index % 30 + 1,
+        }
+        for index in range(count)
+    ]
+
+def retained_bytes(build: Callable[[], object], count: int):
+    """build()가 만든 객체가 붙잡고 있는 메모리 (입력 행은 측정 안에서 만들고 버림)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    result = build(count)
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return retained, elapsed
+
+def build_models(count: int):
+    return fast_json.list_adapter(schemas.StudentRanking).validate_python(applicant_rows(count))
+
+def build_pool(count: int):
+    return ApplicantPool.from_rows(applicant_rows(count))
+
+def build_snapshot(count: int) -> SchoolSnapshot:
+    """스토어가 보관하는 학교 스냅샷 전체 (지원자 풀, 학교·통계 모델, 요약 응답 본문)"""
+    school = schemas.School(
+        id="1", name="고등학교 1", total_quota=count, priority_within_quota=0, priority_outside_quota=0,
+        actual_competition_quota=count, gender_type="COED", is_levelized=True,
+        created_at="2024-03-01T09:00:00", updated_at="2024-03-01T09:00:00",
+    )
+    statistics = schemas.CompetitionStatistics(
+        total_applicants=count, general_applicants=count, priority_within_applicants=0, priority_outside_applicants=0, competition_ratio=1.0,
+    )
+    status = schemas.CompetitionStatus(
+        school_id=school.id, school_name=school.name, total_quota=count, priority_within_quota=0,
+        priority_outside_quota=0, actual_competition_quota=count, statistics=statistics,
+    )
+    return SchoolSnapshot(
+        school_id=1, version=1, academic_year=2024, status=status, school=school, statistics=statistics, applicants=build_pool(count),
+        last_updated="2024-03-01T09:00:00", status_json=status.model_dump_json().encode("utf-8"),
+    )
+
+def build_snapshot_with_detail(count: int):
+    """조회된 학교: 스냅샷과 캐시된 상세 응답 본문"""
+    store = ApplicationSnapshotStore(session_factory=None)
+    snapshot = build_snapshot(count)
+    store.detail_json(snapshot)
+    return store, snapshot
+
+def main():
+    parser = argparse.ArgumentParser(description="Applicant set memory benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        models_bytes, models_seconds = retained_bytes(build_models, size)
+        pool_bytes, pool_seconds = retained_bytes(build_pool, size)
+        snapshot_bytes, snapshot_seconds = retained_bytes(build_snapshot, size)
+        viewed_bytes, viewed_seconds = retained_bytes(build_snapshot_with_detail, size)
+        print(f"{size} applicants")
+        for name, retained, seconds in (
+            ("StudentRanking list", models_bytes, models_seconds),
+            ("ApplicantPool", pool_bytes, pool_seconds),
+            ("SchoolSnapshot", snapshot_bytes, snapshot_seconds),
+            ("  + cached detail body", viewed_bytes, viewed_seconds),
+        ):
+            print(f"  {name:<22} {retained / 2**20:>8.2f} MiB {retained / size:>7.0f} B/applicant  built in {seconds * 1000:>7.1f} ms")
+        print(f"  reduction (list vs. snapshot)         {models_bytes / snapshot_bytes:>6.1f}x")
+        print(f"  reduction (list vs. snapshot + body)  {models_bytes / viewed_bytes:>6.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# backend/benchmarks/bench_approval.py
+# Approval subsystem under concurrency on the in-memory Firestore fake
+#
+# Usage (from backend/): python -m benchmarks.bench_approval --users 10000 100000 --latency-ms 1 --concurrency 16
+
+import argparse
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Tuple
+from src.services import approval_service as approval_module
+from src.services.approval_service import approval_service
+from src.testing.approval_seed import pending_targets, seed_approval_data
+from src.testing.firestore_fake import FakeFirestore
+from src.utils.firestore_tracing import TracedClient, trace_firestore
+
+def run_scenario(operation: Callable[[int], None], operations: int, concurrency: int) -> Tuple[float, List[float], List[int]]:
+    def timed(index: int):
+        with trace_firestore() as trace:
+            started = time.perf_counter()
+            operation(index)
+            return (time.perf_counter() - started) * 1000, trace.rpc_count
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(timed, range(operations)))
+    elapsed = time.perf_counter() - started
+    return elapsed, [latency for latency, _ in results], [rpcs for _, rpcs in results]
+
+def report(name: str, elapsed: float, latencies: List[float], rpcs: List[int]):
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"  {name:<16} {len(latencies) / elapsed:>9.1f} ops/s  p50 {statistics.median(latencies):>8.2f} ms  p95 {p95:>8.2f} ms  {statistics.mean(rpcs):>5.1f} rpc/op")
+
+def main():
+    parser = argparse.ArgumentParser(description="Approval subsystem benchmark")
+    parser.add_argument("--users", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="simulated Firestore round-trip latency")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--operations", type=int, default=50)
+    args = parser.parse_args()
+
+    for user_count in args.users:
+        client = FakeFirestore(latency=args.latency_ms / 1000)
+        approvers = seed_approval_data(client, user_count, logs_per_head=max(user_count // 500, 20))
+        approval_module.db = TracedClient(client)
+        heads = approvers["heads"]
+        print(f"{user_count} users, {args.latency_ms} ms latency, concurrency {args.concurrency}")
+
+        report("pending lookup", *run_scenario(lambda i: approval_service.get_pending_users_for_approver(heads[i % len(heads)]), args.operations, args.concurrency))
+        report("statistics", *run_scenario(lambda i: approval_service.get_approval_statistics(heads[i % len(heads)]), args.operations, args.concurrency))
+
+        # 같은 사용자를 두 번 승인하지 않도록 미리 대상 배정
+        work = [(head, uid) for head in heads for uid in pending_targets(client, head)]
+        random.Random(0).shuffle(work)
+        work = work[:args.operations]
+        report("approve", *run_scenario(lambda i: approval_service.approve_user_hierarchical(work[i][0], work[i][1], True), len(work), args.concurrency))
+
+if __name__ == "__main__":
+    main()
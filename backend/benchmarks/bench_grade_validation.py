@@ -0,0 +1,74 @@
+# backend/benchmarks/bench_grade_validation.py
+# Column-wise validation time of a 5,000-row grade sheet (xlsx cell values and CSV text)
+#
+# Usage (from backend/): python -m benchmarks.bench_grade_validation [--repeat N] [--rows 5000] [--budget-ms 100]
+# --budget-ms를 주면 한 경우라도 중앙값이 예산을 넘을 때 종료 코드 1
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Callable, List, Tuple
+from src.services.grade_validation_service import rows_to_columns, validate_grade_columns
+
+def sheet_rows(count: int) -> List[list]:
+    """학년·반·번호가 겹치지 않는 정상 행 (openpyxl이 돌려주는 값 형태)"""
+    return [
+        [1 + index // 1980, index // 99 % 20 + 1, index % 99 + 1, f"학생{index}", "남" if index % 2 else "여"] + [None] * 9 + [index % 1000 / 10]
+        for index in range(count)
+    ]
+
+def as_text(rows: List[list]) -> List[list]:
+    """CSV로 읽은 것처럼 모든 칸을 문자열로"""
+    return [["" if value is None else str(value) for value in row] for row in rows]
+
+def with_errors(rows: List[list], every: int = 100) -> List[list]:
+    """every행마다 백분율 범위 오류와 번호 중복을 하나씩 넣음"""
+    rows = [list(row) for row in rows]
+    for index in range(0, len(rows) - 1, every):
+        rows[index][14] = 150
+        rows[index + 1][:3] = rows[index][:3]
+    return rows
+
+def cases(count: int) -> List[Tuple[str, List[list]]]:
+    rows = sheet_rows(count)
+    return [
+        ("xlsx values, clean", rows),
+        ("csv text, clean", as_text(rows)),
+        ("xlsx values, 2% errors", with_errors(rows)),
+        ("csv text, 2% errors", as_text(with_errors(rows))),
+    ]
+
+def time_ms(function: Callable[[], object], repeat: int) -> float:
+    function()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description="Grade sheet validation benchmark")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail when a median exceeds this")
+    args = parser.parse_args()
+
+    row_numbers = list(range(2, args.rows + 2))
+    over_budget = []
+    print(f"{args.rows} rows (median ms per sheet)")
+    for name, rows in cases(args.rows):
+        columns = rows_to_columns(rows)
+        report, _ = validate_grade_columns(columns, row_numbers)
+        elapsed = time_ms(lambda: validate_grade_columns(columns, row_numbers), args.repeat)
+        print(f"  {name:<28} {elapsed:>8.2f} ms {report.error_count:>6} errors")
+        if args.budget_ms is not None and elapsed > args.budget_ms:
+            over_budget.append(name)
+
+    if over_budget:
+        print(f"over the {args.budget_ms} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
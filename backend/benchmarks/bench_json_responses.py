@@ -0,0 +1,98 @@
+# backend/benchmarks/bench_json_responses.py
+# Default response_model encoding vs. the fast_json path for large list responses
+#
+# Usage (from backend/): python -m benchmarks.bench_json_responses [--repeat N]
+
+import argparse
+import statistics
+import time
+from typing import List
+import json
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+from src.database import schemas
+from src.utils import fast_json
+from src.utils.constants import UserRole
+
+SIZES = (1_000, 10_000)
+
+def make_users(count: int) -> List[schemas.UserInDB]:
+    return [
+        schemas.UserInDB(
+            uid=f"uid-{index}",
+            email=f"teacher{index}@example.com",
+            username=f"teacher{index}",
+            full_name=f"교사 {index}",
+            role=UserRole.ADMIN,
+            is_active=True,
+            is_approved=False,
+            school_id="school-1",
+            created_at="2024-01-01T00:00:00",
+            updated_at="2024-01-01T00:00:00",
+        )
+        for index in range(count)
+    ]
+
+def build_app(users: List[schemas.UserInDB]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=List[schemas.UserInDB])
+    def default_path():
+        return users
+
+    @app.get("/fast", response_model=List[schemas.UserInDB])
+    def fast_path():
+        return fast_json.list_response(schemas.UserInDB, users)
+
+    return app
+
+def classic_encode(users: List[schemas.UserInDB]) -> bytes:
+    """FastAPI의 기존 response_model 경로: dict 변환, 재검증, jsonable_encoder, json.dumps"""
+    adapter = fast_json.list_adapter(schemas.UserInDB)
+    validated = adapter.validate_python([user.model_dump() for user in users])
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False).encode("utf-8")
+
+def time_ms(function, repeat: int) -> float:
+    function()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def measure(client: TestClient, path: str, repeat: int) -> List[float]:
+    client.get(path)  # 준비 실행
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = client.get(path)
+        timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print("encoding only (classic validate + jsonable_encoder vs. fast_json.dump_list)")
+    print(f"{'items':>7} {'classic ms':>11} {'fast ms':>9} {'speedup':>8}")
+    for size in SIZES:
+        users = make_users(size)
+        classic = time_ms(lambda: classic_encode(users), args.repeat)
+        fast = time_ms(lambda: fast_json.dump_list(schemas.UserInDB, users), args.repeat)
+        print(f"{size:>7} {classic:>11.2f} {fast:>9.2f} {classic / fast:>7.1f}x")
+
+    print("end to end through the installed FastAPI (TestClient)")
+    print(f"{'items':>7} {'default ms':>11} {'fast ms':>9} {'speedup':>8}")
+    for size in SIZES:
+        client = TestClient(build_app(make_users(size)))
+        assert client.get("/default").json() == client.get("/fast").json()
+        default = statistics.median(measure(client, "/default", args.repeat))
+        fast = statistics.median(measure(client, "/fast", args.repeat))
+        print(f"{size:>7} {default:>11.2f} {fast:>9.2f} {default / fast:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
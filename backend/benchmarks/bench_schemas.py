@@ -0,0 +1,121 @@
+# backend/benchmarks/bench_schemas.py
+# Validation and serialization cost of the hot request/response schemas
+#
+# Usage (from backend/): python -m benchmarks.bench_schemas [--repeat N] [--filter ranking]
+
+import argparse
+import json
+import statistics
+import time
+from typing import Callable, List, Tuple
+from src.database import schemas
+from src.utils import fast_json
+from src.utils.constants import UserRole
+
+LIST_SIZES = (100, 1_000, 10_000)
+
+def signup_payload(role: UserRole) -> dict:
+    payload = {"username": "teacher", "email": "teacher@example.com", "password": "secret", "school_id": "school-1", "role": role}
+    if role == UserRole.THIRD_GRADE_HOMEROOM:
+        payload.update(grade=3, class_number=4)
+    if role == UserRole.THIRD_GRADE_HEAD:
+        payload.update(is_homeroom_teacher=False)
+    return payload
+
+def firestore_user(index: int) -> dict:
+    return {
+        "uid": f"user-{index}", "email": f"teacher{index}@example.com", "username": f"teacher{index}", "full_name": f"교사 {index}",
+        "role": UserRole.THIRD_GRADE_HOMEROOM.value, "is_active": True, "is_approved": False, "school_id": "school-1",
+        "grade": 3, "class_number": index % 12 + 1, "is_homeroom_teacher": True,
+        "created_at": "2024-03-01T09:00:00", "updated_at": "2024-03-01T09:00:00",
+    }
+
+def school_row(index: int) -> dict:
+    return {
+        "id": str(index), "name": f"고등학교 {index}", "address": None, "total_quota": 280, "priority_within_quota": 28,
+        "priority_outside_quota": 14, "actual_competition_quota": 252, "gender_type": "COED", "is_levelized": True,
+        "created_at": "2024-03-01T09:00:00", "updated_at": "2024-03-01T09:00:00",
+    }
+
+def application_row(index: int) -> dict:
+    return {
+        "id": str(index), "student_id": str(index), "school_id": "3", "department_name": None, "is_accepted": False,
+        "is_priority_selection": index % 20 == 0, "priority_type": "WITHIN_QUOTA" if index % 20 == 0 else None,
+        "priority_category": None, "rank_in_school": index + 1, "percentile_rank": index / 100,
+        "created_at": "2024-03-01T09:00:00", "updated_at": "2024-03-01T09:00:00",
+    }
+
+def ranking_row(index: int) -> dict:
+    return {
+        "student_id": str(index), "student_name": f"학생 {index}", "rank": index + 1, "percentile_rank": index / 100,
+        "is_priority_selection": False, "priority_type": None, "priority_category": None,
+        "school_name": "school-1", "grade": 3, "class_number": index % 12 + 1, "number": index % 30 + 1,
+    }
+
+def time_us(function: Callable[[], object], repeat: int) -> float:
+    """repeat번 실행한 중앙값 (µs)"""
+    function()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.median(timings)
+
+def single_cases() -> List[Tuple[str, Callable[[], object]]]:
+    homeroom = signup_payload(UserRole.THIRD_GRADE_HOMEROOM)
+    head = signup_payload(UserRole.THIRD_GRADE_HEAD)
+    invitation = dict(homeroom, invitation_code="abc123")
+    school = school_row(1)
+    user = firestore_user(1)
+    return [
+        ("UserCreate (homeroom)", lambda: schemas.UserCreate(**homeroom)),
+        ("UserCreate (head)", lambda: schemas.UserCreate(**head)),
+        ("UserCreateWithInvitation", lambda: schemas.UserCreateWithInvitation(**invitation)),
+        ("UserInDB validate", lambda: schemas.UserInDB(**user)),
+        ("UserInDB model_construct", lambda: schemas.UserInDB.model_construct(**user)),
+        ("School validate", lambda: schemas.School(**school)),
+        ("School model_construct", lambda: schemas.School.model_construct(**school)),
+    ]
+
+def list_cases(size: int) -> List[Tuple[str, Callable[[], object]]]:
+    users = [firestore_user(index) for index in range(size)]
+    applications = [application_row(index) for index in range(size)]
+    rankings = [ranking_row(index) for index in range(size)]
+    ranking_models = [schemas.StudentRanking(**row) for row in rankings]
+    application_adapter = fast_json.list_adapter(schemas.StudentApplication)
+    ranking_adapter = fast_json.list_adapter(schemas.StudentRanking)
+    user_adapter = fast_json.list_adapter(schemas.UserInDB)
+    return [
+        ("UserInDB per-item validate", lambda: [schemas.UserInDB(**row) for row in users]),
+        ("UserInDB TypeAdapter validate", lambda: user_adapter.validate_python(users)),
+        ("UserInDB model_construct", lambda: [schemas.UserInDB.model_construct(**row) for row in users]),
+        ("StudentApplication per-item validate", lambda: [schemas.StudentApplication(**row) for row in applications]),
+        ("StudentApplication TypeAdapter validate", lambda: application_adapter.validate_python(applications)),
+        ("StudentRanking per-item validate", lambda: [schemas.StudentRanking(**row) for row in rankings]),
+        ("StudentRanking TypeAdapter validate", lambda: ranking_adapter.validate_python(rankings)),
+        ("StudentRanking model_construct", lambda: [schemas.StudentRanking.model_construct(**row) for row in rankings]),
+        ("StudentRanking dump: model_dump + json", lambda: json.dumps([model.model_dump() for model in ranking_models], ensure_ascii=False)),
+        ("StudentRanking dump: TypeAdapter", lambda: ranking_adapter.dump_json(ranking_models)),
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description="Schema validation micro-benchmarks")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--filter", default="", help="only cases whose name contains this text")
+    args = parser.parse_args()
+
+    print("single objects (median µs per call)")
+    for name, function in single_cases():
+        if args.filter.lower() in name.lower():
+            print(f"  {name:<44} {time_us(function, args.repeat * 50):>10.2f}")
+
+    for size in LIST_SIZES:
+        print(f"{size} items (median ms per list, µs per item)")
+        for name, function in list_cases(size):
+            if args.filter.lower() in name.lower():
+                elapsed = time_us(function, args.repeat)
+                print(f"  {name:<44} {elapsed / 1000:>10.2f} ms {elapsed / size:>8.2f} µs")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,372 @@
+# backend/benchmarks/load_test.py
+# Admission-deadline load scenario against the full app with local Firebase/DB stand-ins
+#
+# Usage (from backend/): python -m benchmarks.load_test --duration 30
+#                        python -m benchmarks.load_test --duration 30 --baseline benchmarks/results/load-20241101-090000.json
+#
+# Results are written as JSON (benchmarks/results/ by default) so runs can be compared over time.
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# 사용자 유형별 요청 사이 평균 대기 시간 (초, 지수 분포)
+THINK_SECONDS = {
+    "head_teacher_upload": 5.0,
+    "homeroom_poll": 1.0,
+    "approver": 0.5,
+    "websocket_subscriber": 0.5,
+}
+
+@dataclass
+class LoadConfig:
+    duration: float = 30.0
+    head_teachers: int = 8
+    homeroom_teachers: int = 40
+    approvers: int = 8
+    subscribers: int = 16
+    firestore_users: int = 10_000
+    firestore_latency_ms: float = 1.0
+    high_schools: int = 20
+    students_per_school: int = 300
+    think_scale: float = 1.0
+    seed: int = 0
+
+class RouteStats:
+    """라우트별 클라이언트 측 지연 시간과 상태 코드 (스레드 안전)"""
+
+    def __init__(self):
+        self._latencies: Dict[str, List[float]] = defaultdict(list)
+        self._statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._errors: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, route: str, latency_ms: float, status_code: int, ok: bool):
+        with self._lock:
+            self._latencies[route].append(latency_ms)
+            self._statuses[route][str(status_code)] += 1
+            if not ok:
+                self._errors[route] += 1
+
+    def summary(self, elapsed: float) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                route: summarize(latencies, elapsed, self._errors[route], dict(self._statuses[route]))
+                for route, latencies in sorted(self._latencies.items())
+            }
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(q / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+def summarize(latencies: List[float], elapsed: float, errors: int = 0, statuses: Optional[dict] = None) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered), 2) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 50), 2),
+        "p95_ms": round(percentile(ordered, 95), 2),
+        "p99_ms": round(percentile(ordered, 99), 2),
+        "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+        "statuses": statuses or {},
+    }
+
+def compare(baseline: dict, current: dict) -> List[dict]:
+    """두 실행 결과의 라우트별 p95·처리량 변화 (%)"""
+    rows = []
+    for route, stats in current["routes"].items():
+        before = baseline.get("routes", {}).get(route)
+        if not before:
+            continue
+        rows.append({
+            "route": route,
+            "p95_ms": (before["p95_ms"], stats["p95_ms"], _change(before["p95_ms"], stats["p95_ms"])),
+            "throughput_rps": (before["throughput_rps"], stats["throughput_rps"], _change(before["throughput_rps"], stats["throughput_rps"])),
+        })
+    return rows
+
+def _change(before: float, after: float) -> Optional[float]:
+    return round((after - before) / before * 100, 1) if before else None
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def prepare_environment(workdir: str):
+    """설정은 import 시점에 읽히므로 앱을 import하기 전에 호출"""
+    os.environ["DATABASE_URL"] = f"sqlite:///{workdir}/load.db"
+    os.environ["WARMUP_ENABLED"] = "false"
+
+class LoadEnvironment:
+    """
+    The real app wired to local stand-ins: a file-backed SQLite database seeded with
+    schools, students and applications, the in-memory Firestore fake with simulated
+    latency, and an auth override that resolves the X-Load-User header to a seeded user.
+    """
+
+    def __init__(self, config: LoadConfig):
+        from fastapi import HTTPException, Request
+        from src.app import app
+        from src.database import schemas
+        from src.database.session import SessionLocal, init_db
+        from src.services import approval_service as approval_module
+        from src.services import auth_service as auth_module
+        from src.services import notification_service as notification_module
+        from src.testing.admission_seed import seed_admission_data
+        from src.testing.approval_seed import pending_targets, seed_approval_data
+        from src.testing.firestore_fake import AlreadyExists, FailedPrecondition, FakeFirestore, Increment
+        from src.utils import auth_decorators
+        from src.utils.constants import UserRole
+        from src.utils.firestore_tracing import TracedClient
+
+        self.app = app
+        init_db()
+        db = SessionLocal()
+        try:
+            seeded = seed_admission_data(db, config.high_schools, config.head_teachers, config.students_per_school, seed=config.seed)
+        finally:
+            db.close()
+        self.high_school_ids = seeded["high_school_ids"]
+
+        self.firestore = FakeFirestore(latency=config.firestore_latency_ms / 1000)
+        approvers = seed_approval_data(self.firestore, config.firestore_users, seed=config.seed)
+        approval_module.db = notification_module.db = TracedClient(self.firestore)
+        notification_module._increment = Increment
+        notification_module._write_conflicts = lambda: (AlreadyExists, FailedPrecondition)
+
+        def teacher(uid: str, role: UserRole, school_id: str) -> schemas.UserInDB:
+            return schemas.UserInDB(
+                uid=uid, email=f"{uid}@example.com", username=uid, full_name=uid, role=role,
+                is_active=True, is_approved=True, school_id=school_id, created_at="2024-03-01T09:00:00", updated_at="2024-03-01T09:00:00",
+            )
+
+        self.head_teachers = [teacher(f"load-head-{index}", UserRole.HEAD_TEACHER, school_id) for index, school_id in enumerate(seeded["middle_school_ids"])]
+        self.homeroom_teachers = [teacher(f"load-homeroom-{index}", UserRole.HOMEROOM_TEACHER, f"school-{index % config.head_teachers}") for index in range(config.homeroom_teachers)]
+        self.approvers = approvers["heads"][:config.approvers]
+        self.users = {user.uid: user for user in self.head_teachers + self.homeroom_teachers + self.approvers}
+
+        # 승인 대상은 미리 나눠 두어 같은 사용자를 두 번 승인하지 않게 함
+        self.approval_queues = {approver.uid: pending_targets(self.firestore, approver) for approver in self.approvers}
+        self.approval_lock = threading.Lock()
+        self.job_ids: Dict[str, List[str]] = defaultdict(list)  # 중학교 ID별 업로드 작업
+        self.job_lock = threading.Lock()
+
+        def current_user(request: Request) -> schemas.UserInDB:
+            user = self.users.get(request.headers.get("x-load-user", ""))
+            if user is None:
+                raise HTTPException(status_code=401, detail="Unknown load-test user")
+            return user
+
+        # 라우트마다 현재 사용자 의존성이 다름 (토큰 디코딩, 모듈 함수, 서비스 객체 메서드)
+        dependencies = [auth_module.get_current_user_from_token]
+        for owner in (auth_module, getattr(auth_module, "auth_service", None)):
+            if hasattr(owner, "get_current_user"):
+                dependencies.append(owner.get_current_user)
+        for dependency in dependencies:
+            app.dependency_overrides[dependency] = current_user
+
+        # 웹소켓 인증은 의존성이 아닌 직접 호출: ?token=<부하 사용자 UID>로 해석
+        async def websocket_user(token: str, db) -> schemas.UserInDB:
+            user = self.users.get(token)
+            if user is None:
+                raise HTTPException(status_code=401, detail="Unknown load-test user")
+            return user
+
+        auth_decorators.get_current_user_from_token = websocket_user
+
+    def grade_sheet(self, school_id: str, rng: random.Random) -> bytes:
+        from src.database.session import SessionLocal
+        from src.testing.admission_seed import grade_sheet
+        db = SessionLocal()
+        try:
+            return grade_sheet(db, school_id, rng=rng)
+        finally:
+            db.close()
+
+    def next_approval_target(self, approver_uid: str) -> Optional[str]:
+        with self.approval_lock:
+            queue = self.approval_queues[approver_uid]
+            return queue.pop() if queue else None
+
+    def add_job(self, school_id: str, job_id: str):
+        with self.job_lock:
+            self.job_ids[school_id].append(job_id)
+
+    def latest_job(self, school_id: str) -> Optional[str]:
+        """작업 웹소켓은 같은 학교 사용자만 구독 가능"""
+        with self.job_lock:
+            jobs = self.job_ids.get(school_id)
+            return jobs[-1] if jobs else None
+
+class LoadRunner:
+    def __init__(self, client, environment: LoadEnvironment, config: LoadConfig):
+        self.client = client
+        self.environment = environment
+        self.config = config
+        self.stats = RouteStats()
+        self.deadline = 0.0
+
+    def request(self, route: str, user, method: str, url: str, expected=(200,), **kwargs):
+        headers = {"X-Load-User": user.uid, **kwargs.pop("headers", {})}
+        started = time.perf_counter()
+        try:
+            response = self.client.request(method, url, headers=headers, **kwargs)
+            status_code = response.status_code
+        except Exception:
+            response, status_code = None, 599
+        self.stats.record(route, (time.perf_counter() - started) * 1000, status_code, status_code in expected)
+        return response
+
+    def think(self, profile: str, rng: random.Random):
+        pause = rng.expovariate(1 / (THINK_SECONDS[profile] * self.config.think_scale))
+        time.sleep(max(min(pause, self.deadline - time.monotonic()), 0))
+
+    def head_teacher_upload(self, user, rng: random.Random):
+        """부장교사: 성적 파일 업로드 후 작업이 끝날 때까지 상태 조회"""
+        content = self.environment.grade_sheet(user.school_id, rng)
+        response = self.request("POST /grades/upload", user, "POST", "/grades/upload", expected=(202,), files={"file": ("grades.csv", content, "text/csv")})
+        if response is None or response.status_code != 202:
+            return
+        job_id = response.json()["job_id"]
+        self.environment.add_job(user.school_id, job_id)
+        while time.monotonic() < self.deadline:
+            job = self.request("GET /grades/jobs/{job_id}", user, "GET", f"/grades/jobs/{job_id}")
+            if job is None or job.status_code != 200 or job.json()["status"] in ("completed", "failed", "duplicate"):
+                break
+            time.sleep(0.2)
+
+    def homeroom_poll(self, user, rng: random.Random, etags: Dict[str, str]):
+        """담임교사: 도 전체 경쟁 현황 폴링 (ETag 재검증) 후 한 학교 상세 조회"""
+        headers = {"If-None-Match": etags["overview"]} if "overview" in etags else {}
+        response = self.request("GET /competition/overview", user, "GET", "/competition/overview", expected=(200, 304), headers=headers)
+        if response is not None and "etag" in response.headers:
+            etags["overview"] = response.headers["etag"]
+        school_id = rng.choice(self.environment.high_school_ids)
+        self.request("GET /competition/schools/{school_id}", user, "GET", f"/competition/schools/{school_id}", expected=(200, 304))
+
+    def approver(self, user, rng: random.Random):
+        """3학년 부장: 대기 목록 조회 후 한 명 승인"""
+        self.request("GET /approval/pending-users", user, "GET", "/approval/pending-users")
+        target_uid = self.environment.next_approval_target(user.uid)
+        if target_uid is not None:
+            self.request("POST /approval/approve-user", user, "POST", "/approval/approve-user", json={"target_uid": target_uid, "is_approved": True})
+
+    def websocket_subscriber(self, user, rng: random.Random):
+        """최근 업로드 작업의 진행 상황 구독: 첫 메시지까지 시간과 작업 종료까지 받은 메시지"""
+        job_id = self.environment.latest_job(user.school_id)
+        if job_id is None:
+            return
+        started = time.perf_counter()
+        try:
+            with self.client.websocket_connect(f"/grades/jobs/{job_id}/ws?token={user.uid}") as websocket:
+                message = websocket.receive_json()
+                self.stats.record("WS /grades/jobs/{job_id}/ws first message", (time.perf_counter() - started) * 1000, 101, True)
+                while message["status"] not in ("completed", "failed", "duplicate") and time.monotonic() < self.deadline:
+                    message = websocket.receive_json()
+        except Exception:
+            self.stats.record("WS /grades/jobs/{job_id}/ws first message", (time.perf_counter() - started) * 1000, 599, False)
+
+    def _virtual_user(self, profile: str, user, index: int):
+        rng = random.Random(f"{self.config.seed}-{profile}-{index}")
+        action: Callable = getattr(self, profile)
+        state = {}
+        while time.monotonic() < self.deadline:
+            if profile == "homeroom_poll":
+                action(user, rng, state)
+            else:
+                action(user, rng)
+            self.think(profile, rng)
+
+    def run(self) -> float:
+        environment, config = self.environment, self.config
+        plan = (
+            [("head_teacher_upload", user) for user in environment.head_teachers]
+            + [("homeroom_poll", user) for user in environment.homeroom_teachers]
+            + [("approver", user) for user in environment.approvers]
+            + [("websocket_subscriber", environment.head_teachers[index % len(environment.head_teachers)]) for index in range(config.subscribers)]
+        )
+        started = time.monotonic()
+        self.deadline = started + config.duration
+        threads = [threading.Thread(target=self._virtual_user, args=(profile, user, index), daemon=True) for index, (profile, user) in enumerate(plan)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.monotonic() - started
+
+def run_load_test(config: LoadConfig) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        prepare_environment(workdir)
+        from fastapi.testclient import TestClient
+        from src.utils.firestore_tracing import route_summaries
+
+        environment = LoadEnvironment(config)
+        route_summaries.clear()
+        # 하나의 이벤트 루프(포털 스레드)를 모든 가상 사용자가 공유: 실제 서버 프로세스 한 개와 같은 조건
+        with TestClient(environment.app, base_url="http://localhost") as client:
+            runner = LoadRunner(client, environment, config)
+            elapsed = runner.run()
+        environment.app.dependency_overrides.clear()
+
+        return {
+            "scenario": "admission_deadline",
+            "started_at": datetime.utcnow().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "config": vars(config),
+            "elapsed_seconds": round(elapsed, 2),
+            "routes": runner.stats.summary(elapsed),
+            "firestore": route_summaries.report(),
+        }
+
+def print_report(result: dict, baseline: Optional[dict] = None):
+    print(f"{result['scenario']} @ {result['git_commit']}  {result['elapsed_seconds']} s")
+    print(f"  {'route':<44} {'req':>6} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for route, stats in result["routes"].items():
+        print(f"  {route:<44} {stats['requests']:>6} {stats['errors']:>5} {stats['throughput_rps']:>8.1f} {stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f}")
+    if baseline is not None:
+        print(f"vs {baseline.get('git_commit')} ({baseline.get('started_at')})")
+        for row in compare(baseline, result):
+            before, after, change = row["p95_ms"]
+            rps_before, rps_after, rps_change = row["throughput_rps"]
+            print(f"  {row['route']:<44} p95 {before:>8.1f} -> {after:>8.1f} ms ({change:+.1f}%)  rps {rps_before:.1f} -> {rps_after:.1f} ({rps_change:+.1f}%)" if change is not None and rps_change is not None else f"  {row['route']:<44} (no baseline traffic)")
+
+def main():
+    defaults = LoadConfig()
+    parser = argparse.ArgumentParser(description="Admission-deadline load test")
+    for name, value in vars(defaults).items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(value), default=value)
+    parser.add_argument("--output", type=Path, help="result JSON path (default: benchmarks/results/load-<timestamp>.json)")
+    parser.add_argument("--baseline", type=Path, help="earlier result JSON to compare against")
+    args = parser.parse_args()
+
+    config = LoadConfig(**{name: getattr(args, name) for name in vars(defaults)})
+    result = run_load_test(config)
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline else None
+    print_report(result, baseline)
+
+    output = args.output or RESULTS_DIR / f"load-{datetime.utcnow():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"saved {output}")
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,14 @@ from fastapi import FastAPI, Request, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
-from .routes import auth, schools, students, grades, applications, test, permissions, encryption, websocket, dashboard, invitations, approval
+from .routes import auth, schools, students, grades, applications, test, permissions, encryption, websocket, dashboard, invitations, approval, competition, health, metrics, profiles, notifications, archive
 from .config import settings
 from .utils.encryption import security_validator, security_audit_logger
 from .exceptions.exception_handlers import register_exception_handlers
 from .dto.base_dto import APIResponse
+from .utils.metrics import metrics_middleware
+from .utils.profiling import profiling_middleware
+from .utils.firestore_tracing import firestore_tracing_middleware
 import logging
 import time
 
@@ -96,18 +99,33 @@ async def log_requests(request: Request, call_next):
     
     return response
 
+# 지표 수집 미들웨어 (라우트별 지연 시간, 처리 중 요청 수)
+app.middleware("http")(metrics_middleware)
+
+# 요청 프로파일링 (X-Profile-Token 헤더 또는 PROFILE_SAMPLE_RATE, 기본 비활성)
+app.middleware("http")(profiling_middleware)
+
+# Firestore 호출 추적 (요청별 호출 수·시간, N+1 경고, 라우트별 요약)
+app.middleware("http")(firestore_tracing_middleware)
+
 # 전역 예외 핸들러 등록
 register_exception_handlers(app)
 
+app.include_router(health.router)
+app.include_router(metrics.router)
+app.include_router(profiles.router)
+app.include_router(archive.router)
 app.include_router(auth.router)
 app.include_router(invitations.router)
 app.include_router(approval.router)
+app.include_router(notifications.router)
 app.include_router(permissions.router)
 app.include_router(dashboard.router)
 app.include_router(schools.router)
 app.include_router(students.router)
 app.include_router(grades.router)
 app.include_router(applications.router)
+app.include_router(competition.router)
 app.include_router(encryption.router)
 app.include_router(websocket.router)
 app.include_router(test.router)
@@ -121,8 +139,30 @@ async def read_root():
 async def startup_event():
     """애플리케이션 시작 시 백그라운드 태스크 시작"""
     from .services.websocket_service import websocket_background_tasks
+    from .database.session import init_db
+    from .services.warmup_service import warmup_service
+    from .services.notification_service import notification_dispatcher
     import asyncio
     
+    init_db()
+    
+    # 워밍업은 별도 스레드에서 실행 (liveness는 즉시 응답, readiness는 완료 후 200)
+    if settings.WARMUP_ENABLED:
+        asyncio.get_running_loop().run_in_executor(None, warmup_service.run)
+    else:
+        warmup_service.skip()
+    
+    # 알림 아웃박스 발송 스레드 (재시작 전 미발송 항목 복구 포함)
+    notification_dispatcher.start()
+    
     # WebSocket 백그라운드 태스크 시작
     asyncio.create_task(websocket_background_tasks())
     logger.info("WebSocket background tasks started")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """애플리케이션 종료 시 시뮬레이션 작업 프로세스 정리"""
+    from .services.admission_simulation_service import shutdown_process_pool
+    import asyncio
+
+    await asyncio.get_running_loop().run_in_executor(None, shutdown_process_pool)
@@ -2,6 +2,7 @@
 # Environment variable loading and basic configuration
 
 import os
+from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv() # Load environment variables from .env file
@@ -11,5 +12,56 @@ class Settings:
     SECRET_KEY: str = os.getenv("SECRET_KEY", "super-secret-key") # TODO: Generate a strong secret key
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # 성적 파일 백그라운드 처리
+    GRADE_UPLOAD_WORKERS: int = int(os.getenv("GRADE_UPLOAD_WORKERS", "2"))
+    GRADE_JOB_RETENTION_SECONDS: int = int(os.getenv("GRADE_JOB_RETENTION_SECONDS", "3600"))
+    # 합격 시뮬레이션 프로세스 수 (0이면 CPU 코어 수)
+    SIMULATION_WORKERS: int = int(os.getenv("SIMULATION_WORKERS", "0"))
+    # 도 전체 경쟁 현황 캐시 유지 시간 (초)
+    COMPETITION_OVERVIEW_TTL_SECONDS: float = float(os.getenv("COMPETITION_OVERVIEW_TTL_SECONDS", "5"))
+    # 직렬화해 둘 학교 상세(지원자 순위) 응답 본문 개수 (최근 조회 순, 나머지는 요청 시 직렬화)
+    SNAPSHOT_DETAIL_CACHE_SIZE: int = int(os.getenv("SNAPSHOT_DETAIL_CACHE_SIZE", "16"))
+    # 콜드 스타트 예산: 앱 모듈 import 누적 시간 상한 (ms, src.utils.import_profile로 측정)
+    COLD_START_BUDGET_MS: float = float(os.getenv("COLD_START_BUDGET_MS", "2000"))
+    # 시작 시 워밍업 (캐시·연결 풀 예열)
+    WARMUP_ENABLED: bool = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+    WARMUP_DB_CONNECTIONS: int = int(os.getenv("WARMUP_DB_CONNECTIONS", "5"))
+    # /metrics 접근 토큰 (비어 있으면 인증 없이 노출, 내부망 전용)
+    METRICS_TOKEN: str = os.getenv("METRICS_TOKEN", "")
+    # 요청 프로파일링: 관리자 헤더(X-Profile-Token) 또는 표본 비율, 샘플 간격(ms), 보관 개수
+    PROFILING_TOKEN: str = os.getenv("PROFILING_TOKEN", "")
+    PROFILE_SAMPLE_RATE: float = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+    PROFILE_INTERVAL_MS: float = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+    PROFILE_RETENTION: int = int(os.getenv("PROFILE_RETENTION", "50"))
+    # Firestore 호출 추적: 같은 형태 읽기 반복 기준(N+1), 라우트별 호출 상한 강제 (테스트용)
+    FIRESTORE_N_PLUS_ONE_THRESHOLD: int = int(os.getenv("FIRESTORE_N_PLUS_ONE_THRESHOLD", "5"))
+    FIRESTORE_RPC_BUDGET_STRICT: bool = os.getenv("FIRESTORE_RPC_BUDGET_STRICT", "false").lower() == "true"
+    # async 라우트의 Firestore/Firebase 호출을 실행하는 전용 스레드 수 (동시 호출 상한)
+    FIRESTORE_THREADS: int = int(os.getenv("FIRESTORE_THREADS", "16"))
+    # 현재 학년도 고정값 (비우면 요청 시점의 날짜로 계산: models.current_academic_year)
+    CURRENT_ACADEMIC_YEAR: Optional[int] = int(os.getenv("CURRENT_ACADEMIC_YEAR")) if os.getenv("CURRENT_ACADEMIC_YEAR") else None
+    # 새 학년도가 시작되는 달 (한국: 3월)
+    ACADEMIC_YEAR_START_MONTH: int = int(os.getenv("ACADEMIC_YEAR_START_MONTH", "3"))
+    # 지난 학년도 데이터 보관 위치 (연도별 gzip JSONL)
+    ARCHIVE_DIR: str = os.getenv("ARCHIVE_DIR", "./archives")
+    # 합격 가능성 추정에 쓰는 최근 지난 학년도 수
+    CUTOFF_INDEX_YEARS: int = int(os.getenv("CUTOFF_INDEX_YEARS", "3"))
+    # 아직 보관되지 않은(DB에 있는) 지난 학년도가 섞인 합격선 색인을 다시 만드는 주기(초)
+    CUTOFF_INDEX_TTL_SECONDS: float = float(os.getenv("CUTOFF_INDEX_TTL_SECONDS", "600"))
+    # 알림 발송: 채널, 모으는 시간(초), 수신자별 다이제스트 기준 건수, 재시도 횟수·기본 대기(초), 중복 제거 기간(초)
+    NOTIFICATION_CHANNELS: list = [channel.strip() for channel in os.getenv("NOTIFICATION_CHANNELS", "in_app,websocket").split(",") if channel.strip()]
+    NOTIFICATION_BATCH_WINDOW_SECONDS: float = float(os.getenv("NOTIFICATION_BATCH_WINDOW_SECONDS", "2"))
+    NOTIFICATION_DIGEST_THRESHOLD: int = int(os.getenv("NOTIFICATION_DIGEST_THRESHOLD", "3"))
+    NOTIFICATION_MAX_ATTEMPTS: int = int(os.getenv("NOTIFICATION_MAX_ATTEMPTS", "5"))
+    NOTIFICATION_RETRY_BASE_SECONDS: float = float(os.getenv("NOTIFICATION_RETRY_BASE_SECONDS", "2"))
+    NOTIFICATION_DEDUPE_SECONDS: float = float(os.getenv("NOTIFICATION_DEDUPE_SECONDS", "600"))
+    # 아웃박스 항목 점유 기간(초): 이 시간 안에 갱신되지 않으면 다른 프로세스가 가져가 발송 (최대 재시도 대기보다 길게)
+    NOTIFICATION_LEASE_SECONDS: float = float(os.getenv("NOTIFICATION_LEASE_SECONDS", "900"))
+    # 이메일 알림 SMTP 서버 (개발: 로컬 대역 서버, 예: MailHog 1025)
+    SMTP_HOST: str = os.getenv("SMTP_HOST", "localhost")
+    SMTP_PORT: int = int(os.getenv("SMTP_PORT", "1025"))
+    SMTP_SENDER: str = os.getenv("SMTP_SENDER", "noreply@jeju-admission.local")
+    # 저장된 문서로 스키마를 만들 때 전체 검증 (개발·테스트에서 스키마와 데이터 불일치 조기 발견)
+    SCHEMA_SHAPE_CHECK: bool = os.getenv("SCHEMA_SHAPE_CHECK", "false").lower() == "true"
 
 settings = Settings()
@@ -0,0 +1,54 @@
+# backend/src/database/hydration.py
+# Trusted construction of schemas from documents written by our own services
+
+import enum
+import typing
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Type, TypeVar
+from pydantic import BaseModel
+from ..config import settings
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+def _enum_type(annotation):
+    """UserRole, Optional[UserRole] 등에서 Enum 타입 추출"""
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return annotation
+    for argument in typing.get_args(annotation):
+        if isinstance(argument, type) and issubclass(argument, enum.Enum):
+            return argument
+    return None
+
+@lru_cache(maxsize=None)
+def _plan(model: Type[BaseModel]) -> Tuple[frozenset, Tuple[Tuple[str, type], ...]]:
+    """모델별 필수 필드 이름과 Enum 필드 (한 번만 계산)"""
+    required = frozenset(name for name, field in model.model_fields.items() if field.is_required())
+    enums = tuple(
+        (name, enum_type)
+        for name, field in model.model_fields.items()
+        if (enum_type := _enum_type(field.annotation)) is not None
+    )
+    return required, enums
+
+def hydrate(model: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """
+    Build `model` from a stored document without running field validators.
+
+    Only for data our own services wrote (Firestore user documents): the expensive
+    checks, EmailStr in particular, already ran when the document was created.
+    Enum fields are still converted so comparisons and serialization behave as with
+    a validated instance, and a document missing a required field falls back to full
+    validation, which raises the usual ValidationError.
+
+    With SCHEMA_SHAPE_CHECK on (development/tests), every document is fully validated
+    so drift between stored data and the schema fails loudly.
+    """
+    required, enums = _plan(model)
+    if settings.SCHEMA_SHAPE_CHECK or not required.issubset(data.keys()):
+        return model.model_validate(data)
+    values = dict(data)
+    for name, enum_type in enums:
+        value = values.get(name)
+        if value is not None and not isinstance(value, enum_type):
+            values[name] = enum_type(value)
+    return model.model_construct(**values)
@@ -1,13 +1,30 @@
 # backend/src/database/models.py
 # Database model definitions (e.g., SQLAlchemy, Pydantic models)
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Enum, Float, Text, DateTime, Index, UniqueConstraint, event, select
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 import enum
+from ..config import settings
 
 Base = declarative_base()
 
+# 학년도는 한국 시간 기준으로 바뀜
+KST = timezone(timedelta(hours=9))
+
+def current_academic_year(now: Optional[datetime] = None) -> int:
+    """
+    진행 중인 학년도 (새로 저장하는 학생의 학년도이자 현재 데이터 조회 범위).
+    CURRENT_ACADEMIC_YEAR를 지정하면 그 값, 아니면 호출 시점으로 계산:
+    ACADEMIC_YEAR_START_MONTH(3월) 이전의 1·2월은 전년도 학년도.
+    """
+    if settings.CURRENT_ACADEMIC_YEAR is not None:
+        return settings.CURRENT_ACADEMIC_YEAR
+    now = now or datetime.now(KST)
+    return now.year if now.month >= settings.ACADEMIC_YEAR_START_MONTH else now.year - 1
+
 class UserRole(str, enum.Enum):
     ADMIN = "admin"
     HEAD_TEACHER = "head_teacher" # 부장선생님
@@ -29,9 +46,22 @@ class User(Base):
 class Student(Base):
     __tablename__ = "students"
     id = Column(Integer, primary_key=True, index=True)
+    academic_year = Column(Integer, nullable=False, default=current_academic_year) # 학년도 (연도별 파티션 키)
     name = Column(String, index=True)
-    student_id_number = Column(String, unique=True, index=True) # 학번
+    student_id_number = Column(String, index=True) # 학번 (학년도 안에서 고유)
     homeroom_teacher_id = Column(Integer, ForeignKey("users.id"), nullable=True) # 담임선생님 ID
+    school_id = Column(String, index=True, nullable=True) # 소속 중학교 ID
+    grade = Column(Integer, nullable=True) # A열: 학년
+    class_number = Column(Integer, nullable=True) # B열: 반
+    number = Column(Integer, nullable=True) # C열: 번호
+    gender = Column(String, nullable=True) # E열: 성별
+    row_hash = Column(String(64), nullable=True) # 성적 파일 행 해시 (변경 감지용)
+
+    __table_args__ = (
+        UniqueConstraint("academic_year", "school_id", "grade", "class_number", "number", name="uq_student_school_class_number"),
+        UniqueConstraint("academic_year", "student_id_number", name="uq_student_year_id_number"),
+        Index("ix_students_year_school", "academic_year", "school_id"),
+    )
     
     homeroom_teacher = relationship("User", back_populates="students")
     grades = relationship("Grade", back_populates="student")
@@ -42,24 +72,109 @@ class School(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, index=True)
     address = Column(String, nullable=True)
+    total_quota = Column(Integer, default=0) # 전체 정원
+    priority_within_quota = Column(Integer, default=0) # 정원내 우선선발 인원
+    priority_outside_quota = Column(Integer, default=0) # 정원외 우선선발 인원
+    actual_competition_quota = Column(Integer, default=0) # 실제 경쟁 정원 (계산됨)
+    gender_type = Column(String, default="COED") # COED | BOYS | GIRLS
+    is_levelized = Column(Boolean, default=False) # 평준화 일반고 여부
+    created_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
     # Add other school-related fields as needed
 
+class SchoolApplicationCounter(Base):
+    __tablename__ = "school_application_counters"
+    # 학년도·학교별 지원자 수 (지원서 변경과 같은 트랜잭션에서 그 지원서의 학년도 행을 갱신)
+    academic_year = Column(Integer, primary_key=True)
+    school_id = Column(Integer, ForeignKey("schools.id"), primary_key=True)
+    total_applicants = Column(Integer, default=0, nullable=False)
+    general_applicants = Column(Integer, default=0, nullable=False)
+    priority_within_applicants = Column(Integer, default=0, nullable=False)
+    priority_outside_applicants = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, nullable=True)
+
 class Grade(Base):
     __tablename__ = "grades"
     id = Column(Integer, primary_key=True, index=True)
+    academic_year = Column(Integer, nullable=False, index=True) # 학년도 (저장 시 학생의 학년도를 복사)
     student_id = Column(Integer, ForeignKey("students.id"))
     subject = Column(String)
-    score = Column(Integer)
+    score = Column(Integer, nullable=True)
+    percentile_rank = Column(Float, nullable=True) # O열: 내신석차백분율
+    upload_id = Column(Integer, ForeignKey("grade_uploads.id"), nullable=True, index=True) # 성적 파일 업로드 ID
     # Add other grade-related fields (e.g., semester, year)
 
     student = relationship("Student", back_populates="grades")
+    upload = relationship("GradeUpload", back_populates="grades")
+
+class GradeUpload(Base):
+    """성적 파일 업로드 이력 (내용 해시 기반 중복 방지 및 재개)"""
+    __tablename__ = "grade_uploads"
+    id = Column(Integer, primary_key=True, index=True)
+    content_hash = Column(String(64), index=True) # 파일 내용 SHA-256 (학교 안에서 고유)
+    filename = Column(String)
+    school_id = Column(String, index=True, nullable=True) # 업로드한 부장교사의 학교 ID
+    uploaded_by = Column(String, nullable=True) # 업로드한 사용자 ID
+    status = Column(String, default="processing") # UploadStatus: processing | completed | failed
+    mode = Column(String, nullable=True) # UploadMode: 마지막으로 처리한 방식
+    total_rows = Column(Integer, default=0)
+    processed_rows = Column(Integer, default=0) # 마지막으로 커밋된 청크까지 처리된 행 수
+    result = Column(Text, nullable=True) # 완료 시 응답 JSON
+    error = Column(Text, nullable=True)
+    data_fingerprint = Column(String(64), nullable=True) # 처리 완료 시점의 학교 학생 데이터 해시 (이후 변경 감지용)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+
+    grades = relationship("Grade", back_populates="upload")
+
+    __table_args__ = (
+        UniqueConstraint("school_id", "content_hash", name="uq_grade_upload_school_hash"),
+    )
 
 class StudentApplication(Base):
     __tablename__ = "student_applications"
     id = Column(Integer, primary_key=True, index=True)
+    academic_year = Column(Integer, nullable=False) # 학년도 (저장 시 학생의 학년도를 복사)
     student_id = Column(Integer, ForeignKey("students.id"))
-    school_id = Column(Integer, ForeignKey("schools.id"), nullable=True) # 지원 고등학교 ID
+    school_id = Column(Integer, ForeignKey("schools.id"), nullable=True, index=True) # 지원 고등학교 ID
+    department_name = Column(String, nullable=True) # 지원 학과명
     is_accepted = Column(Boolean, default=False) # 합격 여부
+    is_priority_selection = Column(Boolean, default=False) # 우선선발 여부
+    priority_type = Column(String, nullable=True) # WITHIN_QUOTA | OUTSIDE_QUOTA
+    priority_category = Column(String, nullable=True) # 체육특기자, 농어촌 등
+    rank_in_school = Column(Integer, nullable=True) # 지원 학교 내 순위
+    percentile_rank = Column(Float, nullable=True) # 순위 산정에 사용한 내신석차백분율
+    created_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_applications_year_school", "academic_year", "school_id"),
+    )
 
     student = relationship("Student", back_populates="applications")
     school = relationship("School")
+
+@event.listens_for(Student, "before_insert")
+def _default_student_year(mapper, connection, target):
+    # 컬럼 기본값과 같지만 같은 flush의 성적·지원서가 읽을 수 있도록 객체에 미리 채움
+    if target.academic_year is None:
+        target.academic_year = current_academic_year()
+
+@event.listens_for(Grade, "before_insert")
+@event.listens_for(StudentApplication, "before_insert")
+def _copy_student_year(mapper, connection, target):
+    """
+    Grades and applications belong to their student's academic year, not the year
+    on the clock when they are saved (a late grade correction in January stays in
+    the year it corrects).
+    """
+    if target.academic_year is not None:
+        return
+    student = target.__dict__.get("student")
+    if student is not None:
+        target.academic_year = student.academic_year
+    elif target.student_id is not None:
+        target.academic_year = connection.execute(select(Student.academic_year).where(Student.id == target.student_id)).scalar()
+    if target.academic_year is None:
+        # 학생이 없는 행
+        target.academic_year = current_academic_year()
@@ -1,8 +1,8 @@
 # backend/src/database/schemas.py
 # Data validation and serialization/deserialization schemas (Pydantic models)
 
-from pydantic import BaseModel, EmailStr, validator, model_validator
-from typing import Optional, List
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
+from typing import Any, Optional, List, Dict
 from .models import UserRole
 from ..utils.constants import UserRoleGroups
 
@@ -23,7 +23,8 @@ class UserCreate(UserBase):
     school_name: Optional[str] = None  # 회원가입 시 학교명으로 선택
     is_homeroom_teacher: Optional[bool] = None  # 3학년 부장이 담임도 겸하는지 여부
     
-    @validator('role')
+    @field_validator('role')
+    @classmethod
     def validate_selectable_role(cls, v):
         """가입 시 선택 가능한 역할인지 검증"""
         if v not in UserRoleGroups.SELECTABLE_ROLES:
@@ -128,16 +129,41 @@ class ApprovalNotification(BaseModel):
     """승인 알림 스키마"""
     id: str
     user_uid: str
-    user_email: str
-    type: str  # "approval_status"
-    is_approved: bool
+    user_email: Optional[str] = None
+    type: str  # "approval_status" | "digest"
+    title: Optional[str] = None
+    is_approved: Optional[bool] = None  # approval_status 알림만
     message: str
     created_at: str
     is_read: bool = False
+    items: Optional[List[Dict[str, Any]]] = None  # 다이제스트에 묶인 개별 알림
     
     class Config:
         from_attributes = True
 
+class NotificationPage(BaseModel):
+    """알림 목록 한 페이지 (최신순)"""
+    items: List[ApprovalNotification]
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달, 마지막 페이지면 None
+
+class UnreadNotificationCount(BaseModel):
+    unread: int
+
+class UnreadCounterReconciliation(BaseModel):
+    """읽지 않은 알림 수 카운터 검증 결과"""
+    uid: str
+    stored: int
+    actual: int
+    repaired: bool
+
+class NotificationReadRequest(BaseModel):
+    """읽음 처리: ids 지정 또는 all=true로 전체"""
+    ids: List[str] = Field(default_factory=list, max_length=500)
+    all: bool = False
+
+class NotificationReadResult(BaseModel):
+    updated: int
+
 # --- Invitation Link Schemas ---
 
 class InvitationLinkBase(BaseModel):
@@ -186,8 +212,8 @@ class UserCreateWithInvitation(UserCreate):
         if self.invitation_code:
             self.school_name = None
         
-        # 부모 클래스의 역할별 검증도 수행
-        return super().validate_role_based_fields()
+        # 역할별 검증은 상속된 validate_role_based_fields가 이미 수행 (다시 호출하면 두 번 실행됨)
+        return self
 
 # --- Other Schemas ---
 
@@ -280,7 +306,7 @@ class SchoolQuotaUpdate(BaseModel):
 
 class GradeBase(BaseModel):
     subject: str
-    score: int
+    score: Optional[int] = None  # 내신석차백분율 행은 점수 없음
 
 class GradeCreate(GradeBase):
     student_id: str # Firestore document ID of the student
@@ -288,9 +314,59 @@ class GradeCreate(GradeBase):
 class Grade(GradeBase):
     id: str # Firestore document ID
     student_id: str
+    percentile_rank: Optional[float] = None
     class Config:
         from_attributes = True
 
+class GradeCellError(BaseModel):
+    """성적 파일 셀 단위 검증 오류"""
+    row: int  # 시트 행 번호 (머리글 포함, 1부터)
+    column: str  # 열 문자 (A–E, O)
+    field: str
+    value: Optional[str] = None
+    message: str
+
+class GradeValidationReport(BaseModel):
+    """성적 파일 전체 검증 결과"""
+    total_rows: int
+    valid_rows: int
+    error_count: int
+    errors: List[GradeCellError] = []
+
+class GradeChangeSummary(BaseModel):
+    """변경분 반영(diff) 업로드 결과 요약"""
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    affected_school_ids: List[int] = []  # 순위를 다시 계산한 지원 고등학교 ID
+    held_student_ids: List[str] = []  # 지원서가 있어 삭제하지 않은 학생 (confirm_deletes=true로 다시 올리면 삭제)
+
+class GradeUploadResult(BaseModel):
+    """성적 파일 업로드 처리 결과"""
+    upload_id: int
+    content_hash: str  # 파일 내용 SHA-256
+    filename: str
+    status: str  # processing | completed | failed
+    total_rows: int
+    processed_rows: int
+    is_duplicate: bool = False  # 이미 처리된 동일 파일 재업로드 여부
+    changes: Optional[GradeChangeSummary] = None  # diff 모드에서만 채워짐
+    message: str
+
+class GradeUploadJob(BaseModel):
+    """성적 파일 백그라운드 처리 작업 상태"""
+    job_id: str
+    status: str  # queued | running | completed | failed | duplicate
+    filename: str
+    rows_processed: int = 0
+    total_rows: int = 0
+    errors: List[str] = []
+    eta_seconds: Optional[float] = None  # 예상 남은 시간 (초)
+    validation_report: Optional[GradeValidationReport] = None  # 검증 실패 시 셀별 오류
+    result: Optional[GradeUploadResult] = None
+    created_at: str
+
 class StudentApplicationBase(BaseModel):
     student_id: str # Firestore document ID of the student
     school_id: Optional[str] = None # Firestore document ID of the school
@@ -376,6 +452,20 @@ class CompetitionStatus(BaseModel):
     actual_competition_quota: int
     statistics: CompetitionStatistics
 
+class CounterMismatch(BaseModel):
+    """지원자 수 카운터와 실제 집계가 다른 항목"""
+    school_id: str
+    field: str
+    stored: int
+    actual: int
+
+class CounterReconciliationReport(BaseModel):
+    """지원자 수 카운터 검증 결과"""
+    academic_year: int
+    checked_schools: int
+    mismatches: List[CounterMismatch]
+    repaired: bool
+
 class CompetitionStatusDetail(BaseModel):
     """특정 학교의 상세 지원 현황"""
     school: School
@@ -383,3 +473,89 @@ class CompetitionStatusDetail(BaseModel):
     rankings: List[StudentRanking]
     last_updated: str
 
+
+# 합격 시뮬레이션 관련 스키마
+class AdmissionSimulationRequest(BaseModel):
+    """합격 시뮬레이션 시나리오"""
+    runs: int = Field(1000, ge=0, le=100000)  # 몬테카를로 반복 횟수 (0이면 결정적 배정만)
+    percentile_noise: float = Field(1.0, ge=0)  # 최종 내신 백분율 변동 폭 (표준편차)
+    quota_overrides: Dict[int, SchoolQuotaUpdate] = {}  # 학교 ID별 정원 가정 (숫자가 아닌 키는 422)
+    seed: Optional[int] = None
+
+class ApplicantAdmissionEstimate(BaseModel):
+    """지원자별 시뮬레이션 결과"""
+    application_id: str
+    student_id: str
+    school_id: str
+    admitted: bool  # 현재 백분율 기준 배정 결과
+    admission_probability: float  # 합격 가능성 (%)
+
+class SchoolSimulationSummary(BaseModel):
+    """학교별 시뮬레이션 결과"""
+    school_id: str
+    applicants: int
+    admitted: int
+    cutoff_percentile: Optional[float] = None  # 일반전형으로 합격한 학생(우선선발 탈락 후 일반전형 합격 포함)의 최저 백분율
+
+class AdmissionSimulationResult(BaseModel):
+    """합격 시뮬레이션 결과"""
+    runs: int
+    applicants: List[ApplicantAdmissionEstimate]
+    schools: List[SchoolSimulationSummary]
+
+# 학년도 보관(아카이브) 관련 스키마
+class ArchivedYear(BaseModel):
+    """보관된 학년도"""
+    academic_year: int
+    row_counts: Dict[str, int]  # 테이블별 보관 행 수
+    archived_at: str
+
+class RolloverReport(BaseModel):
+    """학년도 보관 결과"""
+    academic_year: int
+    row_counts: Dict[str, int]
+    archive_path: str
+    already_archived: bool = False  # 이미 보관되어 옮길 데이터가 없었음
+
+class HistoricalSchoolApplicants(BaseModel):
+    """지난 학년도 학교별 지원자 순위"""
+    academic_year: int
+    school_id: str
+    source: str  # "database" | "archive"
+    applicants: List[StudentRanking]
+
+# 과거 합격선 기반 합격 가능성 추정 스키마
+class SchoolYearCutoff(BaseModel):
+    """지난 학년도 학교별 합격선"""
+    academic_year: int
+    applicants: int
+    accepted: int
+    cutoff_percentile: Optional[float] = None  # 합격자 최저 백분율 (합격자가 없으면 None)
+    median_accepted_percentile: Optional[float] = None  # 합격자 백분율 중앙값
+
+class AdmissionEstimateRequest(BaseModel):
+    """백분율 목록의 합격 가능성 추정 요청"""
+    school_id: int
+    percentiles: List[float] = Field(..., min_length=1, max_length=2000)
+
+class AdmissionEstimate(BaseModel):
+    """백분율별 추정 결과"""
+    percentile_rank: float
+    student_rank: Optional[int] = None  # 현재 지원자 수 기준 예상 석차 (과거 자료가 없으면 None)
+    admission_probability: Optional[float] = None  # 합격 가능성 (%): 최근 지난 학년도 중 합격선 안에 든 해의 비율
+
+class AdmissionEstimateResult(BaseModel):
+    """합격 가능성 추정 결과"""
+    school_id: str
+    years: List[int]  # 추정에 사용한 학년도
+    estimates: List[AdmissionEstimate]
+
+class ClassAdmissionEstimate(BaseModel):
+    """학급 학생별 합격 가능성"""
+    student_id: str
+    student_name: str
+    number: int
+    school_id: str  # 지원 고등학교 ID
+    percentile_rank: float
+    student_rank: Optional[int] = None  # 올해 지원자 중 현재 순위
+    admission_probability: Optional[float] = None  # 합격 가능성 (%)
@@ -0,0 +1,28 @@
+# backend/src/database/session.py
+# SQLAlchemy engine and session management
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from ..config import settings
+from ..utils.metrics import registry
+from .models import Base
+
+_connect_args = {"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
+
+engine = create_engine(settings.DATABASE_URL, connect_args=_connect_args)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# 연결 풀 사용량 (풀 종류에 따라 지원하지 않으면 수집에서 제외)
+registry.gauge("db_pool_checked_out", "Database connections currently checked out", callback=lambda: engine.pool.checkedout())
+registry.gauge("db_pool_size", "Database connection pool size", callback=lambda: engine.pool.size())
+
+def init_db():
+    """Create any missing tables."""
+    Base.metadata.create_all(bind=engine)
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -6,6 +6,8 @@ from typing import List, Dict, Any, Optional
 from ..services.approval_service import approval_service
 from ..services.auth_service import auth_service
 from ..database import schemas
+from ..utils import fast_json
+from ..utils.blocking import run_blocking
 from ..utils.auth_decorators import has_role
 from ..utils.constants import UserRole, UserRoleGroups
 
@@ -35,7 +37,7 @@ async def get_pending_users_for_approval(
             detail="승인 권한이 없습니다."
         )
     
-    return approval_service.get_pending_users_for_approver(current_user)
+    return fast_json.list_response(schemas.UserInDB, await approval_service.get_pending_users_for_approver_async(current_user))
 
 @router.post("/approve-user", response_model=Dict[str, Any])
 async def approve_user_hierarchical(
@@ -57,7 +59,7 @@ async def approve_user_hierarchical(
             detail="승인 권한이 없습니다."
         )
     
-    return approval_service.approve_user_hierarchical(
+    return await approval_service.approve_user_hierarchical_async(
         approver=current_user,
         target_uid=approval_request.target_uid,
         is_approved=approval_request.is_approved,
@@ -72,7 +74,7 @@ async def get_approval_history(
     Get approval history for the current user.
     Shows all approval/rejection actions performed by the user.
     """
-    return approval_service.get_approval_history(current_user)
+    return fast_json.json_response(await approval_service.get_approval_history_async(current_user))
 
 @router.get("/statistics", response_model=Dict[str, Any])
 async def get_approval_statistics(
@@ -87,7 +89,7 @@ async def get_approval_statistics(
     - rejected_count: Number of users rejected by this user
     - total_processed: Total number of approval actions
     """
-    return approval_service.get_approval_statistics(current_user)
+    return await approval_service.get_approval_statistics_async(current_user)
 
 @router.get("/my-approval-status", response_model=Dict[str, Any])
 async def get_my_approval_status(
@@ -150,7 +152,7 @@ async def get_pending_users_legacy(
     Maintained for backward compatibility.
     """
     from ..services.auth_service import auth_service as legacy_auth_service
-    return legacy_auth_service.get_pending_users()
+    return await run_blocking(legacy_auth_service.get_pending_users)
 
 @router.post("/approve-user-legacy", response_model=dict)
 async def approve_user_legacy(
@@ -163,7 +165,8 @@ async def approve_user_legacy(
     """
     from ..services.auth_service import auth_service as legacy_auth_service
     
-    result = legacy_auth_service.approve_user(
+    result = await run_blocking(
+        legacy_auth_service.approve_user,
         approval_data.uid, 
         approval_data.is_approved, 
         approval_data.role.value if approval_data.role else None
@@ -0,0 +1,28 @@
+# backend/src/routes/archive.py
+# Academic-year rollover and archive listing (admin only)
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from ..database import schemas
+from ..database.session import get_db
+from ..services import archive_service
+from ..utils.auth_decorators import has_role
+from ..utils.constants import UserRole
+
+router = APIRouter(prefix="/admin/archive", tags=["Archive"], dependencies=[Depends(has_role([UserRole.ADMIN]))])
+
+@router.get("/", response_model=list[schemas.ArchivedYear])
+async def list_archived_years():
+    """보관된 학년도 목록 (테이블별 행 수, 보관 시각)"""
+    return archive_service.list_archived_years()
+
+@router.post("/{academic_year}/rollover", response_model=schemas.RolloverReport)
+def rollover_academic_year(academic_year: int, db: Session = Depends(get_db)):
+    """
+    Move a finished academic year's students, applications and grades into the
+    compressed archive and delete them from the live tables. Safe to re-run.
+    """
+    try:
+        return archive_service.rollover(db, academic_year)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
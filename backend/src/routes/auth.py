@@ -6,6 +6,8 @@ from typing import List
 from datetime import datetime
 from ..services import auth_service
 from ..database import schemas
+from ..utils import fast_json
+from ..utils.blocking import run_blocking
 from ..utils.auth_decorators import has_role
 from ..utils.constants import UserRole
 
@@ -141,7 +143,7 @@ async def get_pending_users(current_user: schemas.UserInDB = Depends(has_role([U
     Note: This is a legacy endpoint. New implementations should use /approval/pending-users
     which supports hierarchical approval.
     """
-    return auth_service.get_pending_users()
+    return fast_json.list_response(schemas.UserInDB, await run_blocking(auth_service.get_pending_users))
 
 @router.post("/approve-user", response_model=dict)
 async def approve_user(
@@ -154,7 +156,7 @@ async def approve_user(
     Note: This is a legacy endpoint. New implementations should use /approval/approve-user
     which supports hierarchical approval with school validation.
     """
-    result = auth_service.approve_user(approval_data.uid, approval_data.is_approved, approval_data.role.value if approval_data.role else None)
+    result = await run_blocking(auth_service.approve_user, approval_data.uid, approval_data.is_approved, approval_data.role.value if approval_data.role else None)
     
     if result:
         status_text = "승인" if approval_data.is_approved else "거부"
@@ -176,7 +178,7 @@ async def get_schools_for_signup():
     """
     from ..services.school_service import school_service
     
-    schools = school_service.get_schools()
+    schools = await run_blocking(school_service.get_schools)
     return [
         {
             "id": school.id,
@@ -198,7 +200,7 @@ async def check_email_availability(email_data: dict):
             detail="이메일이 필요합니다."
         )
     
-    existing_user = auth_service.get_user_by_email_from_firestore(email)
+    existing_user = await run_blocking(auth_service.get_user_by_email_from_firestore, email)
     
     return {
         "email": email,
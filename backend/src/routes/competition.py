@@ -0,0 +1,116 @@
+# backend/src/routes/competition.py
+# School competition status (dashboard) API routes
+
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.orm import Session
+from ..database import schemas
+from ..database.session import get_db
+from ..services import application_counter_service, archive_service, competition_service
+from ..services.application_snapshot_service import application_snapshots
+from ..utils.auth_decorators import has_role
+from ..utils.constants import UserRole
+
+router = APIRouter(prefix="/competition", tags=["Competition"])
+
+DASHBOARD_ROLES = [UserRole.ADMIN, UserRole.HEAD_TEACHER, UserRole.HOMEROOM_TEACHER]
+
+def _snapshot_response(request: Request, etag: str, body: bytes) -> Response:
+    """If-None-Match가 현재 버전과 같으면 본문 없이 304 반환"""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@router.get("/overview", response_model=list[schemas.CompetitionStatus], dependencies=[Depends(has_role(DASHBOARD_ROLES))])
+def get_competition_overview(request: Request, db: Session = Depends(get_db)):
+    """
+    Competition summary for every school in one response, built from a single query
+    and cached briefly. Supports If-None-Match like the per-school endpoints.
+    """
+    etag, body = competition_service.get_overview(db)
+    return _snapshot_response(request, etag, body)
+
+@router.get("/schools/{school_id}", response_model=schemas.CompetitionStatus, dependencies=[Depends(has_role(DASHBOARD_ROLES))])
+async def get_competition_status(school_id: int, request: Request):
+    """
+    Competition summary for one school, served from its in-memory snapshot.
+    Supports conditional requests: send the last ETag as If-None-Match to get 304.
+    """
+    snapshot = await application_snapshots.get_async(school_id)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="School not found")
+    return _snapshot_response(request, snapshot.etag, snapshot.status_json)
+
+@router.get("/schools/{school_id}/detail", response_model=schemas.CompetitionStatusDetail, dependencies=[Depends(has_role(DASHBOARD_ROLES))])
+async def get_competition_status_detail(school_id: int, request: Request):
+    """
+    Detailed competition status (statistics and applicant rankings) for one school.
+    """
+    snapshot = await application_snapshots.get_async(school_id)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="School not found")
+    if request.headers.get("if-none-match") == snapshot.etag:
+        # 변경 없음: 상세 본문을 직렬화하지 않고 304
+        return _snapshot_response(request, snapshot.etag, b"")
+    return _snapshot_response(request, snapshot.etag, await application_snapshots.detail_json_async(snapshot))
+
+@router.get("/history/{academic_year}/schools/{school_id}", response_model=schemas.HistoricalSchoolApplicants, dependencies=[Depends(has_role(DASHBOARD_ROLES))])
+def get_historical_applicants(academic_year: int, school_id: int, db: Session = Depends(get_db)):
+    """
+    Final applicant ranking of one school in a past academic year, read from the
+    live tables or from the archive once the year has been rolled over.
+    """
+    return archive_service.historical_applicants(db, academic_year, school_id)
+
+@router.get("/schools/{school_id}/cutoffs", response_model=list[schemas.SchoolYearCutoff], dependencies=[Depends(has_role(DASHBOARD_ROLES))])
+def get_school_cutoffs(school_id: int, db: Session = Depends(get_db)):
+    """
+    Past admission cutoffs of one school (recent academic years), from the
+    precomputed cutoff index.
+    """
+    # NumPy는 첫 추정 요청 시 로드 (콜드 스타트 단축)
+    from ..services.cutoff_index_service import cutoff_index
+    return cutoff_index.school_cutoffs(db, school_id)
+
+@router.post("/admission-estimates", response_model=schemas.AdmissionEstimateResult, dependencies=[Depends(has_role(DASHBOARD_ROLES))])
+def estimate_admission(request: schemas.AdmissionEstimateRequest, db: Session = Depends(get_db)):
+    """
+    Admission probability (share of recent past years whose cutoff the percentile
+    met) and expected rank (from past applicant distributions) for a list of
+    percentiles at one school.
+    """
+    from ..services import cutoff_index_service
+    return cutoff_index_service.estimate_percentiles(db, request)
+
+@router.get("/classes/{grade}/{class_number}/admission-estimates", response_model=list[schemas.ClassAdmissionEstimate])
+def estimate_class_admission(grade: int, class_number: int, db: Session = Depends(get_db), current_user: schemas.UserInDB = Depends(has_role([UserRole.HEAD_TEACHER, UserRole.HOMEROOM_TEACHER]))):
+    """
+    Admission probability of every applying student in one class of the teacher's
+    school. Homeroom teachers can only see their own class.
+    """
+    if current_user.role == UserRole.HOMEROOM_TEACHER and (current_user.grade, current_user.class_number) != (grade, class_number):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to view this class")
+    from ..services import cutoff_index_service
+    return cutoff_index_service.estimate_class(db, current_user.school_id, grade, class_number)
+
+@router.post("/simulate", response_model=schemas.AdmissionSimulationResult, dependencies=[Depends(has_role([UserRole.ADMIN, UserRole.HEAD_TEACHER]))])
+def simulate_admission(scenario: schemas.AdmissionSimulationRequest, db: Session = Depends(get_db)):
+    """
+    Run the provincial allocation (quota fill, priority tracks, BOYS/GIRLS constraints)
+    and Monte Carlo what-if runs for admission probabilities.
+
+    Declared as a sync route so the CPU-bound work runs off the event loop.
+    """
+    # NumPy는 첫 시뮬레이션 요청 시 로드 (콜드 스타트 단축)
+    from ..services import admission_simulation_service
+    return admission_simulation_service.simulate_admission(db, scenario)
+
+@router.post("/counters/reconcile", response_model=schemas.CounterReconciliationReport, dependencies=[Depends(has_role([UserRole.ADMIN]))])
+def reconcile_application_counters(repair: bool = True, academic_year: Optional[int] = None, db: Session = Depends(get_db)):
+    """
+    Recount every school's applications of one academic year (default: the current
+    one) and compare them with the materialized counters (admin only). Mismatches
+    are repaired unless repair=false.
+    """
+    return application_counter_service.reconcile_counters(db, repair=repair, academic_year=academic_year)
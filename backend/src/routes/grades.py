@@ -1,29 +1,81 @@
 # backend/src/routes/grades.py
 # Grade file upload (Head Teacher only)
 
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
+import asyncio
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 from ..database import schemas, models
 from ..services import grade_service
-from ..utils.auth_decorators import get_current_user, has_role
-from ..utils.constants import UserRole
+from ..services.grade_job_service import grade_job_queue
+from ..utils import fast_json, metrics
+from ..utils.auth_decorators import get_current_user, has_role, has_role_ws
+from ..utils.constants import UserRole, UploadMode
 
 router = APIRouter(prefix="/grades", tags=["Grades"])
 
-@router.post("/upload", dependencies=[Depends(has_role([UserRole.HEAD_TEACHER]))])
-async def upload_grades_file(file: UploadFile = File(...), db: Session = Depends(grade_service.get_db)):
+# 웹소켓 진행 상황 확인 주기 (초)
+JOB_PUSH_INTERVAL = 0.5
+
+@router.post("/upload", response_model=schemas.GradeUploadJob, status_code=status.HTTP_202_ACCEPTED)
+async def upload_grades_file(
+    file: UploadFile = File(...),
+    mode: UploadMode = UploadMode.DIFF,
+    confirm_deletes: bool = False,
+    current_user: schemas.UserInDB = Depends(has_role([UserRole.HEAD_TEACHER])),
+):
+    """
+    Accept a grade file and process it in the background.
+
+    Returns 202 with a job id right away; poll GET /grades/jobs/{job_id} or subscribe
+    to /grades/jobs/{job_id}/ws for rows processed, errors and ETA.
+    mode=diff (default) writes only rows that changed since the last upload and removes
+    students missing from the classes in the sheet; mode=full treats the sheet as the
+    complete roster of its 학년. Students with applications are kept (listed in
+    changes.held_student_ids) unless confirm_deletes=true. Resubmitting a file that is
+    still processing returns its job, or 409 if mode or confirm_deletes differ.
+    """
     if not file.filename.endswith(('.csv', '.xlsx')):
         raise HTTPException(status_code=400, detail="Invalid file type. Only CSV and XLSX are allowed.")
     
-    try:
-        # In a real application, you would parse the file and save grades to DB
-        # For now, just a placeholder
-        content = await file.read()
-        # Process content, e.g., parse CSV/XLSX and save to database
-        # grade_service.process_grades_file(db, content, file.filename)
-        return {"message": f"File '{file.filename}' uploaded successfully. Processing grades..."}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to process file: {e}")
+    content = await file.read()
+    job = grade_job_queue.submit(
+        content, file.filename, school_id=current_user.school_id, uploaded_by=current_user.uid,
+        mode=mode, confirm_deletes=confirm_deletes,
+    )
+    return job.to_schema()
+
+@router.get("/jobs/{job_id}", response_model=schemas.GradeUploadJob)
+async def get_grade_upload_job(job_id: str, current_user: schemas.UserInDB = Depends(has_role([UserRole.HEAD_TEACHER]))):
+    job = grade_job_queue.get(job_id)
+    if job is None or job.school_id != current_user.school_id:
+        raise HTTPException(status_code=404, detail="Upload job not found")
+    return job.to_schema()
+
+@router.websocket("/jobs/{job_id}/ws")
+async def grade_upload_job_updates(websocket: WebSocket, job_id: str, current_user: schemas.UserInDB = Depends(has_role_ws([UserRole.HEAD_TEACHER]))):
+    """
+    Push job status whenever it changes, then close once the job finishes.
+    Same access rule as GET /grades/jobs/{job_id}: head teachers of the uploading school.
+    """
+    job = grade_job_queue.get(job_id)
+    if job is None or job.school_id != current_user.school_id:
+        await websocket.close(code=4404)
+        return
+
+    await websocket.accept()
+    sent_version = -1
+    with metrics.WEBSOCKET_SUBSCRIBERS.track_inprogress(channel="grade_jobs"):
+        try:
+            while True:
+                if job.version != sent_version:
+                    sent_version = job.version
+                    await websocket.send_text(job.to_schema().model_dump_json())
+                if job.is_finished:
+                    break
+                await asyncio.sleep(JOB_PUSH_INTERVAL)
+            await websocket.close()
+        except WebSocketDisconnect:
+            pass
 
 @router.get("/students/{student_id}", response_model=list[schemas.Grade], dependencies=[Depends(has_role([UserRole.ADMIN, UserRole.HEAD_TEACHER, UserRole.HOMEROOM_TEACHER, UserRole.STUDENT]))])
 async def get_student_grades(student_id: int, db: Session = Depends(grade_service.get_db), current_user: schemas.UserInDB = Depends(get_current_user)):
@@ -44,4 +96,4 @@ async def get_student_grades(student_id: int, db: Session = Depends(grade_servic
              raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You can only view your own grades.")
 
     grades = grade_service.get_grades_by_student_id(db, student_id=student_id)
-    return grades
+    return fast_json.list_response(schemas.Grade, [grade_service.to_grade_schema(grade) for grade in grades])
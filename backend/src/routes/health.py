@@ -0,0 +1,36 @@
+# backend/src/routes/health.py
+# Liveness and readiness probes
+
+import logging
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from ..database.session import engine
+from ..services.warmup_service import warmup_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+@router.get("/live")
+async def liveness():
+    """프로세스가 살아 있으면 항상 200"""
+    return {"status": "ok"}
+
+@router.get("/ready")
+def readiness():
+    """
+    200 once warm-up has finished without a required step failing and the database
+    answers; 503 otherwise. The body only carries fixed status strings per check and
+    warm-up step (the probe is unauthenticated); error details go to the log.
+    """
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        database = "ok"
+    except Exception:
+        logger.warning("Readiness database check failed", exc_info=True)
+        database = "unavailable"
+    ready = database == "ok" and warmup_service.is_ready
+    body = {"status": "ready" if ready else "not_ready", "database": database, "warmup": warmup_service.status()}
+    return JSONResponse(content=body, status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -0,0 +1,21 @@
+# backend/src/routes/metrics.py
+# Prometheus scrape endpoint
+
+import hmac
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from ..config import settings
+from ..utils.metrics import registry
+
+router = APIRouter(tags=["Metrics"])
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def export_metrics(authorization: str = Header(None)):
+    """
+    Metrics in Prometheus text format. When METRICS_TOKEN is set, the scraper must
+    send it as a bearer token.
+    """
+    # 상수 시간 비교 (응답 시간으로 토큰을 추측하지 못하게 함)
+    if settings.METRICS_TOKEN and not hmac.compare_digest((authorization or "").encode(), f"Bearer {settings.METRICS_TOKEN}".encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,92 @@
+# backend/src/routes/notifications.py
+# API routes for user notifications
+
+import asyncio
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
+from ..services.auth_service import auth_service
+from ..services.notification_service import notification_hub, notification_inbox
+from ..database import schemas
+from ..utils import metrics
+from ..utils.auth_decorators import get_current_user_ws, has_role
+from ..utils.blocking import run_blocking
+from ..utils.constants import UserRole
+
+router = APIRouter(prefix="/notifications", tags=["Notifications"])
+
+@router.get("", response_model=schemas.NotificationPage)
+async def get_notifications(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    current_user: schemas.UserInDB = Depends(auth_service.get_current_user)
+):
+    """
+    The current user's notifications, newest first.
+    Pass the returned next_cursor to get the following page.
+    """
+    return await run_blocking(notification_inbox.get_feed, current_user.uid, limit, cursor)
+
+@router.get("/unread-count", response_model=schemas.UnreadNotificationCount)
+async def get_unread_notification_count(
+    current_user: schemas.UserInDB = Depends(auth_service.get_current_user)
+):
+    """
+    Unread badge count: a single document read, polled on every page load.
+    """
+    return {"unread": await run_blocking(notification_inbox.unread_count, current_user.uid)}
+
+@router.post("/read", response_model=schemas.NotificationReadResult)
+async def mark_notifications_read(
+    request: schemas.NotificationReadRequest,
+    current_user: schemas.UserInDB = Depends(auth_service.get_current_user)
+):
+    """
+    Mark the given notifications (up to 500), or all of them with all=true, as read.
+    """
+    if request.all:
+        updated = await run_blocking(notification_inbox.mark_all_read, current_user.uid)
+    else:
+        updated = await run_blocking(notification_inbox.mark_read, current_user.uid, request.ids)
+    return {"updated": updated}
+
+@router.post("/counters/{uid}/reconcile", response_model=schemas.UnreadCounterReconciliation, dependencies=[Depends(has_role([UserRole.ADMIN]))])
+async def reconcile_unread_counter(uid: str, repair: bool = True):
+    """
+    Recount a user's unread notifications and compare with the badge counter
+    (admin only). A mismatch is repaired unless repair=false.
+    """
+    return await run_blocking(notification_inbox.reconcile_unread, uid, repair)
+
+async def _wait_for_disconnect(websocket: WebSocket):
+    """클라이언트가 보내는 메시지는 무시하고 연결 종료까지 대기"""
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+@router.websocket("/ws")
+async def notification_updates(
+    websocket: WebSocket,
+    current_user: schemas.UserInDB = Depends(get_current_user_ws)
+):
+    """
+    Push the current user's notifications (single or digest) as the dispatcher
+    delivers them. Notifications sent while disconnected stay in the in-app list.
+    Authenticate with the Authorization header or the `token` query parameter.
+    """
+    await websocket.accept()
+    queue = notification_hub.subscribe(current_user.uid)
+    # 알림이 없어도 연결 종료를 바로 알 수 있도록 수신과 함께 대기
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(websocket))
+    with metrics.WEBSOCKET_SUBSCRIBERS.track_inprogress(channel="notifications"):
+        try:
+            while True:
+                next_payload = asyncio.ensure_future(queue.get())
+                await asyncio.wait({next_payload, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+                if disconnected.done():
+                    next_payload.cancel()
+                    break
+                await websocket.send_json(next_payload.result())
+        except WebSocketDisconnect:
+            pass
+        finally:
+            disconnected.cancel()
+            notification_hub.unsubscribe(current_user.uid, queue)
@@ -0,0 +1,37 @@
+# backend/src/routes/profiles.py
+# Download captured request profiles (admin only)
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+from ..utils.auth_decorators import has_role
+from ..utils.constants import UserRole
+from ..utils.firestore_tracing import route_summaries
+from ..utils.profiling import profile_store
+
+router = APIRouter(prefix="/admin/profiles", tags=["Profiling"], dependencies=[Depends(has_role([UserRole.ADMIN]))])
+
+@router.get("/", response_model=list[dict])
+async def list_profiles():
+    """최근 캡처된 요청 프로파일 목록 (최신순)"""
+    return [profile.summary() for profile in profile_store.list()]
+
+@router.get("/firestore", response_model=list[dict])
+async def firestore_route_summary():
+    """
+    Firestore calls per route since startup: average/max round trips per request,
+    time spent, RPC budget, requests flagged as N+1, and the most frequent call shapes.
+    """
+    return route_summaries.report()
+
+@router.get("/{profile_id}", response_class=PlainTextResponse)
+async def download_profile(profile_id: str):
+    """
+    Collapsed-stack profile of one request, ready for flamegraph.pl or speedscope.
+    """
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(
+        profile.collapsed(),
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.folded"'},
+    )
@@ -15,16 +15,28 @@ async def create_school(school: schemas.SchoolCreate, db: Session = Depends(scho
     db_school = school_service.get_school_by_name(db, name=school.name)
     if db_school:
         raise HTTPException(status_code=400, detail="School with this name already exists")
-    return school_service.create_school(db=db, school=school)
+    return school_service.to_school_schema(school_service.create_school(db=db, school=school))
 
 @router.get("/", response_model=list[schemas.School])
 async def read_schools(skip: int = 0, limit: int = 100, db: Session = Depends(school_service.get_db)):
     schools = school_service.get_schools(db, skip=skip, limit=limit)
-    return schools
+    return [school_service.to_school_schema(school) for school in schools]
 
 @router.get("/{school_id}", response_model=schemas.School)
 async def read_school(school_id: int, db: Session = Depends(school_service.get_db)):
     db_school = school_service.get_school(db, school_id=school_id)
     if db_school is None:
         raise HTTPException(status_code=404, detail="School not found")
-    return db_school
+    return school_service.to_school_schema(db_school)
+
+@router.put("/{school_id}/quota", response_model=schemas.School, dependencies=[Depends(has_role([UserRole.ADMIN]))])
+async def update_school_quota(school_id: int, quota_update: schemas.SchoolQuotaUpdate, db: Session = Depends(school_service.get_db)):
+    """
+    Update a school's quotas (admin only). actual_competition_quota is recomputed,
+    and the school's cached dashboard data is invalidated only if a value changed.
+    """
+    db_school = school_service.get_school(db, school_id=school_id)
+    if db_school is None:
+        raise HTTPException(status_code=404, detail="School not found")
+    school_service.update_school_quota(db, db_school, quota_update)
+    return school_service.to_school_schema(db_school)
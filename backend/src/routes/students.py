@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from ..database import schemas, models
 from ..services import student_service
+from ..utils import fast_json
 from ..utils.auth_decorators import get_current_user, has_role
 from ..utils.constants import UserRole
 
@@ -26,7 +27,7 @@ async def read_students(skip: int = 0, limit: int = 100, db: Session = Depends(s
         students = student_service.get_students_by_homeroom_teacher(db, teacher_id=current_user.id, skip=skip, limit=limit)
     else:
         students = student_service.get_students(db, skip=skip, limit=limit)
-    return students
+    return fast_json.list_response(schemas.Student, students)
 
 @router.get("/{student_id}", response_model=schemas.Student, dependencies=[Depends(has_role([UserRole.ADMIN, UserRole.HEAD_TEACHER, UserRole.HOMEROOM_TEACHER, UserRole.STUDENT]))])
 async def read_student(student_id: int, db: Session = Depends(student_service.get_db), current_user: schemas.UserInDB = Depends(get_current_user)):
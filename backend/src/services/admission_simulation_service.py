@@ -0,0 +1,222 @@
+# backend/src/services/admission_simulation_service.py
+# Provincial admission allocation and Monte Carlo what-if simulation
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+import numpy as np
+from sqlalchemy.orm import Session, joinedload
+from ..config import settings
+from ..database import models, schemas
+from ..utils.constants import PriorityType
+from . import ranking_service
+from .school_service import compute_actual_competition_quota
+
+# 학교 유형 코드
+GENDER_TYPE_CODES = {"COED": 0, "BOYS": 1, "GIRLS": 2}
+# 학생 성별 코드 (0: 미상)
+GENDER_CODES = {"남": 1, "남자": 1, "M": 1, "여": 2, "여자": 2, "F": 2}
+# 선발 트랙 코드
+TRACK_GENERAL, TRACK_WITHIN, TRACK_OUTSIDE = 0, 1, 2
+PRIORITY_TRACKS = {PriorityType.WITHIN_QUOTA: TRACK_WITHIN, PriorityType.OUTSIDE_QUOTA: TRACK_OUTSIDE}
+
+@dataclass(frozen=True)
+class SimulationInputs:
+    """Struct-of-arrays view of schools and applicants, cheap to pickle to worker processes."""
+    school_ids: np.ndarray  # int64
+    priority_within_quota: np.ndarray  # int64
+    priority_outside_quota: np.ndarray  # int64
+    competition_quota: np.ndarray  # int64, 일반전형 정원
+    school_gender_type: np.ndarray  # int8
+    application_ids: np.ndarray  # int64
+    student_ids: np.ndarray  # int64
+    school_index: np.ndarray  # int64, school_ids 내 위치
+    percentile: np.ndarray  # float64, 낮을수록 상위
+    gender: np.ndarray  # int8
+    track: np.ndarray  # int8
+
+def load_simulation_inputs(db: Session, quota_overrides: Optional[Dict[int, schemas.SchoolQuotaUpdate]] = None) -> SimulationInputs:
+    """Load every school and application into arrays, applying what-if quota overrides."""
+    quota_overrides = quota_overrides or {}
+    schools = db.query(models.School).order_by(models.School.id).all()
+    school_ids = np.array([school.id for school in schools], dtype=np.int64)
+    within, outside, competition = [], [], []
+    for school in schools:
+        override = quota_overrides.get(school.id)
+        if override is None:
+            # 저장된 실제 경쟁 정원 사용 (정원 변경 시점에 계산됨)
+            within.append(school.priority_within_quota or 0)
+            outside.append(school.priority_outside_quota or 0)
+            competition.append(school.actual_competition_quota or 0)
+            continue
+        total = override.total_quota if override.total_quota is not None else school.total_quota or 0
+        within.append(override.priority_within_quota if override.priority_within_quota is not None else school.priority_within_quota or 0)
+        outside.append(override.priority_outside_quota if override.priority_outside_quota is not None else school.priority_outside_quota or 0)
+        competition.append(compute_actual_competition_quota(total, within[-1]))
+
+    applications = (
+        db.query(models.StudentApplication)
+        .options(joinedload(models.StudentApplication.student))
+        .filter(models.StudentApplication.academic_year == models.current_academic_year(), models.StudentApplication.school_id.isnot(None))
+        .all()
+    )
+    percentiles = ranking_service.get_latest_percentiles(db, [a.student_id for a in applications])
+    applications = [a for a in applications if percentiles.get(a.student_id) is not None]
+    position = {school_id: index for index, school_id in enumerate(school_ids.tolist())}
+    applications = [a for a in applications if int(a.school_id) in position]
+
+    return SimulationInputs(
+        school_ids=school_ids,
+        priority_within_quota=np.array(within, dtype=np.int64),
+        priority_outside_quota=np.array(outside, dtype=np.int64),
+        competition_quota=np.array(competition, dtype=np.int64),
+        school_gender_type=np.array([GENDER_TYPE_CODES.get(s.gender_type or "COED", 0) for s in schools], dtype=np.int8),
+        application_ids=np.array([a.id for a in applications], dtype=np.int64),
+        student_ids=np.array([a.student_id for a in applications], dtype=np.int64),
+        school_index=np.array([position[int(a.school_id)] for a in applications], dtype=np.int64),
+        percentile=np.array([percentiles[a.student_id] for a in applications], dtype=np.float64),
+        gender=np.array([GENDER_CODES.get((a.student.gender or "").strip(), 0) for a in applications], dtype=np.int8),
+        track=np.array([PRIORITY_TRACKS.get(a.priority_type, TRACK_GENERAL) if a.is_priority_selection else TRACK_GENERAL for a in applications], dtype=np.int8),
+    )
+
+def _rank_within_groups(group: np.ndarray, percentile: np.ndarray) -> np.ndarray:
+    """그룹(학교·트랙)별 백분율 순위 (0부터)"""
+    order = np.lexsort((percentile, group))
+    sorted_group = group[order]
+    starts = np.flatnonzero(np.r_[True, sorted_group[1:] != sorted_group[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    ranks = np.empty(len(order), dtype=np.int64)
+    ranks[order] = np.arange(len(order)) - group_start
+    return ranks
+
+def allocate(inputs: SimulationInputs, percentile: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Run one provincial allocation and return the admitted mask per applicant.
+
+    1. Applicants whose gender does not match a BOYS/GIRLS school are not eligible.
+    2. Priority applicants fill 정원외 and 정원내 우선선발 seats by percentile.
+    3. Everyone else, including priority applicants who missed their track, competes
+       for 일반전형 seats, which also receive unfilled 정원내 우선선발 seats.
+    """
+    return allocate_by_route(inputs, percentile)[0]
+
+def allocate_by_route(inputs: SimulationInputs, percentile: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    allocate() that also tells how each admit got in.
+
+    Returns:
+        (admitted mask, mask of admits through 일반전형 — including priority
+        applicants who missed their own track)
+    """
+    percentile = inputs.percentile if percentile is None else percentile
+    n_schools = len(inputs.school_ids)
+    school_type = inputs.school_gender_type[inputs.school_index]
+    eligible = (school_type == 0) | ((school_type == 1) & (inputs.gender != 2)) | ((school_type == 2) & (inputs.gender != 1))
+    admitted = np.zeros(len(percentile), dtype=bool)
+    via_general = np.zeros(len(percentile), dtype=bool)
+    if not len(percentile):
+        return admitted, via_general
+
+    # 우선선발 (정원내/정원외)
+    priority = eligible & (inputs.track != TRACK_GENERAL)
+    capacity = np.stack([np.zeros(n_schools, dtype=np.int64), inputs.priority_within_quota, inputs.priority_outside_quota], axis=1)
+    group = inputs.school_index * 3 + inputs.track
+    if priority.any():
+        ranks = _rank_within_groups(group[priority], percentile[priority])
+        admitted[priority] = ranks < capacity[inputs.school_index[priority], inputs.track[priority]]
+
+    # 정원내 우선선발 미충원 인원은 일반전형으로 이월
+    within_filled = np.bincount(inputs.school_index[admitted & (inputs.track == TRACK_WITHIN)], minlength=n_schools)
+    general_capacity = inputs.competition_quota + np.maximum(inputs.priority_within_quota - within_filled, 0)
+
+    general = eligible & ~admitted
+    if general.any():
+        ranks = _rank_within_groups(inputs.school_index[general], percentile[general])
+        via_general[general] = ranks < general_capacity[inputs.school_index[general]]
+    return admitted | via_general, via_general
+
+def _simulate_runs(inputs: SimulationInputs, runs: int, noise: float, seed_sequence: np.random.SeedSequence) -> np.ndarray:
+    """작업 프로세스: 백분율에 잡음을 더해 반복 배정하고 합격 횟수 반환"""
+    rng = np.random.default_rng(seed_sequence)
+    admitted_counts = np.zeros(len(inputs.percentile), dtype=np.int64)
+    for _ in range(runs):
+        perturbed = np.clip(inputs.percentile + rng.normal(0.0, noise, len(inputs.percentile)), 0.0, 100.0)
+        admitted_counts += allocate(inputs, perturbed)
+    return admitted_counts
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # 스레드가 도는 서버 프로세스를 fork하지 않도록 spawn으로 작업 프로세스 생성
+            _process_pool = ProcessPoolExecutor(
+                max_workers=settings.SIMULATION_WORKERS or os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+def shutdown_process_pool():
+    """작업 프로세스 종료 (앱 종료 시 호출; 다음 시뮬레이션에서 다시 생성)"""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def run_monte_carlo(inputs: SimulationInputs, runs: int, noise: float, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Estimate each applicant's admission probability over `runs` noisy allocations,
+    split evenly across the process pool. Results are reproducible for a given seed.
+    """
+    workers = settings.SIMULATION_WORKERS or os.cpu_count() or 1
+    chunks = [runs // workers + (1 if index < runs % workers else 0) for index in range(workers)]
+    chunks = [chunk for chunk in chunks if chunk]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    if len(chunks) == 1:
+        counts = _simulate_runs(inputs, chunks[0], noise, seeds[0])
+    else:
+        pool = _get_process_pool()
+        futures = [pool.submit(_simulate_runs, inputs, chunk, noise, seed_sequence) for chunk, seed_sequence in zip(chunks, seeds)]
+        counts = sum(future.result() for future in futures)
+    return counts / runs
+
+def simulate_admission(db: Session, request: schemas.AdmissionSimulationRequest) -> schemas.AdmissionSimulationResult:
+    """Run the deterministic allocation plus Monte Carlo probabilities for a scenario."""
+    inputs = load_simulation_inputs(db, request.quota_overrides)
+    admitted, via_general = allocate_by_route(inputs)
+    probabilities = run_monte_carlo(inputs, request.runs, request.percentile_noise, request.seed) if request.runs else admitted.astype(np.float64)
+
+    school_summaries = []
+    applicants_per_school = np.bincount(inputs.school_index, minlength=len(inputs.school_ids))
+    admitted_per_school = np.bincount(inputs.school_index[admitted], minlength=len(inputs.school_ids))
+    for index, school_id in enumerate(inputs.school_ids.tolist()):
+        admitted_percentiles = inputs.percentile[via_general & (inputs.school_index == index)]
+        school_summaries.append(schemas.SchoolSimulationSummary(
+            school_id=str(school_id),
+            applicants=int(applicants_per_school[index]),
+            admitted=int(admitted_per_school[index]),
+            cutoff_percentile=float(admitted_percentiles.max()) if len(admitted_percentiles) else None,
+        ))
+
+    return schemas.AdmissionSimulationResult(
+        runs=request.runs,
+        applicants=[
+            schemas.ApplicantAdmissionEstimate(
+                application_id=str(application_id),
+                student_id=str(student_id),
+                school_id=str(inputs.school_ids[school_index]),
+                admitted=bool(is_admitted),
+                admission_probability=round(float(probability) * 100, 1),
+            )
+            for application_id, student_id, school_index, is_admitted, probability in zip(
+                inputs.application_ids.tolist(), inputs.student_ids.tolist(), inputs.school_index.tolist(), admitted.tolist(), probabilities.tolist()
+            )
+        ],
+        schools=school_summaries,
+    )
@@ -0,0 +1,110 @@
+# backend/src/services/applicant_pool.py
+# Compact struct-of-arrays storage for large in-memory applicant sets
+
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from ..database import schemas
+from ..utils import fast_json
+from ..utils.constants import PriorityType
+
+class StringTable:
+    """반복되는 문자열(우선선발 유형·분야, 중학교)을 코드로 저장하는 인턴 테이블 (0: None)"""
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.values: List[Optional[str]] = [None]
+        self._codes: Dict[Optional[str], int] = {None: 0}
+        for value in values:
+            self.code(value)
+
+    def code(self, value: Optional[str]) -> int:
+        if isinstance(value, PriorityType):
+            value = value.value
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+@dataclass(frozen=True)
+class ApplicantPool:
+    """
+    One school's ranked applicants as parallel arrays instead of one Pydantic object
+    per applicant.
+
+    Numeric fields live in typed arrays (stdlib array, so importing this module stays
+    cheap at cold start), repeated strings are interned into small tables and referenced
+    by code, and only student names are kept as Python strings.
+    StudentRanking objects are created on demand at the API boundary (ranking(),
+    to_schemas()), never stored.
+    """
+    student_ids: array  # q (int64)
+    student_names: Tuple[str, ...]
+    rank: array  # i (int32)
+    percentile_rank: array  # d (float64)
+    is_priority_selection: array  # b (0/1)
+    priority_type: array  # b, priority_types 내 위치
+    priority_category: array  # h, categories 내 위치
+    school_name: array  # h, school_names 내 위치
+    grade: array  # b
+    class_number: array  # b
+    number: array  # b
+    priority_types: Tuple[Optional[str], ...]
+    categories: Tuple[Optional[str], ...]
+    school_names: Tuple[Optional[str], ...]
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[dict]) -> "ApplicantPool":
+        """StudentRanking 필드 이름을 키로 하는 행 목록에서 생성"""
+        priority_types = StringTable(priority_type.value for priority_type in PriorityType)
+        categories, school_names = StringTable(), StringTable()
+        return cls(
+            student_ids=array("q", (int(row["student_id"]) for row in rows)),
+            student_names=tuple(row["student_name"] for row in rows),
+            rank=array("i", (row["rank"] for row in rows)),
+            percentile_rank=array("d", (row["percentile_rank"] for row in rows)),
+            is_priority_selection=array("b", (row["is_priority_selection"] for row in rows)),
+            priority_type=array("b", (priority_types.code(row["priority_type"]) for row in rows)),
+            priority_category=array("h", (categories.code(row["priority_category"]) for row in rows)),
+            school_name=array("h", (school_names.code(row["school_name"]) for row in rows)),
+            grade=array("b", (row["grade"] for row in rows)),
+            class_number=array("b", (row["class_number"] for row in rows)),
+            number=array("b", (row["number"] for row in rows)),
+            priority_types=tuple(priority_types.values),
+            categories=tuple(categories.values),
+            school_names=tuple(school_names.values),
+        )
+
+    def __len__(self) -> int:
+        return len(self.student_names)
+
+    def row(self, index: int) -> dict:
+        return {
+            "student_id": str(self.student_ids[index]),
+            "student_name": self.student_names[index],
+            "rank": int(self.rank[index]),
+            "percentile_rank": float(self.percentile_rank[index]),
+            "is_priority_selection": bool(self.is_priority_selection[index]),
+            "priority_type": self.priority_types[self.priority_type[index]],
+            "priority_category": self.categories[self.priority_category[index]],
+            "school_name": self.school_names[self.school_name[index]] or "",
+            "grade": int(self.grade[index]),
+            "class_number": int(self.class_number[index]),
+            "number": int(self.number[index]),
+        }
+
+    def ranking(self, index: int) -> schemas.StudentRanking:
+        return schemas.StudentRanking(**self.row(index))
+
+    def to_schemas(self, indices: Optional[Iterable[int]] = None) -> List[schemas.StudentRanking]:
+        """API 응답용 StudentRanking 목록 (indices가 없으면 전체)"""
+        indices = range(len(self)) if indices is None else indices
+        return fast_json.list_adapter(schemas.StudentRanking).validate_python([self.row(index) for index in indices])
+
+    @property
+    def nbytes(self) -> int:
+        """배열이 차지하는 바이트 (문자열 테이블 제외)"""
+        return sum(len(column) * column.itemsize for column in (getattr(self, name) for name in (
+            "student_ids", "rank", "percentile_rank", "is_priority_selection", "priority_type",
+            "priority_category", "school_name", "grade", "class_number", "number",
+        )))
@@ -0,0 +1,149 @@
+# backend/src/services/application_counter_service.py
+# Materialized per-school application counters
+
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from sqlalchemy import case, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..database import models, schemas
+from ..utils.constants import PriorityType
+
+COUNTER_FIELDS = ("total_applicants", "general_applicants", "priority_within_applicants", "priority_outside_applicants")
+# INSERT ... ON CONFLICT DO UPDATE를 지원하는 DB별 insert 구문
+UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+def application_bucket(is_priority_selection: bool, priority_type: Optional[str]) -> str:
+    """지원서가 집계되는 카운터 열 (우선선발 유형이 없으면 일반전형)"""
+    if is_priority_selection and priority_type == PriorityType.WITHIN_QUOTA:
+        return "priority_within_applicants"
+    if is_priority_selection and priority_type == PriorityType.OUTSIDE_QUOTA:
+        return "priority_outside_applicants"
+    return "general_applicants"
+
+def counter_key(application) -> Optional[Tuple[int, int, str]]:
+    """
+    (학년도, 학교 ID, 카운터 열), 지원 학교가 없으면 None.
+    새 지원서는 flush 후에 호출 (학년도는 저장 시 학생에게서 복사됨)
+    """
+    if application.school_id is None:
+        return None
+    return application.academic_year, int(application.school_id), application_bucket(application.is_priority_selection, application.priority_type)
+
+def _increment(db: Session, academic_year: int, school_id: int, bucket: str, delta: int):
+    """
+    Add delta to a school's total and bucket counters of one academic year, creating
+    the row if needed.
+
+    Uses a single INSERT ... ON CONFLICT DO UPDATE, so two transactions creating the
+    same school's first counter do not collide. Other databases update first and, if
+    a concurrent insert wins the race, retry the update.
+    """
+    counter = models.SchoolApplicationCounter.__table__
+    now = datetime.utcnow()
+    initial = {field: 0 for field in COUNTER_FIELDS}
+    initial.update({"total_applicants": delta, bucket: delta})
+    increments = {
+        "total_applicants": counter.c.total_applicants + delta,
+        bucket: counter.c[bucket] + delta,
+        "updated_at": now,
+    }
+    insert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is not None:
+        statement = insert(counter).values(academic_year=academic_year, school_id=school_id, updated_at=now, **initial)
+        db.execute(statement.on_conflict_do_update(index_elements=[counter.c.academic_year, counter.c.school_id], set_=increments))
+        return
+
+    update = counter.update().where(counter.c.academic_year == academic_year, counter.c.school_id == school_id).values(increments)
+    if db.execute(update).rowcount:
+        return
+    try:
+        with db.begin_nested():
+            db.execute(counter.insert().values(academic_year=academic_year, school_id=school_id, updated_at=now, **initial))
+    except IntegrityError:
+        # 다른 트랜잭션이 먼저 행을 만든 경우: 그 행에 더함
+        db.execute(update)
+
+def record_change(db: Session, before: Optional[Tuple[int, int, str]], after: Optional[Tuple[int, int, str]]):
+    """
+    Move one application between counters inside the caller's transaction.
+
+    Args:
+        before: counter_key of the application before the change (None when created)
+        after: counter_key after the change
+    """
+    if before == after:
+        return
+    if before is not None:
+        _increment(db, *before, -1)
+    if after is not None:
+        _increment(db, *after, 1)
+
+def current_counter(db: Session, school_id: int) -> Optional[models.SchoolApplicationCounter]:
+    """현재 학년도의 학교 카운터 (지원서가 없었으면 None)"""
+    return db.get(models.SchoolApplicationCounter, {"academic_year": models.current_academic_year(), "school_id": school_id})
+
+def recount(db: Session, academic_year: Optional[int] = None) -> Dict[int, Dict[str, int]]:
+    """한 학년도(기본: 현재) 지원서를 학교별로 다시 집계 (GROUP BY 한 번)"""
+    academic_year = models.current_academic_year() if academic_year is None else academic_year
+    application = models.StudentApplication
+    priority = application.is_priority_selection.is_(True)
+    within = case((priority & (application.priority_type == PriorityType.WITHIN_QUOTA), 1), else_=0)
+    outside = case((priority & (application.priority_type == PriorityType.OUTSIDE_QUOTA), 1), else_=0)
+    rows = (
+        db.query(application.school_id, func.count(application.id), func.sum(within), func.sum(outside))
+        .filter(application.academic_year == academic_year, application.school_id.isnot(None))
+        .group_by(application.school_id)
+        .all()
+    )
+    counts = {}
+    for school_id, total, within_count, outside_count in rows:
+        within_count, outside_count = int(within_count or 0), int(outside_count or 0)
+        counts[int(school_id)] = {
+            "total_applicants": total,
+            "general_applicants": total - within_count - outside_count,
+            "priority_within_applicants": within_count,
+            "priority_outside_applicants": outside_count,
+        }
+    return counts
+
+def reconcile_counters(db: Session, repair: bool = True, academic_year: Optional[int] = None) -> schemas.CounterReconciliationReport:
+    """
+    Verify one academic year's materialized counters against a full recount of
+    that year's applications.
+
+    Args:
+        db: Database session
+        repair: Overwrite mismatched counters with the recounted values
+        academic_year: Year to check (defaults to the current academic year)
+
+    Returns:
+        Every mismatching (school, field) pair found
+    """
+    academic_year = models.current_academic_year() if academic_year is None else academic_year
+    actual = recount(db, academic_year)
+    counter = models.SchoolApplicationCounter
+    stored = {row.school_id: row for row in db.query(counter).filter(counter.academic_year == academic_year).all()}
+    empty = {field: 0 for field in COUNTER_FIELDS}
+    mismatches = []
+    for school_id in sorted(set(actual) | set(stored)):
+        expected = actual.get(school_id, empty)
+        row = stored.get(school_id)
+        for field in COUNTER_FIELDS:
+            current = getattr(row, field) if row is not None else 0
+            if current != expected[field]:
+                mismatches.append(schemas.CounterMismatch(school_id=str(school_id), field=field, stored=current, actual=expected[field]))
+
+    if repair and mismatches:
+        for school_id in {int(mismatch.school_id) for mismatch in mismatches}:
+            row = stored.get(school_id)
+            if row is None:
+                row = models.SchoolApplicationCounter(academic_year=academic_year, school_id=school_id)
+                db.add(row)
+            for field, value in actual.get(school_id, empty).items():
+                setattr(row, field, value)
+            row.updated_at = datetime.utcnow()
+        db.commit()
+
+    return schemas.CounterReconciliationReport(academic_year=academic_year, checked_schools=len(set(actual) | set(stored)), mismatches=mismatches, repaired=repair and bool(mismatches))
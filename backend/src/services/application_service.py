@@ -1,39 +1,83 @@
 # backend/src/services/application_service.py
 # Business logic for student application operations
 
+from datetime import datetime
 from sqlalchemy.orm import Session
 from ..database import models, schemas
-
-def get_db():
-    # Placeholder for DB session
-    yield None
+from ..database.session import get_db
+from ..utils import events
+from . import application_counter_service
+from .application_snapshot_service import application_snapshots
 
 def get_student(db: Session, student_id: int):
-    # return db.query(models.Student).filter(models.Student.id == student_id).first()
-    return None
+    return db.query(models.Student).filter(models.Student.id == student_id).first()
 
 def get_student_application(db: Session, application_id: int):
-    # return db.query(models.StudentApplication).filter(models.StudentApplication.id == application_id).first()
-    return None
+    return db.query(models.StudentApplication).filter(models.StudentApplication.id == application_id).first()
 
 def get_application_by_student_id(db: Session, student_id: int):
-    # return db.query(models.StudentApplication).filter(models.StudentApplication.student_id == student_id).first()
-    return None
+    return db.query(models.StudentApplication).filter(models.StudentApplication.student_id == student_id).first()
 
 def create_student_application(db: Session, application: schemas.StudentApplicationCreate):
+    now = datetime.utcnow()
     db_application = models.StudentApplication(
         student_id=application.student_id,
         school_id=application.school_id,
-        is_accepted=application.is_accepted
+        department_name=application.department_name,
+        is_accepted=application.is_accepted,
+        is_priority_selection=application.is_priority_selection,
+        priority_type=application.priority_type,
+        priority_category=application.priority_category,
+        created_at=now,
+        updated_at=now,
     )
-    # db.add(db_application)
-    # db.commit()
-    # db.refresh(db_application)
+    db.add(db_application)
+    # 학년도(학생의 학년도)가 채워지도록 먼저 flush
+    db.flush()
+    application_counter_service.record_change(db, None, application_counter_service.counter_key(db_application))
+    db.commit()
+    db.refresh(db_application)
+    application_snapshots.refresh(db_application.school_id, db)
+    events.publish(events.APPLICATIONS_CHANGED, {"school_ids": [db_application.school_id], "academic_years": [db_application.academic_year]})
     return db_application
 
 def update_student_application(db: Session, application: models.StudentApplication, application_update: schemas.StudentApplicationCreate):
+    previous_school_id = application.school_id
+    previous_key = application_counter_service.counter_key(application)
     application.school_id = application_update.school_id
+    application.department_name = application_update.department_name
     application.is_accepted = application_update.is_accepted
-    # db.commit()
-    # db.refresh(application)
+    application.is_priority_selection = application_update.is_priority_selection
+    application.priority_type = application_update.priority_type
+    application.priority_category = application_update.priority_category
+    application.updated_at = datetime.utcnow()
+    # 학교나 우선선발 유형이 바뀐 경우에만 카운터 이동 (같은 트랜잭션)
+    application_counter_service.record_change(db, previous_key, application_counter_service.counter_key(application))
+    db.commit()
+    db.refresh(application)
+    # 지원 학교가 바뀌면 이전 학교와 새 학교 스냅샷 모두 갱신
+    for school_id in {previous_school_id, application.school_id}:
+        application_snapshots.refresh(school_id, db)
+    events.publish(events.APPLICATIONS_CHANGED, {
+        "school_ids": sorted({previous_school_id, application.school_id} - {None}),
+        "academic_years": [application.academic_year],
+    })
     return application
+
+def delete_student_applications(db: Session, applications) -> set:
+    """
+    Delete applications inside the caller's transaction, moving their counters.
+
+    The caller commits, refreshes the returned schools' snapshots and publishes
+    APPLICATIONS_CHANGED for them.
+
+    Returns:
+        IDs of the high schools the deleted applications were for
+    """
+    school_ids = set()
+    for application in list(applications):
+        application_counter_service.record_change(db, application_counter_service.counter_key(application), None)
+        if application.school_id is not None:
+            school_ids.add(application.school_id)
+        db.delete(application)
+    return school_ids
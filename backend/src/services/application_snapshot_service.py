@@ -0,0 +1,229 @@
+# backend/src/services/application_snapshot_service.py
+# In-memory, versioned snapshots of each school's applicants for dashboard reads
+
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from sqlalchemy.orm import Session, joinedload
+from starlette.concurrency import run_in_threadpool
+from ..config import settings
+from ..database import models, schemas
+from ..database.session import SessionLocal
+from ..utils import events, metrics
+from ..utils.constants import PriorityType
+from . import ranking_service
+from .applicant_pool import ApplicantPool
+from .school_service import to_school_schema
+
+# 프로세스마다 다른 값: 재시작 후 이전 ETag가 우연히 일치하지 않도록 함
+_BOOT_ID = uuid.uuid4().hex[:8]
+
+@dataclass(frozen=True)
+class SchoolSnapshot:
+    """
+    Immutable view of one school's applicants at a given version.
+
+    Readers hold a reference to a snapshot and never see it change; writers build a
+    new snapshot and swap it in. The small status body is serialized once per version.
+    Applicants are kept in a compact ApplicantPool; the Pydantic detail model and its
+    JSON body are only built on demand (see ApplicationSnapshotStore.detail_json).
+    """
+    school_id: int
+    version: int
+    academic_year: int
+    status: schemas.CompetitionStatus
+    school: schemas.School
+    statistics: schemas.CompetitionStatistics
+    applicants: ApplicantPool
+    last_updated: str
+    status_json: bytes
+
+    @property
+    def etag(self) -> str:
+        return f'W/"{_BOOT_ID}-{self.school_id}-{self.version}"'
+
+    @property
+    def detail(self) -> schemas.CompetitionStatusDetail:
+        return schemas.CompetitionStatusDetail(
+            school=self.school,
+            statistics=self.statistics,
+            rankings=self.applicants.to_schemas(),
+            last_updated=self.last_updated,
+        )
+
+def build_statistics(school: models.School, applications) -> schemas.CompetitionStatistics:
+    priority_within = sum(1 for a in applications if a.is_priority_selection and a.priority_type == PriorityType.WITHIN_QUOTA)
+    priority_outside = sum(1 for a in applications if a.is_priority_selection and a.priority_type == PriorityType.OUTSIDE_QUOTA)
+    general = len(applications) - priority_within - priority_outside
+    quota = school.actual_competition_quota or 0
+    return schemas.CompetitionStatistics(
+        total_applicants=len(applications),
+        general_applicants=general,
+        priority_within_applicants=priority_within,
+        priority_outside_applicants=priority_outside,
+        competition_ratio=round(general / quota, 2) if quota else 0.0,
+    )
+
+def _build_rankings(db: Session, applications) -> ApplicantPool:
+    """ranking_service와 같은 순위 규칙; 백분율이 없는 지원자는 목록에서 제외"""
+    percentiles = ranking_service.get_latest_percentiles(db, [a.student_id for a in applications])
+    rows = []
+    for application, percentile, rank in ranking_service.rank_applications(applications, percentiles):
+        if rank is None:
+            continue
+        student = application.student
+        rows.append({
+            "student_id": str(student.id),
+            "student_name": student.name or "",
+            "rank": rank,
+            "percentile_rank": percentile,
+            "is_priority_selection": bool(application.is_priority_selection),
+            "priority_type": application.priority_type,
+            "priority_category": application.priority_category,
+            "school_name": student.school_id or "",  # 소속 중학교 ID (학교명은 클라이언트에서 매핑)
+            "grade": student.grade or 0,
+            "class_number": student.class_number or 0,
+            "number": student.number or 0,
+        })
+    return ApplicantPool.from_rows(rows)
+
+class ApplicationSnapshotStore:
+    """
+    Per-school copy-on-write snapshots of the applicant set.
+
+    get() is lock-free: it reads the current snapshot reference from a dict; async
+    handlers use get_async(), which rebuilds a missing snapshot off the event loop.
+    refresh() rebuilds one school's snapshot from the database under that school's
+    write lock and publishes it with a new version; it is called after application
+    writes and quota changes.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        self._session_factory = session_factory
+        self._snapshots: Dict[int, SchoolSnapshot] = {}
+        self._versions: Dict[int, int] = {}
+        self._write_locks: Dict[int, threading.Lock] = {}
+        # (학교 ID, 버전) → 상세 응답 본문, 최근 조회 순 (SNAPSHOT_DETAIL_CACHE_SIZE개까지)
+        self._detail_bodies: "OrderedDict[Tuple[int, int], bytes]" = OrderedDict()
+        self._detail_lock = threading.Lock()
+
+    def _current(self, school_id: int) -> Optional[SchoolSnapshot]:
+        snapshot = self._snapshots.get(school_id)
+        # 학년도가 바뀌면(3월) 지난 학년도의 스냅샷은 없는 것으로 봄
+        if snapshot is not None and snapshot.academic_year != models.current_academic_year():
+            return None
+        return snapshot
+
+    def get(self, school_id: int) -> Optional[SchoolSnapshot]:
+        snapshot = self._current(school_id)
+        if snapshot is None:
+            snapshot = self.refresh(school_id)
+        return snapshot
+
+    async def get_async(self, school_id: int) -> Optional[SchoolSnapshot]:
+        """get() for async handlers: a miss rebuilds on the thread pool, not on the event loop."""
+        snapshot = self._current(school_id)
+        if snapshot is None:
+            snapshot = await run_in_threadpool(self.refresh, school_id)
+        return snapshot
+
+    def detail_json(self, snapshot: SchoolSnapshot) -> bytes:
+        """
+        The detail response body of a snapshot, serialized on first request.
+
+        Only the SNAPSHOT_DETAIL_CACHE_SIZE most recently requested bodies are kept,
+        so memory per school is the ApplicantPool plus at most one body for the
+        schools actually being viewed.
+        """
+        key = (snapshot.school_id, snapshot.version)
+        with self._detail_lock:
+            body = self._detail_bodies.get(key)
+            if body is not None:
+                self._detail_bodies.move_to_end(key)
+                return body
+        body = snapshot.detail.model_dump_json().encode("utf-8")
+        with self._detail_lock:
+            self._detail_bodies[key] = body
+            self._detail_bodies.move_to_end(key)
+            while len(self._detail_bodies) > settings.SNAPSHOT_DETAIL_CACHE_SIZE:
+                self._detail_bodies.popitem(last=False)
+        return body
+
+    async def detail_json_async(self, snapshot: SchoolSnapshot) -> bytes:
+        """detail_json() for async handlers: a cache miss is serialized on the thread pool."""
+        with self._detail_lock:
+            body = self._detail_bodies.get((snapshot.school_id, snapshot.version))
+        if body is not None:
+            return body
+        return await run_in_threadpool(self.detail_json, snapshot)
+
+    def refresh(self, school_id: Optional[int], db: Optional[Session] = None) -> Optional[SchoolSnapshot]:
+        """Rebuild and publish a school's snapshot (no-op for a missing school)."""
+        if school_id is None:
+            return None
+        school_id = int(school_id)
+        session = db or self._session_factory()
+        try:
+            with self._write_locks.setdefault(school_id, threading.Lock()):
+                school = session.query(models.School).filter(models.School.id == school_id).first()
+                if school is None:
+                    self._snapshots.pop(school_id, None)
+                    return None
+                version = self._versions.get(school_id, 0) + 1
+                with metrics.SNAPSHOT_REFRESH_SECONDS.time():
+                    snapshot = self._build(session, school, version)
+                self._versions[school_id] = version
+                self._snapshots[school_id] = snapshot
+                return snapshot
+        finally:
+            if db is None:
+                session.close()
+
+    def invalidate(self, school_id: int):
+        """다음 조회 시 다시 만들도록 스냅샷 제거"""
+        self._snapshots.pop(int(school_id), None)
+
+    def clear(self):
+        self._snapshots.clear()
+        with self._detail_lock:
+            self._detail_bodies.clear()
+
+    def _build(self, db: Session, school: models.School, version: int) -> SchoolSnapshot:
+        academic_year = models.current_academic_year()
+        applications = (
+            db.query(models.StudentApplication)
+            .options(joinedload(models.StudentApplication.student))
+            .filter(models.StudentApplication.academic_year == academic_year, models.StudentApplication.school_id == school.id)
+            .all()
+        )
+        school_schema = to_school_schema(school)
+        statistics = build_statistics(school, applications)
+        status = schemas.CompetitionStatus(
+            school_id=school_schema.id,
+            school_name=school.name,
+            total_quota=school_schema.total_quota,
+            priority_within_quota=school_schema.priority_within_quota,
+            priority_outside_quota=school_schema.priority_outside_quota,
+            actual_competition_quota=school_schema.actual_competition_quota,
+            statistics=statistics,
+        )
+        return SchoolSnapshot(
+            school_id=school.id,
+            version=version,
+            academic_year=academic_year,
+            status=status,
+            school=school_schema,
+            statistics=statistics,
+            applicants=_build_rankings(db, applications),
+            last_updated=datetime.utcnow().isoformat(),
+            status_json=status.model_dump_json().encode("utf-8"),
+        )
+
+# Create store instance
+application_snapshots = ApplicationSnapshotStore()
+
+# 정원이 바뀐 학교의 스냅샷만 무효화 (다음 조회 시 재생성)
+events.subscribe(events.SCHOOL_QUOTA_CHANGED, lambda event: application_snapshots.invalidate(event["school_id"]))
@@ -1,14 +1,24 @@
 # backend/src/services/approval_service.py
 # Service for handling hierarchical approval system
 
-from typing import List, Optional, Dict, Any
+import asyncio
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from fastapi import HTTPException, status
 from ..database import schemas
-from ..database.firebase_config import db
+from ..database.hydration import hydrate
+from ..utils.blocking import run_blocking
+from ..utils.firestore_tracing import TracedClient
+from ..utils.lazy import LazyProxy
 from ..utils.constants import UserRole, UserRoleGroups
-from .auth_service import auth_service
-from .school_service import school_service
+from .notification_service import notification_dispatcher
+
+def _firestore_client():
+    from ..database.firebase_config import db as firestore_db
+    return TracedClient(firestore_db)
+
+# Firestore 클라이언트는 첫 사용 시 초기화 (firebase_admin import 지연)
+db = LazyProxy(_firestore_client)
 
 class ApprovalService:
     """
@@ -39,8 +49,8 @@ class ApprovalService:
             
             pending_users = []
             for doc in docs:
-                user_data = doc.to_dict()
-                pending_user = schemas.UserInDB(**user_data)
+                # 서비스가 기록한 문서이므로 재검증 없이 생성 (EmailStr 검증이 대부분의 비용)
+                pending_user = hydrate(schemas.UserInDB, doc.to_dict())
                 
                 # Check if current user can approve this pending user
                 if self._can_approve_user(current_user, pending_user):
@@ -84,8 +94,7 @@ class ApprovalService:
                     detail="승인 대상 사용자를 찾을 수 없습니다."
                 )
             
-            target_user_data = target_user_doc.to_dict()
-            target_user = schemas.UserInDB(**target_user_data)
+            target_user = hydrate(schemas.UserInDB, target_user_doc.to_dict())
             
             # Validate approval permission
             if not self._can_approve_user(approver, target_user):
@@ -206,11 +215,7 @@ class ApprovalService:
             pending_count = len(pending_users)
             
             # Get approval history count
-            approval_logs_ref = db.collection('approval_logs').where('approver_uid', '==', current_user.uid)
-            approval_docs = list(approval_logs_ref.stream())
-            
-            approved_count = len([doc for doc in approval_docs if doc.to_dict().get('action') == 'approved'])
-            rejected_count = len([doc for doc in approval_docs if doc.to_dict().get('action') == 'rejected'])
+            approved_count, rejected_count = self._count_approval_actions(current_user.uid)
             
             return {
                 "pending_count": pending_count,
@@ -227,6 +232,66 @@ class ApprovalService:
                 detail=f"승인 통계 조회 중 오류가 발생했습니다: {e}"
             )
     
+    def _count_approval_actions(self, approver_uid: str) -> Tuple[int, int]:
+        """(승인 수, 거부 수): 승인 로그를 한 번 조회"""
+        approval_docs = db.collection('approval_logs').where('approver_uid', '==', approver_uid).stream()
+        actions = [doc.to_dict().get('action') for doc in approval_docs]
+        return actions.count('approved'), actions.count('rejected')
+    
+    # --- async 경로: Firestore 호출은 전용 스레드풀에서 실행해 이벤트 루프를 막지 않음 ---
+    
+    async def get_pending_users_for_approver_async(self, current_user: schemas.UserInDB) -> List[schemas.UserInDB]:
+        return await run_blocking(self.get_pending_users_for_approver, current_user)
+    
+    async def approve_user_hierarchical_async(
+        self, 
+        approver: schemas.UserInDB, 
+        target_uid: str, 
+        is_approved: bool, 
+        rejection_reason: Optional[str] = None
+    ) -> Dict[str, Any]:
+        return await run_blocking(
+            self.approve_user_hierarchical,
+            approver=approver,
+            target_uid=target_uid,
+            is_approved=is_approved,
+            rejection_reason=rejection_reason
+        )
+    
+    async def get_approval_history_async(self, current_user: schemas.UserInDB) -> List[Dict[str, Any]]:
+        return await run_blocking(self.get_approval_history, current_user)
+    
+    async def get_approval_statistics_async(self, current_user: schemas.UserInDB) -> Dict[str, Any]:
+        """
+        Same result as get_approval_statistics, with the pending-user query and the
+        approval-log query running concurrently instead of one after the other.
+        """
+        if not self._has_approval_permission(current_user):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="승인 통계를 조회할 권한이 없습니다."
+            )
+        
+        try:
+            pending_users, (approved_count, rejected_count) = await asyncio.gather(
+                run_blocking(self.get_pending_users_for_approver, current_user),
+                run_blocking(self._count_approval_actions, current_user.uid)
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"승인 통계 조회 중 오류가 발생했습니다: {e}"
+            )
+        
+        return {
+            "pending_count": len(pending_users),
+            "approved_count": approved_count,
+            "rejected_count": rejected_count,
+            "total_processed": approved_count + rejected_count
+        }
+    
     def _can_approve_user(self, approver: schemas.UserInDB, target_user: schemas.UserInDB) -> bool:
         """
         Check if approver can approve the target user based on hierarchical rules.
@@ -326,22 +391,18 @@ class ApprovalService:
             is_approved: Whether the user was approved
             rejection_reason: Reason for rejection (if applicable)
         """
-        # Placeholder for notification system
-        # This could be implemented with email, push notifications, etc.
+        # 아웃박스에 기록만 하고 반환 (발송·재시도·다이제스트는 notification_dispatcher 담당)
         try:
-            notification_data = {
-                "user_uid": target_user.uid,
-                "user_email": target_user.email,
-                "type": "approval_status",
-                "is_approved": is_approved,
-                "message": "계정이 승인되었습니다." if is_approved else f"계정이 거부되었습니다. 사유: {rejection_reason or '사유 없음'}",
-                "created_at": datetime.utcnow().isoformat()
-            }
-            
-            # Store notification in Firestore for now
-            db.collection('notifications').add(notification_data)
-            
-            # TODO: Implement actual email/push notification sending
+            notification_dispatcher.enqueue(
+                recipient_uid=target_user.uid,
+                recipient_email=target_user.email,
+                kind="approval_status",
+                title="계정 승인 완료" if is_approved else "계정 승인 거부",
+                message="계정이 승인되었습니다." if is_approved else f"계정이 거부되었습니다. 사유: {rejection_reason or '사유 없음'}",
+                # 결과별 키: 승인 직후의 거부(또는 그 반대)는 대체되지 않고 따로 전달
+                dedupe_key=f"approval_status:{target_user.uid}:{'approved' if is_approved else 'rejected'}",
+                data={"is_approved": is_approved}
+            )
             
         except Exception as e:
             # Log error but don't fail the approval process
@@ -0,0 +1,197 @@
+# backend/src/services/archive_service.py
+# Academic-year rollover: move finished years out of the hot tables into gzip JSONL archives
+
+import gzip
+import json
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..database import models, schemas
+from ..utils import events
+from .application_snapshot_service import application_snapshots
+
+# 보관 대상 테이블 (내보내기 순서; 삭제는 외래 키 때문에 역순)
+ARCHIVED_TABLES = (models.Student.__table__, models.StudentApplication.__table__, models.Grade.__table__)
+MANIFEST_NAME = "manifest.json"
+# DB에서 한 번에 읽어 내보내는 행 수
+EXPORT_BATCH_SIZE = 1000
+
+def year_directory(academic_year: int) -> Path:
+    return Path(settings.ARCHIVE_DIR) / str(academic_year)
+
+def _archive_file(academic_year: int, table_name: str) -> Path:
+    return year_directory(academic_year) / f"{table_name}.jsonl.gz"
+
+def _table(table_name: str):
+    for table in ARCHIVED_TABLES:
+        if table.name == table_name:
+            return table
+    raise ValueError(f"보관 대상이 아닌 테이블입니다: {table_name}")
+
+def _json_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, (datetime, date)) else value
+
+def read_manifest(academic_year: int) -> Dict[str, Any]:
+    with open(year_directory(academic_year) / MANIFEST_NAME, encoding="utf-8") as file:
+        return json.load(file)
+
+def is_archived(academic_year: int) -> bool:
+    """manifest는 모든 파일을 쓰고 검증한 뒤에 생기므로 manifest가 있으면 보관 완료"""
+    return (year_directory(academic_year) / MANIFEST_NAME).exists()
+
+def list_archived_years() -> List[schemas.ArchivedYear]:
+    root = Path(settings.ARCHIVE_DIR)
+    if not root.is_dir():
+        return []
+    years = sorted(int(path.name) for path in root.iterdir() if path.name.isdigit() and (path / MANIFEST_NAME).exists())
+    return [schemas.ArchivedYear(**read_manifest(year)) for year in years]
+
+def read_archive(academic_year: int, table_name: str) -> Iterator[Dict[str, Any]]:
+    """보관 파일을 한 행씩 읽음 (파일 전체를 메모리에 올리지 않음)"""
+    _table(table_name)
+    with gzip.open(_archive_file(academic_year, table_name), "rt", encoding="utf-8") as file:
+        for line in file:
+            yield json.loads(line)
+
+def _matches(row: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    for column, expected in filters.items():
+        value = row.get(column)
+        if isinstance(expected, (list, tuple, set, frozenset)):
+            if value not in expected:
+                return False
+        elif value != expected:
+            return False
+    return True
+
+def year_rows(db: Session, academic_year: int, table_name: str, **filters) -> Iterator[Dict[str, Any]]:
+    """
+    Rows of one academic year as plain dicts, from the archive if the year has been
+    rolled over and from the database otherwise, so historical reads do not depend on
+    where the year currently lives.
+
+    Filters are column equalities; a list/set value matches any of its items.
+    """
+    table = _table(table_name)
+    if is_archived(academic_year):
+        return (row for row in read_archive(academic_year, table_name) if _matches(row, filters))
+    query = select(table).where(table.c.academic_year == academic_year)
+    for column, expected in filters.items():
+        if isinstance(expected, (list, tuple, set, frozenset)):
+            query = query.where(table.c[column].in_(list(expected)))
+        else:
+            query = query.where(table.c[column] == expected)
+    return (dict(row._mapping) for row in db.execute(query.order_by(table.c.id)))
+
+def _export(db: Session, table, academic_year: int) -> int:
+    """임시 파일에 쓴 뒤 이름을 바꿔 중간에 실패해도 불완전한 파일이 남지 않게 함"""
+    path = _archive_file(academic_year, table.name)
+    temporary = path.with_name(path.name + ".tmp")
+    query = select(table).where(table.c.academic_year == academic_year).order_by(table.c.id)
+    count = 0
+    with gzip.open(temporary, "wt", encoding="utf-8") as file:
+        for partition in db.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE)).partitions():
+            for row in partition:
+                file.write(json.dumps({key: _json_value(value) for key, value in row._mapping.items()}, ensure_ascii=False))
+                file.write("\n")
+                count += 1
+    os.replace(temporary, path)
+    return count
+
+def _hot_counts(db: Session, academic_year: int) -> Dict[str, int]:
+    return {
+        table.name: db.execute(select(func.count()).select_from(table).where(table.c.academic_year == academic_year)).scalar_one()
+        for table in ARCHIVED_TABLES
+    }
+
+def rollover(db: Session, academic_year: int) -> schemas.RolloverReport:
+    """
+    Archive a finished academic year and remove it from the hot tables.
+
+    Each table is exported to ARCHIVE_DIR/<year>/<table>.jsonl.gz and re-read to
+    check the row count; only then is manifest.json written and the year's rows
+    deleted in one transaction. Running it again after a crash resumes safely: an
+    existing manifest whose counts match the remaining hot rows just finishes the
+    delete. The year's application counters are deleted in the same transaction
+    and cached competition views are dropped.
+
+    Raises:
+        ValueError: for the current or a future year, a year with no data, or when an
+            existing archive does not match the rows still in the database
+    """
+    if academic_year >= models.current_academic_year():
+        raise ValueError(f"진행 중인 학년도({models.current_academic_year()})와 이후 학년도는 보관할 수 없습니다.")
+
+    hot_counts = _hot_counts(db, academic_year)
+    directory = year_directory(academic_year)
+    if is_archived(academic_year):
+        manifest = read_manifest(academic_year)
+        if not any(hot_counts.values()):
+            return schemas.RolloverReport(academic_year=academic_year, row_counts=manifest["row_counts"], archive_path=str(directory), already_archived=True)
+        if manifest["row_counts"] != hot_counts:
+            raise ValueError(f"{academic_year}학년도 보관 파일과 DB 행 수가 다릅니다: {manifest['row_counts']} != {hot_counts}")
+        row_counts = manifest["row_counts"]
+    else:
+        if not any(hot_counts.values()):
+            raise ValueError(f"{academic_year}학년도에 보관할 데이터가 없습니다.")
+        directory.mkdir(parents=True, exist_ok=True)
+        row_counts = {table.name: _export(db, table, academic_year) for table in ARCHIVED_TABLES}
+        for table_name, count in row_counts.items():
+            written = sum(1 for _ in read_archive(academic_year, table_name))
+            if written != count or count != hot_counts[table_name]:
+                raise ValueError(f"{table_name} 보관 검증 실패: DB {hot_counts[table_name]}행, 내보냄 {count}행, 파일 {written}행")
+        manifest = {"academic_year": academic_year, "row_counts": row_counts, "archived_at": datetime.utcnow().isoformat()}
+        temporary = directory / (MANIFEST_NAME + ".tmp")
+        temporary.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+        os.replace(temporary, directory / MANIFEST_NAME)
+
+    application = models.StudentApplication.__table__
+    school_ids = sorted(
+        school_id for (school_id,) in db.execute(
+            select(application.c.school_id).where(application.c.academic_year == academic_year, application.c.school_id.isnot(None)).distinct()
+        )
+    )
+    for table in reversed(ARCHIVED_TABLES):
+        db.execute(delete(table).where(table.c.academic_year == academic_year))
+    # 지원자 수 카운터는 지원서에서 다시 셀 수 있으므로 보관하지 않고 같은 트랜잭션에서 지움
+    counter = models.SchoolApplicationCounter.__table__
+    db.execute(delete(counter).where(counter.c.academic_year == academic_year))
+    db.commit()
+
+    application_snapshots.clear()
+    events.publish(events.APPLICATIONS_CHANGED, {"school_ids": school_ids, "academic_years": [academic_year]})
+    events.publish(events.ACADEMIC_YEAR_ARCHIVED, {"academic_year": academic_year})
+    return schemas.RolloverReport(academic_year=academic_year, row_counts=row_counts, archive_path=str(directory))
+
+def historical_applicants(db: Session, academic_year: int, school_id: int) -> schemas.HistoricalSchoolApplicants:
+    """지난 학년도 한 학교의 최종 순위 (지원서에 저장된 순위·백분율 기준)"""
+    applications = [
+        row for row in year_rows(db, academic_year, models.StudentApplication.__tablename__, school_id=school_id)
+        if row["rank_in_school"] is not None
+    ]
+    students = {row["id"]: row for row in year_rows(db, academic_year, models.Student.__tablename__, id={row["student_id"] for row in applications})}
+    applicants = []
+    for application in sorted(applications, key=lambda row: row["rank_in_school"]):
+        student = students.get(application["student_id"], {})
+        applicants.append(schemas.StudentRanking(
+            student_id=str(application["student_id"]),
+            student_name=student.get("name") or "",
+            rank=application["rank_in_school"],
+            percentile_rank=application["percentile_rank"] or 0.0,
+            is_priority_selection=bool(application["is_priority_selection"]),
+            priority_type=application["priority_type"],
+            priority_category=application["priority_category"],
+            school_name=student.get("school_id") or "",  # 소속 중학교 ID (스냅샷과 같음)
+            grade=student.get("grade") or 0,
+            class_number=student.get("class_number") or 0,
+            number=student.get("number") or 0,
+        ))
+    return schemas.HistoricalSchoolApplicants(
+        academic_year=academic_year,
+        school_id=str(school_id),
+        source="archive" if is_archived(academic_year) else "database",
+        applicants=applicants,
+    )
@@ -0,0 +1,65 @@
+# backend/src/services/competition_service.py
+# Province-wide competition overview
+
+import hashlib
+from typing import List, Tuple
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..database import models, schemas
+from ..utils import events
+from ..utils.cache import TTLCache
+
+_overview_adapter = TypeAdapter(List[schemas.CompetitionStatus])
+_overview_cache = TTLCache(settings.COMPETITION_OVERVIEW_TTL_SECONDS)
+
+def build_overview(db: Session) -> List[schemas.CompetitionStatus]:
+    """
+    Every school's CompetitionStatus from one query: schools outer-joined to the
+    current academic year's materialized application counters, so schools without
+    applicants this year report zeros.
+    """
+    counter = models.SchoolApplicationCounter
+    rows = (
+        db.query(models.School, counter)
+        .outerjoin(counter, (counter.school_id == models.School.id) & (counter.academic_year == models.current_academic_year()))
+        .order_by(models.School.id)
+        .all()
+    )
+    overview = []
+    for school, counts in rows:
+        general = counts.general_applicants if counts else 0
+        quota = school.actual_competition_quota or 0
+        overview.append(schemas.CompetitionStatus(
+            school_id=str(school.id),
+            school_name=school.name,
+            total_quota=school.total_quota or 0,
+            priority_within_quota=school.priority_within_quota or 0,
+            priority_outside_quota=school.priority_outside_quota or 0,
+            actual_competition_quota=quota,
+            statistics=schemas.CompetitionStatistics(
+                total_applicants=counts.total_applicants if counts else 0,
+                general_applicants=general,
+                priority_within_applicants=counts.priority_within_applicants if counts else 0,
+                priority_outside_applicants=counts.priority_outside_applicants if counts else 0,
+                competition_ratio=round(general / quota, 2) if quota else 0.0,
+            ),
+        ))
+    return overview
+
+def _render_overview(db: Session) -> Tuple[str, bytes]:
+    body = _overview_adapter.dump_json(build_overview(db))
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"', body
+
+def get_overview(db: Session) -> Tuple[str, bytes]:
+    """
+    Cached (ETag, JSON body) of the overview. The cache lives for
+    COMPETITION_OVERVIEW_TTL_SECONDS and is dropped on application or quota changes.
+    """
+    return _overview_cache.get_or_set("overview", lambda: _render_overview(db))
+
+def invalidate_overview(event=None):
+    _overview_cache.invalidate()
+
+events.subscribe(events.APPLICATIONS_CHANGED, invalidate_overview)
+events.subscribe(events.SCHOOL_QUOTA_CHANGED, invalidate_overview)
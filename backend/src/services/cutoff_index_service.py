@@ -0,0 +1,286 @@
+# backend/src/services/cutoff_index_service.py
+# Historical admission cutoff index: per-school, per-year quantile tables for fast acceptance estimates
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..database import models, schemas
+from ..utils import events
+from . import archive_service
+
+logger = logging.getLogger(__name__)
+
+# 분위수 표 해상도: 0%, 1%, ..., 100% 지점의 백분율 (학교·연도당 101개 float32)
+QUANTILE_LEVELS = np.linspace(0.0, 1.0, 101)
+# 보관된 학년도의 분위수 표 캐시 파일 (보관 데이터는 바뀌지 않으므로 한 번만 계산)
+CACHE_FILE_NAME = "cutoff_index.npz"
+
+@dataclass(frozen=True)
+class YearCutoffTable:
+    """
+    Quantile tables of one academic year for every school that had applicants.
+    Row i of each array belongs to school_ids[i]; percentiles are lower-is-better.
+    """
+    academic_year: int
+    school_ids: np.ndarray  # int64, 오름차순
+    applicants: np.ndarray  # int32, 백분율이 있는 지원자 수
+    accepted: np.ndarray  # int32, 합격자 수
+    accepted_quantiles: np.ndarray  # float32 [학교, 분위], 합격자 백분율 분위수 (합격자가 없으면 NaN)
+    applicant_quantiles: np.ndarray  # float32 [학교, 분위], 전체 지원자 백분율 분위수
+
+    def row(self, school_id: int) -> Optional[int]:
+        index = int(np.searchsorted(self.school_ids, school_id))
+        if index < len(self.school_ids) and self.school_ids[index] == school_id:
+            return index
+        return None
+
+def _quantile_rows(groups: List[np.ndarray]) -> np.ndarray:
+    table = np.full((len(groups), len(QUANTILE_LEVELS)), np.nan, dtype=np.float32)
+    for index, values in enumerate(groups):
+        if len(values):
+            table[index] = np.quantile(values, QUANTILE_LEVELS)
+    return table
+
+def build_year_table(academic_year: int, rows: Iterable[Dict]) -> YearCutoffTable:
+    """Reduce one year's application rows (school_id, percentile_rank, is_accepted) to quantile tables."""
+    school_ids, percentiles, accepted = [], [], []
+    for row in rows:
+        if row["school_id"] is None or row["percentile_rank"] is None:
+            continue
+        school_ids.append(row["school_id"])
+        percentiles.append(row["percentile_rank"])
+        accepted.append(bool(row["is_accepted"]))
+    school_ids = np.asarray(school_ids, dtype=np.int64)
+    percentiles = np.asarray(percentiles, dtype=np.float64)
+    accepted = np.asarray(accepted, dtype=bool)
+    if not len(school_ids):
+        empty = np.empty((0, len(QUANTILE_LEVELS)), dtype=np.float32)
+        return YearCutoffTable(academic_year, school_ids, np.empty(0, np.int32), np.empty(0, np.int32), empty, empty.copy())
+
+    unique_ids, school_index = np.unique(school_ids, return_inverse=True)
+    # 학교 순으로 정렬해 한 번에 나눔 (학교마다 다시 거르지 않음)
+    order = np.argsort(school_index, kind="stable")
+    bounds = np.cumsum(np.bincount(school_index, minlength=len(unique_ids)))[:-1]
+    applicant_groups = np.split(percentiles[order], bounds)
+    accepted_groups = [group[mask] for group, mask in zip(applicant_groups, np.split(accepted[order], bounds))]
+    return YearCutoffTable(
+        academic_year=academic_year,
+        school_ids=unique_ids,
+        applicants=np.array([len(group) for group in applicant_groups], dtype=np.int32),
+        accepted=np.array([len(group) for group in accepted_groups], dtype=np.int32),
+        accepted_quantiles=_quantile_rows(accepted_groups),
+        applicant_quantiles=_quantile_rows(applicant_groups),
+    )
+
+def _load_year_table(db: Session, academic_year: int) -> YearCutoffTable:
+    """보관된 학년도는 캐시 파일을 쓰고 읽음; DB에 남은 지난 학년도는 매번 계산"""
+    archived = archive_service.is_archived(academic_year)
+    path = archive_service.year_directory(academic_year) / CACHE_FILE_NAME
+    if archived and path.exists():
+        with np.load(path) as data:
+            return YearCutoffTable(academic_year=academic_year, **{name: data[name] for name in data.files})
+    rows = archive_service.year_rows(db, academic_year, models.StudentApplication.__tablename__)
+    table = build_year_table(academic_year, rows)
+    if archived:
+        temporary = path.with_name(path.name + ".tmp")
+        with open(temporary, "wb") as file:
+            np.savez(
+                file, school_ids=table.school_ids, applicants=table.applicants, accepted=table.accepted,
+                accepted_quantiles=table.accepted_quantiles, applicant_quantiles=table.applicant_quantiles,
+            )
+        temporary.replace(path)
+    return table
+
+def historical_years(db: Session) -> List[int]:
+    """기준 학년도: 보관된 연도와 DB에 남은 지난 연도 중 최근 CUTOFF_INDEX_YEARS개"""
+    current = models.current_academic_year()
+    application = models.StudentApplication.__table__
+    years = {year.academic_year for year in archive_service.list_archived_years()}
+    years.update(
+        year for (year,) in db.execute(select(application.c.academic_year).where(application.c.academic_year < current).distinct())
+    )
+    return sorted(year for year in years if year < current)[-settings.CUTOFF_INDEX_YEARS:]
+
+class CutoffIndex:
+    """
+    Lazily built, in-memory set of YearCutoffTables for the recent past years.
+
+    The index is rebuilt when a year is archived (ACADEMIC_YEAR_ARCHIVED), when an
+    application of a past year is written in this process (APPLICATIONS_CHANGED
+    naming that year, e.g. admission results recorded after the year ended), and
+    when the current academic year moves on; current-year writes leave it alone.
+    Past years still in the database can also be changed by other processes, so an
+    index holding any of them is rebuilt after CUTOFF_INDEX_TTL_SECONDS; one built
+    only from archives has no expiry.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tables: Optional[List[YearCutoffTable]] = None
+        # 표를 만든 시점의 현재 학년도, 다시 만들 시각 (보관된 연도만이면 None)
+        self._built_for: Optional[int] = None
+        self._expires_at: Optional[float] = None
+
+    def _is_fresh(self, current: int) -> bool:
+        return (
+            self._tables is not None and self._built_for == current
+            and (self._expires_at is None or time.monotonic() < self._expires_at)
+        )
+
+    def tables(self, db: Session) -> List[YearCutoffTable]:
+        current = models.current_academic_year()
+        tables = self._tables
+        if tables is not None and self._is_fresh(current):
+            return tables
+        with self._lock:
+            if not self._is_fresh(current):
+                years = historical_years(db)
+                self._tables = [_load_year_table(db, year) for year in years]
+                self._built_for = current
+                in_database = any(not archive_service.is_archived(year) for year in years)
+                self._expires_at = time.monotonic() + settings.CUTOFF_INDEX_TTL_SECONDS if in_database else None
+                logger.info(f"Built admission cutoff index for years {years}")
+            return self._tables
+
+    def invalidate(self):
+        with self._lock:
+            self._tables = None
+
+    def on_applications_changed(self, event: Dict):
+        """지난 학년도 지원서가 바뀐 경우에만 무효화 (올해 지원서 쓰기는 색인과 무관)"""
+        current = models.current_academic_year()
+        if any(year < current for year in event.get("academic_years", ())):
+            self.invalidate()
+
+    def estimate(self, db: Session, school_id: int, percentiles: Iterable[float], applicants: Optional[int] = None) -> Tuple[List[int], np.ndarray, np.ndarray]:
+        """
+        Acceptance estimates for many percentiles at once against one school's history.
+
+        The admission probability is the share of past years in which the percentile
+        was at or inside that year's cutoff (the lowest-ranked admitted percentile,
+        as reported by school_cutoffs), over the years in which the school admitted
+        anyone. The expected rank is the position the percentile would have had among
+        each year's applicants, scaled to `applicants` (defaults to the year's own
+        applicant count) and averaged over the same years.
+
+        Returns:
+            (years used, probabilities in % or NaN, ranks as float or NaN)
+        """
+        percentiles = np.asarray(list(percentiles), dtype=np.float64)
+        # 합격선은 float32로 저장되므로 같은 정밀도로 비교 (합격선과 같은 백분율이 밖으로 밀리지 않게)
+        comparable = percentiles.astype(np.float32)
+        admitted, ranks, years = [], [], []
+        for table in self.tables(db):
+            row = table.row(school_id)
+            if row is None or table.accepted[row] == 0:
+                continue
+            admitted.append(comparable <= table.accepted_quantiles[row][-1])
+            ahead = np.interp(percentiles, table.applicant_quantiles[row], QUANTILE_LEVELS, left=0.0, right=1.0)
+            pool = applicants if applicants is not None else int(table.applicants[row])
+            ranks.append(1.0 + ahead * max(pool - 1, 0))
+            years.append(table.academic_year)
+        if not years:
+            empty = np.full(len(percentiles), np.nan)
+            return [], empty, empty.copy()
+        return years, 100.0 * np.mean(admitted, axis=0), np.mean(ranks, axis=0)
+
+    def school_cutoffs(self, db: Session, school_id: int) -> List[schemas.SchoolYearCutoff]:
+        cutoffs = []
+        for table in self.tables(db):
+            row = table.row(school_id)
+            if row is None:
+                continue
+            quantiles = table.accepted_quantiles[row]
+            has_accepted = table.accepted[row] > 0
+            cutoffs.append(schemas.SchoolYearCutoff(
+                academic_year=table.academic_year,
+                applicants=int(table.applicants[row]),
+                accepted=int(table.accepted[row]),
+                cutoff_percentile=float(quantiles[-1]) if has_accepted else None,
+                median_accepted_percentile=float(quantiles[len(quantiles) // 2]) if has_accepted else None,
+            ))
+        return cutoffs
+
+# Create cutoff index instance
+cutoff_index = CutoffIndex()
+
+events.subscribe(events.ACADEMIC_YEAR_ARCHIVED, lambda event: cutoff_index.invalidate())
+events.subscribe(events.APPLICATIONS_CHANGED, cutoff_index.on_applications_changed)
+
+def _round_or_none(value: float, digits: Optional[int] = 1):
+    if np.isnan(value):
+        return None
+    return int(round(value)) if digits is None else round(float(value), digits)
+
+def estimate_percentiles(db: Session, request: schemas.AdmissionEstimateRequest) -> schemas.AdmissionEstimateResult:
+    """지정한 백분율 목록의 합격 가능성·예상 석차 (현재 지원자 수 기준)"""
+    # 올해 지원자만 센다 (카운터는 재집계 전까지 어긋날 수 있으므로 지원서를 직접 집계)
+    current_applicants = db.scalar(
+        select(func.count(models.StudentApplication.id)).where(
+            models.StudentApplication.academic_year == models.current_academic_year(),
+            models.StudentApplication.school_id == request.school_id,
+        )
+    ) or None
+    years, probabilities, ranks = cutoff_index.estimate(db, request.school_id, request.percentiles, current_applicants)
+    return schemas.AdmissionEstimateResult(
+        school_id=str(request.school_id),
+        years=years,
+        estimates=[
+            schemas.AdmissionEstimate(
+                percentile_rank=percentile,
+                student_rank=_round_or_none(rank, None),
+                admission_probability=_round_or_none(probability),
+            )
+            for percentile, probability, rank in zip(request.percentiles, probabilities, ranks)
+        ],
+    )
+
+def estimate_class(db: Session, middle_school_id: str, grade: int, class_number: int) -> List[schemas.ClassAdmissionEstimate]:
+    """
+    Estimates for every applying student of one class: two queries for the class's
+    applications, then one vectorized estimate per target school.
+
+    student_rank is the current rank among this year's applicants (kept up to date
+    on the application); admission_probability comes from the historical index.
+    """
+    rows = (
+        db.query(models.StudentApplication, models.Student)
+        .join(models.Student, models.StudentApplication.student_id == models.Student.id)
+        .filter(
+            models.Student.academic_year == models.current_academic_year(),
+            models.Student.school_id == middle_school_id,
+            models.Student.grade == grade,
+            models.Student.class_number == class_number,
+            models.StudentApplication.school_id.isnot(None),
+            models.StudentApplication.percentile_rank.isnot(None),
+        )
+        .order_by(models.Student.number)
+        .all()
+    )
+    by_school: Dict[int, List[int]] = {}
+    for index, (application, _) in enumerate(rows):
+        by_school.setdefault(application.school_id, []).append(index)
+
+    probabilities = np.full(len(rows), np.nan)
+    for school_id, indexes in by_school.items():
+        _, school_probabilities, _ = cutoff_index.estimate(db, school_id, [rows[index][0].percentile_rank for index in indexes])
+        probabilities[indexes] = school_probabilities
+
+    return [
+        schemas.ClassAdmissionEstimate(
+            student_id=str(student.id),
+            student_name=student.name or "",
+            number=student.number or 0,
+            school_id=str(application.school_id),
+            percentile_rank=application.percentile_rank,
+            student_rank=application.rank_in_school,
+            admission_probability=_round_or_none(probability),
+        )
+        for (application, student), probability in zip(rows, probabilities)
+    ]
@@ -0,0 +1,190 @@
+# backend/src/services/grade_job_service.py
+# Background job queue for grade file processing
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from fastapi import HTTPException, status
+from ..config import settings
+from ..database import schemas
+from ..database.session import SessionLocal
+from ..utils import metrics
+from ..utils.constants import JobStatus, UploadMode, UploadStatus
+from . import grade_service
+from .grade_validation_service import GradeValidationError
+
+class GradeJob:
+    """
+    Progress of a single grade file processing job.
+
+    Updated from a worker thread and read by request handlers; every state change
+    bumps `version` so websocket subscribers can push only when something changed.
+    """
+
+    def __init__(
+        self, content_hash: str, filename: str, school_id: str, uploaded_by: Optional[str],
+        mode: UploadMode = UploadMode.DIFF, confirm_deletes: bool = False,
+    ):
+        self.job_id = uuid.uuid4().hex
+        self.content_hash = content_hash
+        self.filename = filename
+        self.school_id = school_id
+        self.uploaded_by = uploaded_by
+        self.mode = mode
+        self.confirm_deletes = confirm_deletes
+        self.status = JobStatus.QUEUED
+        self.rows_processed = 0
+        self.total_rows = 0
+        self.errors = []
+        self.validation_report: Optional[schemas.GradeValidationReport] = None
+        self.result: Optional[schemas.GradeUploadResult] = None
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.version = 0
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.DUPLICATE)
+
+    def mark_running(self):
+        self.status = JobStatus.RUNNING
+        self.started_at = time.monotonic()
+        self.version += 1
+
+    def update_progress(self, rows_processed: int, total_rows: int):
+        self.rows_processed = rows_processed
+        self.total_rows = total_rows
+        self.version += 1
+
+    def mark_completed(self, result: schemas.GradeUploadResult):
+        self.result = result
+        self.rows_processed = result.processed_rows
+        self.total_rows = result.total_rows
+        # 같은 파일이 아직 처리 중이면 이 작업은 완료가 아님 (진행 상황만 전달)
+        in_progress = result.is_duplicate and result.status == UploadStatus.PROCESSING
+        self.status = JobStatus.DUPLICATE if in_progress else JobStatus.COMPLETED
+        self.finished_at = time.monotonic()
+        self.version += 1
+
+    def mark_failed(self, error: str, validation_report: Optional[schemas.GradeValidationReport] = None):
+        self.errors.append(error)
+        self.validation_report = validation_report
+        self.status = JobStatus.FAILED
+        self.finished_at = time.monotonic()
+        self.version += 1
+
+    def eta_seconds(self) -> Optional[float]:
+        """처리 속도 기준 예상 남은 시간"""
+        if self.status != JobStatus.RUNNING or not self.started_at or not self.rows_processed:
+            return None
+        elapsed = time.monotonic() - self.started_at
+        remaining = max(self.total_rows - self.rows_processed, 0)
+        return round(elapsed / self.rows_processed * remaining, 1)
+
+    def to_schema(self) -> schemas.GradeUploadJob:
+        return schemas.GradeUploadJob(
+            job_id=self.job_id,
+            status=self.status,
+            filename=self.filename,
+            rows_processed=self.rows_processed,
+            total_rows=self.total_rows,
+            errors=list(self.errors),
+            eta_seconds=self.eta_seconds(),
+            validation_report=self.validation_report,
+            result=self.result,
+            created_at=self.created_at.isoformat(),
+        )
+
+class GradeJobQueue:
+    """
+    Worker pool that parses and persists uploaded grade files outside the request.
+
+    Uploads return a job immediately; the same file submitted again by the same school
+    while its job is queued or running gets the existing job back instead of a second one,
+    or 409 if it asks for a different mode or confirm_deletes than the running job.
+    """
+
+    def __init__(self, max_workers: int = settings.GRADE_UPLOAD_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="grade-job")
+        self._jobs: Dict[str, GradeJob] = {}
+        self._active_by_hash: Dict[Tuple[str, str], str] = {}  # (school_id, content_hash) -> job_id
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        file_content: bytes,
+        filename: str,
+        school_id: str,
+        uploaded_by: Optional[str] = None,
+        mode: UploadMode = UploadMode.DIFF,
+        confirm_deletes: bool = False,
+    ) -> GradeJob:
+        content_hash = grade_service.compute_content_hash(file_content)
+        key = (school_id, content_hash)
+        with self._lock:
+            self._prune_finished()
+            active_job_id = self._active_by_hash.get(key)
+            if active_job_id:
+                active_job = self._jobs[active_job_id]
+                # 다른 옵션으로 다시 올린 파일을 기존 작업으로 돌려주면 새 옵션이 조용히 무시됨
+                if (active_job.mode, active_job.confirm_deletes) != (mode, confirm_deletes):
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail=f"같은 파일을 다른 옵션으로 처리 중입니다 (작업 {active_job_id}). 완료 후 다시 올려 주세요.",
+                    )
+                return active_job
+            job = GradeJob(content_hash, filename, school_id, uploaded_by, mode, confirm_deletes)
+            self._jobs[job.job_id] = job
+            self._active_by_hash[key] = job.job_id
+        self._executor.submit(self._run, job, file_content)
+        return job
+
+    def get(self, job_id: str) -> Optional[GradeJob]:
+        return self._jobs.get(job_id)
+
+    def active_count(self) -> int:
+        """대기 중이거나 실행 중인 작업 수"""
+        return len(self._active_by_hash)
+
+    def _run(self, job: GradeJob, file_content: bytes):
+        job.mark_running()
+        db = SessionLocal()
+        try:
+            result = grade_service.process_grades_file(
+                db,
+                file_content,
+                job.filename,
+                school_id=job.school_id,
+                uploaded_by=job.uploaded_by,
+                mode=job.mode,
+                progress_callback=job.update_progress,
+                confirm_deletes=job.confirm_deletes,
+            )
+            job.mark_completed(result)
+            if not result.is_duplicate:
+                metrics.GRADE_UPLOAD_ROWS.inc(result.processed_rows)
+        except GradeValidationError as e:
+            job.mark_failed(str(e), e.report)
+        except Exception as e:
+            job.mark_failed(str(e))
+        finally:
+            metrics.GRADE_UPLOAD_JOBS.inc(status=job.status.value)
+            db.close()
+            with self._lock:
+                self._active_by_hash.pop((job.school_id, job.content_hash), None)
+
+    def _prune_finished(self):
+        """보존 기간이 지난 완료 작업 정리 (lock 보유 상태에서 호출)"""
+        cutoff = time.monotonic() - settings.GRADE_JOB_RETENTION_SECONDS
+        expired = [job_id for job_id, job in self._jobs.items() if job.is_finished and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+# Create queue instance
+grade_job_queue = GradeJobQueue()
+
+metrics.registry.gauge("grade_upload_jobs_active", "Grade upload jobs queued or running", callback=grade_job_queue.active_count)
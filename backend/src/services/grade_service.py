@@ -1,33 +1,416 @@
 # backend/src/services/grade_service.py
 # Business logic for grade operations
 
-from sqlalchemy.orm import Session
+import csv
+import hashlib
+import io
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 from ..database import models, schemas
+from ..database.session import get_db
+from ..utils import events
+from ..utils.constants import UploadStatus, UploadMode, PERCENTILE_SUBJECT
+from . import application_service, ranking_service
+from .application_snapshot_service import application_snapshots
+from .grade_validation_service import rows_to_columns, validate_grade_columns, GradeValidationError
 
-def get_db():
-    # Placeholder for DB session
-    yield None
+# 한 번에 커밋하는 행 수 (재업로드 시 마지막으로 커밋된 청크부터 재개)
+UPLOAD_CHUNK_SIZE = 500
+# 처리 중인 업로드가 이 시간 이상 갱신되지 않으면 중단된 것으로 보고 재개 허용
+UPLOAD_STALE_AFTER = timedelta(minutes=5)
+# 성적 파일 첫 행은 머리글
+HEADER_ROWS = 1
 
 def get_student(db: Session, student_id: int):
-    # return db.query(models.Student).filter(models.Student.id == student_id).first()
-    return None
+    return db.query(models.Student).filter(models.Student.id == student_id).first()
 
 def get_grades_by_student_id(db: Session, student_id: int):
-    # return db.query(models.Grade).filter(models.Grade.student_id == student_id).all()
-    return []
-
-def process_grades_file(db: Session, file_content: bytes, filename: str):
-    # This function would parse the file_content (CSV/XLSX)
-    # and save the grades to the database.
-    # Example (simplified):
-    # import pandas as pd
-    # if filename.endswith('.csv'):
-    #     df = pd.read_csv(io.BytesIO(file_content))
-    # elif filename.endswith('.xlsx'):
-    #     df = pd.read_excel(io.BytesIO(file_content))
-    #
-    # for index, row in df.iterrows():
-    #     grade = models.Grade(student_id=row['student_id'], subject=row['subject'], score=row['score'])
-    #     db.add(grade)
-    # db.commit()
-    pass
+    return db.query(models.Grade).filter(models.Grade.student_id == student_id).order_by(models.Grade.id).all()
+
+def to_grade_schema(grade: models.Grade) -> schemas.Grade:
+    return schemas.Grade(
+        id=str(grade.id),
+        student_id=str(grade.student_id),
+        subject=grade.subject,
+        score=grade.score,
+        percentile_rank=grade.percentile_rank,
+    )
+
+def compute_content_hash(file_content: bytes) -> str:
+    return hashlib.sha256(file_content).hexdigest()
+
+def get_upload_by_hash(db: Session, school_id: str, content_hash: str):
+    return (
+        db.query(models.GradeUpload)
+        .filter(models.GradeUpload.school_id == school_id, models.GradeUpload.content_hash == content_hash)
+        .first()
+    )
+
+def compute_data_fingerprint(db: Session, school_id: str) -> str:
+    """학교의 현재 학년도 학생 데이터 해시 (학생 식별 열과 행 해시 기준)"""
+    rows = (
+        db.query(models.Student.grade, models.Student.class_number, models.Student.number, models.Student.row_hash)
+        .filter(models.Student.academic_year == models.current_academic_year(), models.Student.school_id == school_id)
+        .order_by(models.Student.grade, models.Student.class_number, models.Student.number)
+    )
+    digest = hashlib.sha256()
+    for grade, class_number, number, row_hash in rows:
+        digest.update(f"{grade}\x1f{class_number}\x1f{number}\x1f{row_hash}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+def _read_rows(file_content: bytes, filename: str) -> list[tuple]:
+    """(시트 행 번호, 행 값) 목록. 머리글과 빈 행은 제외"""
+    if filename.endswith('.csv'):
+        rows = list(csv.reader(io.StringIO(file_content.decode('utf-8-sig'))))
+    else:
+        from openpyxl import load_workbook
+        workbook = load_workbook(io.BytesIO(file_content), read_only=True, data_only=True)
+        try:
+            rows = [list(row) for row in workbook.active.iter_rows(values_only=True)]
+        finally:
+            workbook.close()
+    return [
+        (row_number, row)
+        for row_number, row in enumerate(rows[HEADER_ROWS:], start=HEADER_ROWS + 1)
+        if any(cell not in (None, "") for cell in row)
+    ]
+
+def parse_grades_file(file_content: bytes, filename: str) -> list[schemas.StudentFromExcel]:
+    """
+    Parse and validate a CSV/XLSX grade sheet.
+
+    Raises GradeValidationError with the full per-cell report if any cell is invalid.
+    """
+    numbered_rows = _read_rows(file_content, filename)
+    columns = rows_to_columns([row for _, row in numbered_rows])
+    report, students = validate_grade_columns(columns, [row_number for row_number, _ in numbered_rows])
+    if report.error_count:
+        raise GradeValidationError(report)
+    return students
+
+def _student_key(grade: int, class_number: int, number: int) -> tuple:
+    return (grade, class_number, number)
+
+def _load_students(db: Session, school_id: str) -> dict:
+    students = (
+        db.query(models.Student)
+        .options(selectinload(models.Student.grades))
+        .filter(models.Student.academic_year == models.current_academic_year(), models.Student.school_id == school_id)
+        .all()
+    )
+    return {_student_key(s.grade, s.class_number, s.number): s for s in students}
+
+def compute_row_hash(row: schemas.StudentFromExcel) -> str:
+    """학생 식별 열(A–C)을 제외한 값의 해시 (변경 감지용)"""
+    return hashlib.sha256(f"{row.name}\x1f{row.gender}\x1f{row.percentile_rank!r}".encode("utf-8")).hexdigest()
+
+class GradeDiff:
+    """Row-level difference between an uploaded sheet and the stored students of a school."""
+
+    def __init__(self):
+        self.inserts: list[schemas.StudentFromExcel] = []
+        self.updates: list[tuple] = []  # (models.Student, schemas.StudentFromExcel)
+        self.deletes: list[models.Student] = []
+        self.held: list[models.Student] = []  # 지원서가 있어 확인 없이는 삭제하지 않는 학생
+        self.unchanged = 0
+
+    @property
+    def operations(self) -> list[tuple]:
+        # 삭제는 시트 행이 아니므로 먼저 처리 (진행률은 시트 행 기준)
+        return (
+            [("delete", student) for student in self.deletes]
+            + [("insert", row) for row in self.inserts]
+            + [("update", pair) for pair in self.updates]
+        )
+
+def diff_grade_rows(students: dict, rows: list[schemas.StudentFromExcel], full_roster: bool = False) -> GradeDiff:
+    """
+    Match sheet rows to stored students by (grade, class_number, number) within a school.
+
+    Students missing from the sheet are deleted only within the (학년, 반) pairs the
+    sheet contains, so a sheet with one class never removes the other classes. With
+    full_roster the sheet is taken as the complete list of its 학년 and missing
+    students of every class of those 학년 are deleted.
+    """
+    diff = GradeDiff()
+    seen = set()
+    for row in rows:
+        key = _student_key(row.grade, row.class_number, row.number)
+        seen.add(key)
+        student = students.get(key)
+        if student is None:
+            diff.inserts.append(row)
+        elif student.row_hash != compute_row_hash(row):
+            diff.updates.append((student, row))
+        else:
+            diff.unchanged += 1
+    if full_roster:
+        in_scope = lambda student: student.grade in {row.grade for row in rows}
+    else:
+        sheet_classes = {(row.grade, row.class_number) for row in rows}
+        in_scope = lambda student: (student.grade, student.class_number) in sheet_classes
+    diff.deletes = [student for key, student in students.items() if key not in seen and in_scope(student)]
+    return diff
+
+def _hold_students_with_applications(db: Session, diff: GradeDiff):
+    """지원서가 있는 학생은 삭제 대상에서 빼서 확인을 받음 (지원서까지 지워지므로)"""
+    if not diff.deletes:
+        return
+    applied = {
+        student_id for (student_id,) in
+        db.query(models.StudentApplication.student_id)
+        .filter(models.StudentApplication.student_id.in_([student.id for student in diff.deletes]))
+        .distinct()
+    }
+    diff.held = [student for student in diff.deletes if student.id in applied]
+    diff.deletes = [student for student in diff.deletes if student.id not in applied]
+
+def _current_percentile_grade(student: models.Student):
+    grades = [grade for grade in student.grades if grade.subject == PERCENTILE_SUBJECT]
+    return max(grades, key=lambda grade: grade.id or 0) if grades else None
+
+def _apply_operation(db: Session, upload: models.GradeUpload, kind: str, target, students: dict) -> set:
+    """한 행을 반영하고, 지원서를 지운 경우 그 지원 학교 ID 반환"""
+    if kind == "insert":
+        _save_chunk(db, upload, [target], students)
+    elif kind == "update":
+        student, row = target
+        student.name = row.name
+        student.gender = row.gender
+        student.row_hash = compute_row_hash(row)
+        grade = _current_percentile_grade(student)
+        if grade is None:
+            student.grades.append(models.Grade(subject=PERCENTILE_SUBJECT, percentile_rank=row.percentile_rank, upload=upload))
+        else:
+            grade.percentile_rank = row.percentile_rank
+            grade.upload = upload
+    else:
+        student = target
+        # 지원서 삭제는 카운터 갱신과 함께 (같은 트랜잭션)
+        school_ids = application_service.delete_student_applications(db, student.applications)
+        for grade in list(student.grades):
+            db.delete(grade)
+        db.delete(student)
+        students.pop(_student_key(student.grade, student.class_number, student.number), None)
+        return school_ids
+    return set()
+
+def _affected_school_ids(db: Session, diff: GradeDiff) -> set:
+    """순위가 바뀌는 지원 고등학교 (수정·삭제된 학생의 지원 학교)"""
+    student_ids = [student.id for student, _ in diff.updates] + [student.id for student in diff.deletes]
+    if not student_ids:
+        return set()
+    rows = (
+        db.query(models.StudentApplication.school_id)
+        .filter(models.StudentApplication.student_id.in_(student_ids), models.StudentApplication.school_id.isnot(None))
+        .distinct()
+    )
+    return {school_id for (school_id,) in rows}
+
+def _apply_diff(
+    db: Session, upload: models.GradeUpload, rows: list, students: dict, progress_callback,
+    full_roster: bool = False, confirm_deletes: bool = False,
+) -> schemas.GradeChangeSummary:
+    """
+    Write only inserted, changed and removed rows, in committed chunks.
+
+    Students who have applications are only deleted with confirm_deletes; otherwise
+    they are kept and listed in held_student_ids. Progress is reported in sheet rows
+    (unchanged rows count as done) against upload.total_rows.
+
+    Applying a diff is idempotent, so a resumed upload recomputes the diff against the
+    current tables and continues with whatever is left.
+    """
+    diff = diff_grade_rows(students, rows, full_roster=full_roster)
+    if not confirm_deletes:
+        _hold_students_with_applications(db, diff)
+    affected_school_ids = _affected_school_ids(db, diff)
+    operations = diff.operations
+    changed_school_ids = set()
+    upload.processed_rows = diff.unchanged
+    if progress_callback:
+        progress_callback(upload.processed_rows, upload.total_rows)
+    for start in range(0, len(operations), UPLOAD_CHUNK_SIZE):
+        chunk = operations[start:start + UPLOAD_CHUNK_SIZE]
+        for kind, target in chunk:
+            changed_school_ids.update(_apply_operation(db, upload, kind, target, students))
+        upload.processed_rows += sum(1 for kind, _ in chunk if kind != "delete")
+        upload.updated_at = datetime.utcnow()
+        db.commit()
+        if progress_callback:
+            progress_callback(upload.processed_rows, upload.total_rows)
+
+    for school_id in sorted(affected_school_ids):
+        ranking_service.recompute_school_rankings(db, school_id)
+        application_snapshots.refresh(school_id, db)
+    if changed_school_ids:
+        events.publish(events.APPLICATIONS_CHANGED, {"school_ids": sorted(changed_school_ids)})
+
+    return schemas.GradeChangeSummary(
+        inserted=len(diff.inserts),
+        updated=len(diff.updates),
+        deleted=len(diff.deletes),
+        unchanged=diff.unchanged,
+        affected_school_ids=sorted(affected_school_ids),
+        held_student_ids=[str(student.id) for student in diff.held],
+    )
+
+def _save_chunk(db: Session, upload: models.GradeUpload, rows: list[schemas.StudentFromExcel], students: dict):
+    for row in rows:
+        key = _student_key(row.grade, row.class_number, row.number)
+        student = students.get(key)
+        if student is None:
+            student = models.Student(
+                school_id=upload.school_id,
+                grade=row.grade,
+                class_number=row.class_number,
+                number=row.number,
+                student_id_number=f"{upload.school_id}-{row.grade}-{row.class_number:02d}-{row.number:02d}",
+            )
+            db.add(student)
+            students[key] = student
+        student.name = row.name
+        student.gender = row.gender
+        student.row_hash = compute_row_hash(row)
+        student.grades.append(models.Grade(subject=PERCENTILE_SUBJECT, percentile_rank=row.percentile_rank, upload=upload))
+
+def _upload_result(upload: models.GradeUpload, message: str, is_duplicate: bool = False) -> schemas.GradeUploadResult:
+    return schemas.GradeUploadResult(
+        upload_id=upload.id,
+        content_hash=upload.content_hash,
+        filename=upload.filename,
+        status=upload.status,
+        total_rows=upload.total_rows,
+        processed_rows=upload.processed_rows,
+        is_duplicate=is_duplicate,
+        message=message,
+    )
+
+def _can_reuse_result(db: Session, upload: models.GradeUpload, mode: UploadMode, confirm_deletes: bool) -> bool:
+    """
+    A completed upload of the same file can be returned as-is only if it ran in the
+    same mode, the school's data has not changed since, and it is not being re-sent
+    to confirm deletes it held back.
+    """
+    if upload.mode != mode.value or upload.data_fingerprint != compute_data_fingerprint(db, upload.school_id):
+        return False
+    if confirm_deletes:
+        previous = schemas.GradeUploadResult.model_validate_json(upload.result)
+        return not (previous.changes and previous.changes.held_student_ids)
+    return True
+
+def process_grades_file(
+    db: Session,
+    file_content: bytes,
+    filename: str,
+    school_id: str,
+    uploaded_by: str = None,
+    mode: UploadMode = UploadMode.DIFF,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    confirm_deletes: bool = False,
+) -> schemas.GradeUploadResult:
+    """
+    Parse a grade sheet and save its rows, idempotently.
+
+    Uploads are tracked per school by the SHA-256 of the file content:
+    - an identical file that already completed returns the stored result without
+      reprocessing, unless the school's data has changed since (e.g. reverting to an
+      earlier sheet), in which case it is processed again
+    - an identical file still being processed returns its current progress
+    - a failed or stalled upload resumes from the last committed chunk
+
+    In DIFF mode rows are matched to the school's stored students and only inserts,
+    updates and deletes are written; rankings are recomputed for the high schools whose
+    applicants changed. Deletes are limited to the classes in the sheet, or to the
+    whole 학년 in FULL mode, and students with applications are only deleted with
+    confirm_deletes. In APPEND mode every row is saved as a new Grade, in chunks of
+    UPLOAD_CHUNK_SIZE whose rows are committed together with the upload's
+    processed_rows, so a resume never duplicates rows.
+    progress_callback, if given, is called after each commit with (done, total) sheet rows.
+    """
+    content_hash = compute_content_hash(file_content)
+    upload = get_upload_by_hash(db, school_id, content_hash)
+
+    if upload is not None:
+        if upload.status == UploadStatus.COMPLETED:
+            if _can_reuse_result(db, upload, mode, confirm_deletes):
+                return schemas.GradeUploadResult.model_validate_json(upload.result).model_copy(
+                    update={"is_duplicate": True, "message": "이미 처리된 파일입니다. 이전 처리 결과를 반환합니다."}
+                )
+            # 처리 이후 학교 데이터가 바뀜: 같은 파일이라도 처음부터 다시 반영
+            upload.processed_rows = 0
+            upload.result = None
+        elif upload.status == UploadStatus.PROCESSING and datetime.utcnow() - upload.updated_at < UPLOAD_STALE_AFTER:
+            return _upload_result(upload, "동일한 파일을 처리 중입니다.", is_duplicate=True)
+
+    rows = parse_grades_file(file_content, filename)
+    now = datetime.utcnow()
+
+    if upload is None:
+        upload = models.GradeUpload(
+            content_hash=content_hash,
+            filename=filename,
+            school_id=school_id,
+            uploaded_by=uploaded_by,
+            status=UploadStatus.PROCESSING,
+            mode=mode.value,
+            total_rows=len(rows),
+            processed_rows=0,
+            created_at=now,
+            updated_at=now,
+        )
+        db.add(upload)
+    else:
+        # 실패했거나 중단된 업로드: 마지막으로 커밋된 청크부터 재개 (다시 반영하는 경우 처음부터)
+        if upload.mode != mode.value:
+            # 다른 방식으로 처리하던 기록은 이어받지 않음
+            upload.processed_rows = 0
+        upload.status = UploadStatus.PROCESSING
+        upload.mode = mode.value
+        upload.error = None
+        upload.updated_at = now
+    try:
+        db.commit()
+    except IntegrityError:
+        # 동일한 파일의 동시 재시도가 먼저 업로드 기록을 만든 경우
+        db.rollback()
+        return _upload_result(get_upload_by_hash(db, school_id, content_hash), "동일한 파일을 처리 중입니다.", is_duplicate=True)
+    db.refresh(upload)
+
+    students = _load_students(db, upload.school_id)
+    changes = None
+    try:
+        if mode in (UploadMode.DIFF, UploadMode.FULL):
+            changes = _apply_diff(
+                db, upload, rows, students, progress_callback,
+                full_roster=mode == UploadMode.FULL, confirm_deletes=confirm_deletes,
+            )
+        else:
+            if progress_callback:
+                progress_callback(upload.processed_rows, upload.total_rows)
+            for start in range(upload.processed_rows, len(rows), UPLOAD_CHUNK_SIZE):
+                chunk = rows[start:start + UPLOAD_CHUNK_SIZE]
+                _save_chunk(db, upload, chunk, students)
+                upload.processed_rows = start + len(chunk)
+                upload.updated_at = datetime.utcnow()
+                db.commit()
+                if progress_callback:
+                    progress_callback(upload.processed_rows, upload.total_rows)
+    except Exception as e:
+        db.rollback()
+        upload.status = UploadStatus.FAILED
+        upload.error = str(e)
+        upload.updated_at = datetime.utcnow()
+        db.commit()
+        raise
+
+    upload.status = UploadStatus.COMPLETED
+    result = _upload_result(upload, f"'{filename}' 파일의 {upload.total_rows}개 행을 처리했습니다.")
+    result.changes = changes
+    upload.result = result.model_dump_json()
+    upload.data_fingerprint = compute_data_fingerprint(db, upload.school_id)
+    upload.updated_at = datetime.utcnow()
+    db.commit()
+    return result
@@ -0,0 +1,204 @@
+# backend/src/services/grade_validation_service.py
+# Column-wise validation of uploaded grade sheets
+
+from typing import Dict, List, Tuple
+from pydantic import TypeAdapter
+from ..database import schemas
+from ..utils.lazy import LazyProxy
+
+# 엑셀 열 위치 (A=0): A 학년, B 반, C 번호, D 성명, E 성별, O 내신석차백분율
+EXCEL_COLUMNS = {
+    "grade": 0,
+    "class_number": 1,
+    "number": 2,
+    "name": 3,
+    "gender": 4,
+    "percentile_rank": 14,
+}
+COLUMN_LETTERS = {field: chr(ord("A") + index) for field, index in EXCEL_COLUMNS.items()}
+
+# 허용 범위 (양 끝 포함)
+GRADE_RANGE = (1, 3)
+CLASS_NUMBER_RANGE = (1, 20)
+NUMBER_RANGE = (1, 99)
+PERCENTILE_RANGE = (0.0, 100.0)
+# 중복 검사에서 (학년, 반, 번호)를 int64 하나로 묶을 수 있는 값의 절댓값 상한 (필드당 21비트)
+KEY_FIELD_LIMIT = 2 ** 20
+
+# 통과한 행을 한 번에 StudentFromExcel로 만드는 검증기 (첫 사용 시 생성)
+_student_rows = LazyProxy(lambda: TypeAdapter(List[schemas.StudentFromExcel]))
+
+class GradeValidationError(ValueError):
+    """Raised when a grade sheet has invalid cells; carries the full report."""
+
+    def __init__(self, report: schemas.GradeValidationReport):
+        self.report = report
+        super().__init__(f"성적 파일에 오류가 {report.error_count}건 있습니다.")
+
+def rows_to_columns(rows: List[list]) -> Dict[str, list]:
+    """행 목록을 A–E, O 열별 배열로 변환"""
+    return {
+        field: [row[index] if index < len(row) else None for row in rows]
+        for field, index in EXCEL_COLUMNS.items()
+    }
+
+def _text_column(values: list):
+    """열을 (앞뒤 공백을 뺀 문자열 배열, 빈 칸 마스크)로 변환"""
+    import numpy as np
+    array = np.array(values)
+    if array.dtype.kind != "U":
+        # 빈 칸(None)이 섞인 열: None은 빈 문자열로
+        raw = np.array(values, dtype=object)
+        array = np.where(raw == None, "", raw).astype(str)  # noqa: E711 (원소별 비교)
+    text = np.strings.strip(array)
+    return text, text == ""
+
+def _signed_decimal(text, allow_point: bool = True):
+    """부호 한 개까지와 숫자(소수점 한 개까지)로만 된 문자열인지"""
+    import numpy as np
+    unsigned = np.strings.lstrip(text, "+-")
+    single_sign = np.strings.str_len(text) - np.strings.str_len(unsigned) <= 1
+    if not allow_point:
+        return single_sign & np.strings.isdecimal(unsigned)
+    head, _, tail = np.strings.partition(unsigned, ".")
+    head_ok = np.strings.isdecimal(head) | (head == "")
+    tail_ok = np.strings.isdecimal(tail) | (tail == "")
+    return single_sign & head_ok & tail_ok & ((head != "") | (tail != ""))
+
+def _numeric_column(values: list):
+    """
+    Parse one column to float64 with its blank and parsed masks.
+
+    Cells read from xlsx are usually numbers already and are taken as-is; anything
+    else is parsed from text in C. Cells that are not plain decimal or exponent
+    notation (text, booleans, 'nan', 'inf') are flagged as not parsed.
+    """
+    import numpy as np
+    array = np.array(values)
+    # 모두 숫자인 열 (bool은 숫자로 보지 않음)
+    if array.dtype.kind in "iuf" and bool not in set(map(type, values)):
+        numbers = array.astype(np.float64)
+        return numbers, np.zeros(len(values), dtype=bool), np.isfinite(numbers)
+    text, blank = _text_column(values)
+    # 깨끗한 열(대부분의 CSV)은 한 번에 변환. 변환 실패, ASCII가 아닌 숫자, '1_000' 같은
+    # 표기는 아래 셀별 판정으로 (float()만 받아들이는 표기를 허용하지 않도록)
+    if not (np.strings.find(text, "_") >= 0).any():
+        try:
+            numbers = text.astype(np.bytes_).astype(np.float64)
+            return numbers, blank, np.isfinite(numbers)
+        except (UnicodeEncodeError, ValueError):
+            pass
+    mantissa, marker, exponent = np.strings.partition(np.strings.lower(text), "e")
+    parsed = _signed_decimal(mantissa) & ((marker == "") | _signed_decimal(exponent, allow_point=False))
+    return np.where(parsed, text, "nan").astype(np.float64), blank, parsed
+
+def _check_column(field: str, raw: list, blank, parsed, values, bounds: Tuple, type_message: str, row_numbers: List[int], errors: list):
+    """
+    Missing/type/range check of one whole column with array comparisons; Python only
+    runs for the cells that fail. Returns the mask of valid cells.
+    """
+    import numpy as np
+    low, high = bounds
+    column = COLUMN_LETTERS[field]
+    valid = parsed & (values >= low) & (values <= high)
+    for index in np.flatnonzero(~valid).tolist():
+        if blank[index]:
+            message = "값이 비어 있습니다."
+        elif not parsed[index]:
+            message = type_message
+        else:
+            message = f"{low}–{high} 범위를 벗어났습니다."
+        value = raw[index]
+        errors.append(schemas.GradeCellError(row=row_numbers[index], column=column, field=field, value=str(value) if value is not None else None, message=message))
+    return valid
+
+def _duplicate_key_errors(keys, candidates, row_numbers: List[int], errors: list):
+    """같은 (학년, 반, 번호)가 여러 행에 있으면 모두 보고. 중복된 행의 위치를 반환"""
+    import numpy as np
+    if not len(candidates):
+        return candidates
+    if np.abs(keys).max() < KEY_FIELD_LIMIT:
+        # 세 값을 21비트씩 int64 하나로 묶어 1차원 정렬로 비교
+        shifted = keys.astype(np.int64) + KEY_FIELD_LIMIT
+        _, inverse, counts = np.unique((shifted[:, 0] << 42) | (shifted[:, 1] << 21) | shifted[:, 2], return_inverse=True, return_counts=True)
+    else:
+        _, inverse, counts = np.unique(keys, axis=0, return_inverse=True, return_counts=True)
+    inverse = inverse.reshape(-1)
+    duplicated = counts[inverse] > 1
+    if not duplicated.any():
+        return candidates[duplicated]
+    # 같은 키끼리 모이도록 정렬해 한 번에 나눔 (시트 순서 유지)
+    order = np.argsort(inverse[duplicated], kind="stable")
+    groups = inverse[duplicated][order]
+    for group in np.split(candidates[duplicated][order], np.flatnonzero(np.diff(groups)) + 1):
+        indexes = group.tolist()
+        duplicate_rows = ", ".join(str(row_numbers[index]) for index in indexes)
+        errors.extend(
+            schemas.GradeCellError(row=row_numbers[index], column=COLUMN_LETTERS["number"], field="number", value=str(int(keys[position, 2])), message=f"같은 학년·반·번호가 중복되었습니다 (행 {duplicate_rows}).")
+            for position, index in zip(np.searchsorted(candidates, group).tolist(), indexes)
+        )
+    return candidates[duplicated]
+
+def validate_grade_columns(columns: Dict[str, list], row_numbers: List[int]) -> Tuple[schemas.GradeValidationReport, List[schemas.StudentFromExcel]]:
+    """
+    Validate every cell of a grade sheet with NumPy array operations, one pass per column.
+
+    Checks missing cells, types, ranges (학년, 반 1–20, 번호, 백분율 0–100) and duplicate
+    (학년, 반, 번호) keys, and collects every error instead of stopping at the first one.
+    Python only loops over failing cells; the rows that pass become StudentFromExcel
+    in a single batch validation call.
+
+    Args:
+        columns: Values per field from rows_to_columns
+        row_numbers: Sheet row number of each entry, for the report
+
+    Returns:
+        The validation report and StudentFromExcel rows for the rows without errors
+    """
+    # NumPy는 첫 업로드 검증 시 로드 (라우트 import 시간에 포함되지 않게)
+    import numpy as np
+    if not row_numbers:
+        return schemas.GradeValidationReport(total_rows=0, valid_rows=0, error_count=0, errors=[]), []
+    errors: List[schemas.GradeCellError] = []
+    valid = np.ones(len(row_numbers), dtype=bool)
+
+    values, parsed = {}, {}
+    for field, bounds in (("grade", GRADE_RANGE), ("class_number", CLASS_NUMBER_RANGE), ("number", NUMBER_RANGE)):
+        values[field], blank, parsed[field] = _numeric_column(columns[field])
+        # 정수 열: 소수부가 있으면 형식 오류 (3.0은 허용)
+        parsed[field] &= np.isfinite(values[field]) & (values[field] == np.trunc(values[field]))
+        valid &= _check_column(field, columns[field], blank, parsed[field], values[field], bounds, "정수가 아닙니다.", row_numbers, errors)
+    percentiles, blank, parsed_percentiles = _numeric_column(columns["percentile_rank"])
+    valid &= _check_column("percentile_rank", columns["percentile_rank"], blank, parsed_percentiles, percentiles, PERCENTILE_RANGE, "숫자가 아닙니다.", row_numbers, errors)
+
+    texts = {}
+    for field in ("name", "gender"):
+        texts[field], blank = _text_column(columns[field])
+        valid &= ~blank
+        errors.extend(
+            schemas.GradeCellError(row=row_numbers[index], column=COLUMN_LETTERS[field], field=field, value=None, message="값이 비어 있습니다.")
+            for index in np.flatnonzero(blank).tolist()
+        )
+
+    # 세 열이 모두 정수로 읽힌 행끼리 비교 (범위 밖 값도 중복이면 보고)
+    candidates = np.flatnonzero(parsed["grade"] & parsed["class_number"] & parsed["number"])
+    keys = np.stack([values[field][candidates] for field in ("grade", "class_number", "number")], axis=1)
+    valid[_duplicate_key_errors(keys, candidates, row_numbers, errors)] = False
+
+    # 오류 없는 행만 한 번의 배치 검증으로 모델 생성
+    rows = np.flatnonzero(valid)
+    valid_rows = _student_rows.validate_python([
+        {"grade": grade, "class_number": class_number, "number": number, "name": name, "gender": gender, "percentile_rank": percentile}
+        for grade, class_number, number, name, gender, percentile in zip(
+            *(values[field][rows].astype(np.int64).tolist() for field in ("grade", "class_number", "number")),
+            texts["name"][rows].tolist(), texts["gender"][rows].tolist(), percentiles[rows].tolist(),
+        )
+    ])
+    errors.sort(key=lambda error: (error.row, error.column))
+    report = schemas.GradeValidationReport(
+        total_rows=len(row_numbers),
+        valid_rows=len(valid_rows),
+        error_count=len(errors),
+        errors=errors,
+    )
+    return report, valid_rows
@@ -0,0 +1,666 @@
+# backend/src/services/notification_service.py
+# Outbox-driven notification delivery: batching, dedupe, retries and per-recipient digests
+
+import asyncio
+import base64
+import binascii
+import logging
+import smtplib
+import threading
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from fastapi import HTTPException, status
+from ..config import settings
+from ..database import schemas
+from ..database.hydration import hydrate
+from ..utils import metrics
+from ..utils.constants import NotificationChannel, OutboxStatus
+from ..utils.firestore_tracing import TracedClient
+from ..utils.lazy import LazyProxy
+
+logger = logging.getLogger(__name__)
+
+def _firestore_client():
+    from ..database.firebase_config import db as firestore_db
+    return TracedClient(firestore_db)
+
+# Firestore 클라이언트는 첫 사용 시 초기화 (firebase_admin import 지연)
+db = LazyProxy(_firestore_client)
+
+OUTBOX_COLLECTION = "notification_outbox"
+NOTIFICATIONS_COLLECTION = "notifications"
+# 사용자별 읽지 않은 알림 수 (문서 id = uid)
+COUNTERS_COLLECTION = "notification_counters"
+# Firestore 일괄 쓰기 한 번에 담을 수 있는 최대 문서 수
+BATCH_WRITE_LIMIT = 500
+# 재시도 대기 상한 (초)
+MAX_RETRY_DELAY_SECONDS = 300
+# 읽음 처리·카운터 재계산이 다른 쓰기와 충돌할 때 다시 읽고 시도하는 횟수
+CONFLICT_ATTEMPTS = 5
+
+NOTIFICATIONS_SENT = metrics.registry.counter("notifications_sent_total", "Notification messages delivered", ("channel", "kind"))
+def _increment(amount: int):
+    """카운터 필드 원자적 증감 (google-cloud-firestore는 첫 사용 시 import)"""
+    from google.cloud.firestore import Increment
+    return Increment(amount)
+
+def _write_conflicts() -> Tuple[type, ...]:
+    """create() 대상이 이미 있음 / last_update_time 조건 불일치 예외 (google-api-core는 첫 사용 시 import)"""
+    from google.api_core.exceptions import AlreadyExists, FailedPrecondition
+    return AlreadyExists, FailedPrecondition
+
+NOTIFICATION_FAILURES = metrics.registry.counter("notification_delivery_failures_total", "Failed notification batch sends", ("channel",))
+
+@dataclass
+class OutboxEntry:
+    """One notification event waiting in the outbox, with the channels it still has to reach."""
+    entry_id: str
+    recipient_uid: str
+    recipient_email: Optional[str]
+    kind: str
+    title: str
+    message: str
+    dedupe_key: str
+    created_at: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    pending_channels: Set[str] = field(default_factory=set)
+    attempts: int = 0
+    next_attempt_at: float = 0.0
+    # 발송을 맡은 디스패처와 점유 만료 시각 (여러 프로세스가 같은 항목을 보내지 않도록)
+    owner: Optional[str] = None
+    lease_expires_at: Optional[str] = None
+
+    def content(self) -> Tuple:
+        """같은 내용의 알림인지 비교하는 값"""
+        return (self.kind, self.title, self.message, sorted(self.data.items()))
+
+    def to_document(self) -> Dict[str, Any]:
+        return {
+            "recipient_uid": self.recipient_uid,
+            "recipient_email": self.recipient_email,
+            "kind": self.kind,
+            "title": self.title,
+            "message": self.message,
+            "dedupe_key": self.dedupe_key,
+            "data": self.data,
+            "channels": sorted(self.pending_channels),
+            "status": OutboxStatus.PENDING.value,
+            "attempts": self.attempts,
+            "created_at": self.created_at,
+            "owner": self.owner,
+            "lease_expires_at": self.lease_expires_at,
+        }
+
+    @classmethod
+    def from_document(cls, entry_id: str, document: Dict[str, Any]) -> "OutboxEntry":
+        return cls(
+            entry_id=entry_id,
+            recipient_uid=document["recipient_uid"],
+            recipient_email=document.get("recipient_email"),
+            kind=document["kind"],
+            title=document["title"],
+            message=document["message"],
+            dedupe_key=document["dedupe_key"],
+            created_at=document["created_at"],
+            data=document.get("data") or {},
+            pending_channels=set(document.get("channels") or ()),
+            attempts=document.get("attempts", 0),
+            owner=document.get("owner"),
+            lease_expires_at=document.get("lease_expires_at"),
+        )
+
+@dataclass
+class Notification:
+    """A message as delivered: either one outbox entry or a digest of several for the same recipient."""
+    recipient_uid: str
+    recipient_email: Optional[str]
+    kind: str
+    title: str
+    message: str
+    created_at: str
+    entries: List[OutboxEntry]
+
+    @property
+    def is_digest(self) -> bool:
+        return len(self.entries) > 1
+
+    @property
+    def notification_id(self) -> str:
+        """notifications 문서 id: 아웃박스 항목에서 정해지므로 다시 보내도 같은 문서"""
+        if not self.is_digest:
+            return self.entries[0].entry_id
+        return uuid.uuid5(uuid.NAMESPACE_OID, ",".join(sorted(entry.entry_id for entry in self.entries))).hex
+
+    def payload(self) -> Dict[str, Any]:
+        """notifications 문서 / 웹소켓 메시지 본문"""
+        payload = {
+            "user_uid": self.recipient_uid,
+            "user_email": self.recipient_email,
+            "type": self.kind,
+            "title": self.title,
+            "message": self.message,
+            "created_at": self.created_at,
+        }
+        if self.is_digest:
+            payload["items"] = [{"type": entry.kind, "message": entry.message, **entry.data} for entry in self.entries]
+        else:
+            payload.update(self.entries[0].data)
+        return payload
+
+def build_notifications(entries: List[OutboxEntry], digest_threshold: int) -> List[Notification]:
+    """수신자별로 묶어 기준 건수 이상이면 다이제스트 한 건, 아니면 이벤트별 한 건"""
+    by_recipient: Dict[str, List[OutboxEntry]] = defaultdict(list)
+    for entry in entries:
+        by_recipient[entry.recipient_uid].append(entry)
+
+    notifications = []
+    for recipient_uid, group in by_recipient.items():
+        group.sort(key=lambda entry: entry.created_at)
+        if len(group) >= digest_threshold:
+            notifications.append(Notification(
+                recipient_uid=recipient_uid,
+                recipient_email=group[-1].recipient_email,
+                kind="digest",
+                title=f"새 알림 {len(group)}건",
+                message="\n".join(entry.message for entry in group),
+                created_at=group[-1].created_at,
+                entries=group,
+            ))
+        else:
+            notifications.extend(
+                Notification(entry.recipient_uid, entry.recipient_email, entry.kind, entry.title, entry.message, entry.created_at, [entry])
+                for entry in group
+            )
+    return notifications
+
+class InAppChannel:
+    """
+    notifications 컬렉션에 일괄 쓰기. 같은 commit에서 수신자별 읽지 않은 수도 올림
+    (알림 + 카운터가 500건을 넘지 않도록 250건씩).
+    문서 id는 아웃박스 항목에서 정하고 create()로 쓰므로, 일부 묶음만 성공한 뒤 재시도해도
+    이미 쓴 알림과 카운터는 다시 늘지 않음.
+    """
+    name = NotificationChannel.IN_APP.value
+
+    def send(self, notifications: List[Notification]):
+        chunk_size = BATCH_WRITE_LIMIT // 2
+        for start in range(0, len(notifications), chunk_size):
+            chunk = notifications[start:start + chunk_size]
+            try:
+                self._commit(chunk)
+            except _write_conflicts():
+                # 앞선 시도에서 이미 쓴 알림이 섞여 있음: 없는 것만 다시 씀
+                references = [self._reference(notification) for notification in chunk]
+                written = {doc.id for doc in db.get_all(references) if doc.exists}
+                self._commit([notification for notification in chunk if notification.notification_id not in written])
+
+    def _reference(self, notification: Notification):
+        return db.collection(NOTIFICATIONS_COLLECTION).document(notification.notification_id)
+
+    def _commit(self, chunk: List[Notification]):
+        if not chunk:
+            return
+        batch = db.batch()
+        unread: Dict[str, int] = defaultdict(int)
+        for notification in chunk:
+            batch.create(self._reference(notification), {**notification.payload(), "is_read": False})
+            unread[notification.recipient_uid] += 1
+        for uid, count in unread.items():
+            batch.set(db.collection(COUNTERS_COLLECTION).document(uid), {"unread": _increment(count)}, merge=True)
+        batch.commit()
+
+class EmailChannel:
+    """SMTP 연결 하나로 배치 전체 발송 (이메일 주소가 없는 수신자는 건너뜀)"""
+    name = NotificationChannel.EMAIL.value
+
+    def __init__(self, smtp_factory: Callable[[], smtplib.SMTP] = None):
+        self._smtp_factory = smtp_factory or (lambda: smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=10))
+
+    def send(self, notifications: List[Notification]):
+        messages = [self._message(notification) for notification in notifications if notification.recipient_email]
+        if not messages:
+            return
+        with self._smtp_factory() as smtp:
+            for message in messages:
+                smtp.send_message(message)
+
+    def _message(self, notification: Notification) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = settings.SMTP_SENDER
+        message["To"] = notification.recipient_email
+        message["Subject"] = f"[제주 고입] {notification.title}"
+        message.set_content(notification.message)
+        return message
+
+class NotificationHub:
+    """
+    Websocket subscribers by user uid. publish() is called from the dispatcher thread
+    and hands the payload to each subscriber's event loop.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def subscribe(self, uid: str) -> asyncio.Queue:
+        """실행 중인 이벤트 루프 안에서 호출"""
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            self._subscribers[uid].append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, uid: str, queue: asyncio.Queue):
+        with self._lock:
+            self._subscribers[uid] = [item for item in self._subscribers[uid] if item[1] is not queue]
+            if not self._subscribers[uid]:
+                del self._subscribers[uid]
+
+    def publish(self, uid: str, payload: Dict[str, Any]):
+        with self._lock:
+            subscribers = list(self._subscribers.get(uid, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, payload)
+            except RuntimeError:
+                # 연결이 끊기며 루프가 닫힌 구독자
+                self.unsubscribe(uid, queue)
+
+notification_hub = NotificationHub()
+
+class WebSocketChannel:
+    """접속 중인 수신자에게만 전달 (미접속자는 앱 내 알림함에서 확인)"""
+    name = NotificationChannel.WEBSOCKET.value
+
+    def __init__(self, hub: NotificationHub = notification_hub):
+        self._hub = hub
+
+    def send(self, notifications: List[Notification]):
+        for notification in notifications:
+            self._hub.publish(notification.recipient_uid, notification.payload())
+
+def default_channels() -> List[Any]:
+    available = {channel.name: channel for channel in (InAppChannel(), EmailChannel(), WebSocketChannel())}
+    return [available[name] for name in settings.NOTIFICATION_CHANNELS if name in available]
+
+class NotificationDispatcher:
+    """
+    Delivers outbox entries in batches from a background thread.
+
+    Callers only write the outbox entry (one Firestore write) and return. The
+    dispatcher wakes up, waits NOTIFICATION_BATCH_WINDOW_SECONDS so a burst of events
+    arrives together, then for each due entry:
+    - drops entries superseded by a newer event with the same dedupe key, or that
+      repeat word for word what was delivered under their key within
+      NOTIFICATION_DEDUPE_SECONDS;
+    - coalesces a recipient's entries into one digest once there are
+      NOTIFICATION_DIGEST_THRESHOLD or more;
+    - sends each channel's messages as one batch (one Firestore commit per 500
+      in-app notifications, one SMTP connection for all emails);
+    - retries channels that failed with exponential backoff, marking the entry
+      failed after NOTIFICATION_MAX_ATTEMPTS.
+    Outbox status updates are written back in one batch per flush. Each entry is
+    leased to the dispatcher that wrote it for NOTIFICATION_LEASE_SECONDS (renewed on
+    every retry); recover() claims pending entries whose lease ran out, so with
+    several worker processes an entry left by a stopped one is sent by exactly one
+    of the others.
+    """
+
+    def __init__(self, channels: Optional[List[Any]] = None):
+        self._channels = channels
+        self._owner = uuid.uuid4().hex
+        self._queue: List[OutboxEntry] = []
+        # dedupe 키 -> (발송 시각, 발송한 내용)
+        self._delivered_keys: Dict[str, Tuple[float, Tuple]] = {}
+        self._lock = threading.Lock()
+        self._dispatch_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def channels(self) -> List[Any]:
+        if self._channels is None:
+            self._channels = default_channels()
+        return self._channels
+
+    def enqueue(
+        self,
+        recipient_uid: str,
+        kind: str,
+        title: str,
+        message: str,
+        dedupe_key: str,
+        recipient_email: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> OutboxEntry:
+        """아웃박스에 기록하고 바로 반환 (발송은 디스패처가 담당)"""
+        entry = OutboxEntry(
+            entry_id=uuid.uuid4().hex,
+            recipient_uid=recipient_uid,
+            recipient_email=recipient_email,
+            kind=kind,
+            title=title,
+            message=message,
+            dedupe_key=dedupe_key,
+            created_at=datetime.utcnow().isoformat(),
+            data=data or {},
+            pending_channels={channel.name for channel in self.channels},
+            owner=self._owner,
+            lease_expires_at=self._lease_expiry(),
+        )
+        db.collection(OUTBOX_COLLECTION).document(entry.entry_id).set(entry.to_document())
+        with self._lock:
+            self._queue.append(entry)
+        self._wake.set()
+        return entry
+
+    def pending_count(self) -> int:
+        """발송 대기 중인 아웃박스 항목 수"""
+        return len(self._queue)
+
+    def _lease_expiry(self) -> str:
+        return (datetime.utcnow() + timedelta(seconds=settings.NOTIFICATION_LEASE_SECONDS)).isoformat()
+
+    def recover(self) -> int:
+        """점유가 만료된 대기 항목(멈춘 디스패처가 남긴 것)을 가져와 대기열에 넣음"""
+        with self._dispatch_lock:
+            now = datetime.utcnow().isoformat()
+            documents = db.collection(OUTBOX_COLLECTION).where("status", "==", OutboxStatus.PENDING.value).stream()
+            with self._lock:
+                queued = {entry.entry_id for entry in self._queue}
+            expired = [doc for doc in documents if doc.id not in queued and (doc.get("lease_expires_at") or "") <= now]
+            recovered = self._claim(expired)
+            with self._lock:
+                self._queue.extend(recovered)
+        if recovered:
+            self._wake.set()
+        return len(recovered)
+
+    def _claim(self, documents: List[Any]) -> List[OutboxEntry]:
+        """
+        Take over the given outbox documents. Each write is conditioned on the
+        update_time read with the document, so an entry another dispatcher claimed (or
+        settled) in the meantime is left alone. A batch with such an entry fails as a
+        whole and is retried one document at a time.
+        """
+        lease = {"owner": self._owner, "lease_expires_at": self._lease_expiry()}
+        claimed = []
+        for start in range(0, len(documents), BATCH_WRITE_LIMIT):
+            chunk = documents[start:start + BATCH_WRITE_LIMIT]
+            batch = db.batch()
+            for doc in chunk:
+                batch.update(db.collection(OUTBOX_COLLECTION).document(doc.id), lease, option=db.write_option(last_update_time=doc.update_time))
+            try:
+                batch.commit()
+                claimed.extend(chunk)
+                continue
+            except _write_conflicts():
+                pass
+            for doc in chunk:
+                try:
+                    db.collection(OUTBOX_COLLECTION).document(doc.id).update(lease, option=db.write_option(last_update_time=doc.update_time))
+                except _write_conflicts():
+                    continue
+                claimed.append(doc)
+        return [OutboxEntry.from_document(doc.id, {**doc.to_dict(), **lease}) for doc in claimed]
+
+    def flush(self, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Deliver every due entry once and return counts by outcome.
+        Safe to call while the background thread runs; deliveries never overlap.
+        """
+        with self._dispatch_lock:
+            now = time.monotonic() if now is None else now
+            with self._lock:
+                due = [entry for entry in self._queue if entry.next_attempt_at <= now]
+                self._queue = [entry for entry in self._queue if entry.next_attempt_at > now]
+            if not due:
+                return {}
+
+            deliver, superseded = self._dedupe(due, now)
+            for channel in self.channels:
+                entries = [entry for entry in deliver if channel.name in entry.pending_channels]
+                if not entries:
+                    continue
+                notifications = build_notifications(entries, settings.NOTIFICATION_DIGEST_THRESHOLD)
+                try:
+                    channel.send(notifications)
+                except Exception:
+                    logger.exception(f"Notification channel {channel.name} failed for {len(entries)} entries")
+                    NOTIFICATION_FAILURES.inc(channel=channel.name)
+                    continue
+                for entry in entries:
+                    entry.pending_channels.discard(channel.name)
+                for notification in notifications:
+                    NOTIFICATIONS_SENT.inc(channel=channel.name, kind="digest" if notification.is_digest else "single")
+
+            updates, retry = self._settle(deliver, now)
+            updates.extend((entry, {"status": OutboxStatus.SUPERSEDED.value}) for entry in superseded)
+            # 재시도할 항목은 점유 기간을 늘려 다른 디스패처가 가져가지 않게 함
+            lease_expires_at = self._lease_expiry()
+            for entry in retry:
+                entry.lease_expires_at = lease_expires_at
+            renewals = [(entry, {"attempts": entry.attempts, "lease_expires_at": lease_expires_at}) for entry in retry]
+            with self._lock:
+                self._queue.extend(retry)
+            self._write_statuses(updates + renewals)
+
+            outcome: Dict[str, int] = defaultdict(int)
+            for _, update in updates:
+                outcome[update["status"]] += 1
+            return dict(outcome)
+
+    def _dedupe(self, entries: List[OutboxEntry], now: float) -> Tuple[List[OutboxEntry], List[OutboxEntry]]:
+        """같은 dedupe 키는 최신 이벤트만 남김; 최근 같은 키로 똑같은 내용을 보냈으면 버림"""
+        self._delivered_keys = {
+            key: delivered for key, delivered in self._delivered_keys.items()
+            if now - delivered[0] < settings.NOTIFICATION_DEDUPE_SECONDS
+        }
+        latest: Dict[str, OutboxEntry] = {}
+        superseded = []
+        for entry in sorted(entries, key=lambda entry: entry.created_at):
+            previous = latest.get(entry.dedupe_key)
+            if previous is not None:
+                superseded.append(previous)
+            latest[entry.dedupe_key] = entry
+        deliver = []
+        for entry in latest.values():
+            delivered = self._delivered_keys.get(entry.dedupe_key)
+            if entry.attempts == 0 and delivered is not None and delivered[1] == entry.content():
+                superseded.append(entry)
+            else:
+                deliver.append(entry)
+        return deliver, superseded
+
+    def _settle(self, entries: Iterable[OutboxEntry], now: float) -> Tuple[List[Tuple[OutboxEntry, dict]], List[OutboxEntry]]:
+        """채널별 결과를 반영해 완료/재시도/실패로 분류"""
+        updates, retry = [], []
+        for entry in entries:
+            if not entry.pending_channels:
+                self._delivered_keys[entry.dedupe_key] = (now, entry.content())
+                updates.append((entry, {"status": OutboxStatus.SENT.value, "attempts": entry.attempts + 1, "sent_at": datetime.utcnow().isoformat()}))
+                continue
+            entry.attempts += 1
+            if entry.attempts >= settings.NOTIFICATION_MAX_ATTEMPTS:
+                updates.append((entry, {"status": OutboxStatus.FAILED.value, "attempts": entry.attempts, "failed_channels": sorted(entry.pending_channels)}))
+            else:
+                entry.next_attempt_at = now + min(settings.NOTIFICATION_RETRY_BASE_SECONDS * 2 ** (entry.attempts - 1), MAX_RETRY_DELAY_SECONDS)
+                retry.append(entry)
+        return updates, retry
+
+    def _write_statuses(self, updates: List[Tuple[OutboxEntry, dict]]):
+        for start in range(0, len(updates), BATCH_WRITE_LIMIT):
+            batch = db.batch()
+            for entry, update in updates[start:start + BATCH_WRITE_LIMIT]:
+                batch.update(db.collection(OUTBOX_COLLECTION).document(entry.entry_id), update)
+            batch.commit()
+
+    def start(self):
+        """백그라운드 발송 스레드 시작 (앱 시작 시 한 번)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="notification-dispatcher", daemon=True)
+            self._thread.start()
+        try:
+            self.recover()
+        except Exception:
+            logger.exception("Notification outbox recovery failed")
+
+    def stop(self, timeout: float = 5.0):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._stopped.set()
+        self._wake.set()
+        thread.join(timeout)
+
+    def _run(self):
+        next_recovery = time.monotonic() + settings.NOTIFICATION_LEASE_SECONDS
+        while not self._stopped.is_set():
+            # 새 이벤트가 없어도 재시도 시각을 확인하도록 주기적으로 깨어남
+            self._wake.wait(timeout=1.0)
+            self._wake.clear()
+            # 몰려드는 이벤트를 한 번에 보내도록 잠시 모음
+            if self._stopped.wait(settings.NOTIFICATION_BATCH_WINDOW_SECONDS):
+                break
+            try:
+                self.flush()
+                # 멈춘 다른 디스패처의 점유가 만료된 항목도 주기적으로 가져옴
+                if time.monotonic() >= next_recovery:
+                    next_recovery = time.monotonic() + settings.NOTIFICATION_LEASE_SECONDS
+                    self.recover()
+            except Exception:
+                logger.exception("Notification dispatch failed")
+
+def encode_cursor(created_at: str) -> str:
+    return base64.urlsafe_b64encode(created_at.encode()).decode()
+
+def decode_cursor(cursor: str) -> str:
+    try:
+        created_at = base64.b64decode(cursor, altchars=b"-_", validate=True).decode()
+        datetime.fromisoformat(created_at)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 cursor입니다.")
+    return created_at
+
+def _is_unread(doc: Any, uid: str) -> bool:
+    return doc.exists and doc.get("user_uid") == uid and doc.get("is_read") is False
+
+class NotificationInbox:
+    """
+    Read side of in-app notifications.
+
+    The unread badge reads one counter document per user instead of counting the
+    notifications collection; InAppChannel increments it in the same commit that
+    writes the notifications, and marking as read decrements it in the same commit
+    that flips is_read. Each flip is conditioned on the update_time the notification
+    was read with, so two requests marking the same notification decrement once.
+    reconcile_unread() recounts and repairs a counter. The feed pages newest-first with a cursor on created_at
+    (microsecond timestamps, unique per recipient in practice), so each page is one
+    indexed query (user_uid ==, created_at DESC) whatever the page depth.
+    """
+
+    def get_feed(self, uid: str, limit: int = 20, cursor: Optional[str] = None) -> schemas.NotificationPage:
+        query = (
+            db.collection(NOTIFICATIONS_COLLECTION)
+            .where("user_uid", "==", uid)
+            .order_by("created_at", direction="DESCENDING")
+        )
+        if cursor:
+            query = query.start_after({"created_at": decode_cursor(cursor)})
+        # 한 건 더 읽어 다음 페이지가 있는지 판단
+        docs = list(query.limit(limit + 1).stream())
+        items = [hydrate(schemas.ApprovalNotification, {**doc.to_dict(), "id": doc.id}) for doc in docs[:limit]]
+        next_cursor = encode_cursor(items[-1].created_at) if len(docs) > limit else None
+        return schemas.NotificationPage(items=items, next_cursor=next_cursor)
+
+    def unread_count(self, uid: str) -> int:
+        counter = db.collection(COUNTERS_COLLECTION).document(uid).get()
+        unread = (counter.get("unread") or 0) if counter.exists else 0
+        if unread < 0:
+            # 음수는 카운터가 어긋났다는 뜻: 다시 세어 바로잡음
+            logger.warning(f"Unread counter for {uid} is {unread}; recounting")
+            return self.reconcile_unread(uid).actual
+        return unread
+
+    def mark_read(self, uid: str, notification_ids: List[str]) -> int:
+        """지정한 알림 중 본인의 읽지 않은 알림만 읽음 처리 (충돌이 없으면 조회 1회 + commit 1회)"""
+        if not notification_ids:
+            return 0
+        references = [db.collection(NOTIFICATIONS_COLLECTION).document(notification_id) for notification_id in notification_ids]
+        unread = [doc for doc in db.get_all(references) if _is_unread(doc, uid)]
+        return self._commit_read(uid, unread)
+
+    def mark_all_read(self, uid: str) -> int:
+        docs = db.collection(NOTIFICATIONS_COLLECTION).where("user_uid", "==", uid).where("is_read", "==", False).stream()
+        return self._commit_read(uid, list(docs))
+
+    def _commit_read(self, uid: str, documents: List[Any]) -> int:
+        """
+        Flip is_read and decrement the counter in one commit per chunk, each flip
+        conditioned on the update_time it was read with. A chunk that lost a race with
+        another request is re-read and retried without the notifications that request
+        already marked. Returns how many notifications this call marked.
+        """
+        # 카운터 차감 1건 자리를 남겨 500건 이하로
+        chunk_size = BATCH_WRITE_LIMIT - 1
+        marked = 0
+        for start in range(0, len(documents), chunk_size):
+            chunk = documents[start:start + chunk_size]
+            for _ in range(CONFLICT_ATTEMPTS):
+                if not chunk:
+                    break
+                now = datetime.utcnow().isoformat()
+                batch = db.batch()
+                for doc in chunk:
+                    batch.update(doc.reference, {"is_read": True, "read_at": now}, option=db.write_option(last_update_time=doc.update_time))
+                batch.set(db.collection(COUNTERS_COLLECTION).document(uid), {"unread": _increment(-len(chunk))}, merge=True)
+                try:
+                    batch.commit()
+                except _write_conflicts():
+                    chunk = [doc for doc in db.get_all([doc.reference for doc in chunk]) if _is_unread(doc, uid)]
+                    continue
+                marked += len(chunk)
+                break
+            else:
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="다른 요청과 동시에 처리되었습니다. 다시 시도해 주세요.")
+        return marked
+
+    def reconcile_unread(self, uid: str, repair: bool = True) -> schemas.UnreadCounterReconciliation:
+        """
+        Recount the user's unread notifications and compare with the counter. The
+        repair is written on the condition that the counter has not changed since it
+        was read, so a notification delivered or read during the recount sends it
+        round again instead of being lost.
+        """
+        reference = db.collection(COUNTERS_COLLECTION).document(uid)
+        for _ in range(CONFLICT_ATTEMPTS):
+            counter = reference.get()
+            stored = (counter.get("unread") or 0) if counter.exists else 0
+            actual = sum(1 for _ in db.collection(NOTIFICATIONS_COLLECTION).where("user_uid", "==", uid).where("is_read", "==", False).stream())
+            if not repair or stored == actual:
+                return schemas.UnreadCounterReconciliation(uid=uid, stored=stored, actual=actual, repaired=False)
+            try:
+                if counter.exists:
+                    reference.update({"unread": actual}, option=db.write_option(last_update_time=counter.update_time))
+                else:
+                    reference.create({"unread": actual})
+            except _write_conflicts():
+                continue
+            return schemas.UnreadCounterReconciliation(uid=uid, stored=stored, actual=actual, repaired=True)
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="다른 요청과 동시에 처리되었습니다. 다시 시도해 주세요.")
+
+notification_inbox = NotificationInbox()
+
+# Create dispatcher instance
+notification_dispatcher = NotificationDispatcher()
+
+metrics.registry.gauge("notification_outbox_pending", "Notification outbox entries waiting for delivery", callback=notification_dispatcher.pending_count)
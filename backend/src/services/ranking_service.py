@@ -0,0 +1,74 @@
+# backend/src/services/ranking_service.py
+# Business logic for per-school applicant rankings
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from ..database import models
+from ..utils import metrics
+from ..utils.constants import PERCENTILE_SUBJECT
+
+def get_latest_percentiles(db: Session, student_ids: Iterable[int]) -> Dict[int, float]:
+    """학생별 가장 최근 내신석차백분율"""
+    student_ids = list(student_ids)
+    if not student_ids:
+        return {}
+    latest_grade_ids = (
+        select(func.max(models.Grade.id))
+        .where(models.Grade.subject == PERCENTILE_SUBJECT, models.Grade.student_id.in_(student_ids))
+        .group_by(models.Grade.student_id)
+    )
+    rows = db.query(models.Grade.student_id, models.Grade.percentile_rank).filter(models.Grade.id.in_(latest_grade_ids))
+    return {student_id: percentile for student_id, percentile in rows}
+
+def rank_applications(applications: Iterable[models.StudentApplication], percentiles: Dict[int, float]) -> List[Tuple[models.StudentApplication, Optional[float], Optional[int]]]:
+    """
+    Order applications by percentile and assign ranks.
+
+    A lower percentile ranks first, tied percentiles share a rank, and applicants
+    without a percentile go last with no rank.
+
+    Returns:
+        (application, percentile, rank) in rank order
+    """
+    ranked = sorted(
+        applications,
+        key=lambda application: (percentiles.get(application.student_id) is None, percentiles.get(application.student_id) or 0.0),
+    )
+    result = []
+    rank, previous = 0, None
+    for position, application in enumerate(ranked, start=1):
+        percentile = percentiles.get(application.student_id)
+        if percentile != previous:
+            rank, previous = position, percentile
+        result.append((application, percentile, rank if percentile is not None else None))
+    return result
+
+def recompute_school_rankings(db: Session, school_id: int) -> int:
+    """
+    Recompute rank_in_school for every application to a school.
+
+    Ranks follow rank_applications().
+
+    Returns:
+        Number of applications ranked
+    """
+    with metrics.RANKING_RECOMPUTE_SECONDS.time():
+        return _recompute_school_rankings(db, school_id)
+
+def _recompute_school_rankings(db: Session, school_id: int) -> int:
+    applications = (
+        db.query(models.StudentApplication)
+        .filter(models.StudentApplication.academic_year == models.current_academic_year(), models.StudentApplication.school_id == school_id)
+        .all()
+    )
+    percentiles = get_latest_percentiles(db, [application.student_id for application in applications])
+
+    now = datetime.utcnow()
+    for application, percentile, rank in rank_applications(applications, percentiles):
+        application.percentile_rank = percentile
+        application.rank_in_school = rank
+        application.updated_at = now
+    db.commit()
+    return len(applications)
@@ -1,28 +1,87 @@
 # backend/src/services/school_service.py
 # Business logic for school operations
 
+from datetime import datetime
+from typing import Optional
 from sqlalchemy.orm import Session
 from ..database import models, schemas
+from ..database.session import get_db
+from ..utils import events
 
-def get_db():
-    # Placeholder for DB session
-    yield None
+QUOTA_FIELDS = ("total_quota", "priority_within_quota", "priority_outside_quota", "actual_competition_quota")
 
 def get_school(db: Session, school_id: int):
-    # return db.query(models.School).filter(models.School.id == school_id).first()
-    return None
+    return db.query(models.School).filter(models.School.id == school_id).first()
 
 def get_school_by_name(db: Session, name: str):
-    # return db.query(models.School).filter(models.School.name == name).first()
-    return None
+    return db.query(models.School).filter(models.School.name == name).first()
 
 def get_schools(db: Session, skip: int = 0, limit: int = 100):
-    # return db.query(models.School).offset(skip).limit(limit).all()
-    return []
+    return db.query(models.School).order_by(models.School.id).offset(skip).limit(limit).all()
+
+def compute_actual_competition_quota(total_quota: int, priority_within_quota: int) -> int:
+    """실제 경쟁 정원 = 전체 정원 - 정원내 우선선발 (정원외 우선선발은 별도 인원)"""
+    return max((total_quota or 0) - (priority_within_quota or 0), 0)
+
+def to_school_schema(school: models.School) -> schemas.School:
+    return schemas.School(
+        id=str(school.id),
+        name=school.name,
+        address=school.address,
+        total_quota=school.total_quota or 0,
+        priority_within_quota=school.priority_within_quota or 0,
+        priority_outside_quota=school.priority_outside_quota or 0,
+        actual_competition_quota=school.actual_competition_quota or 0,
+        gender_type=school.gender_type or "COED",
+        is_levelized=bool(school.is_levelized),
+        created_at=school.created_at.isoformat() if school.created_at else "",
+        updated_at=school.updated_at.isoformat() if school.updated_at else "",
+    )
 
 def create_school(db: Session, school: schemas.SchoolCreate):
-    db_school = models.School(name=school.name, address=school.address)
-    # db.add(db_school)
-    # db.commit()
-    # db.refresh(db_school)
+    now = datetime.utcnow()
+    db_school = models.School(
+        name=school.name,
+        address=school.address,
+        total_quota=school.total_quota,
+        actual_competition_quota=compute_actual_competition_quota(school.total_quota, 0),
+        gender_type=school.gender_type,
+        is_levelized=school.is_levelized,
+        created_at=now,
+        updated_at=now,
+    )
+    db.add(db_school)
+    db.commit()
+    db.refresh(db_school)
     return db_school
+
+def update_school_quota(db: Session, school: models.School, quota_update: schemas.SchoolQuotaUpdate) -> Optional[dict]:
+    """
+    Apply a quota edit and recompute actual_competition_quota.
+
+    Nothing is written and no event is published when the edit leaves every quota
+    field unchanged. Otherwise the change is committed and a single
+    SCHOOL_QUOTA_CHANGED event carries the old and new values, so only this school's
+    cached rankings and statistics are invalidated.
+
+    Returns:
+        The changed fields as {field: (old, new)}, or None if nothing changed
+    """
+    before = {field: getattr(school, field) or 0 for field in QUOTA_FIELDS}
+    after = dict(before)
+    for field, value in quota_update.model_dump(exclude_none=True).items():
+        after[field] = value
+    after["actual_competition_quota"] = compute_actual_competition_quota(after["total_quota"], after["priority_within_quota"])
+
+    changes = {field: (before[field], after[field]) for field in QUOTA_FIELDS if before[field] != after[field]}
+    if not changes:
+        return None
+
+    for field, (_, new_value) in changes.items():
+        setattr(school, field, new_value)
+    school.updated_at = datetime.utcnow()
+    db.commit()
+    db.refresh(school)
+
+    events.publish(events.SCHOOL_QUOTA_CHANGED, {"school_id": school.id, "changes": changes})
+    return changes
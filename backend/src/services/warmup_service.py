@@ -0,0 +1,110 @@
+# backend/src/services/warmup_service.py
+# Startup warm-up: pre-heat pools, lazy clients and dashboard caches
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Tuple
+from sqlalchemy import text
+from ..config import settings
+from ..database import models
+from ..database.session import SessionLocal, engine
+from . import auth_service, competition_service
+from .application_snapshot_service import application_snapshots
+
+logger = logging.getLogger(__name__)
+
+def _warm_database_pool():
+    """풀 연결을 미리 열어 두고 반환 (이후 요청은 기존 연결 재사용)"""
+    connections = [engine.connect() for _ in range(settings.WARMUP_DB_CONNECTIONS)]
+    for connection in connections:
+        connection.execute(text("SELECT 1"))
+    for connection in connections:
+        connection.close()
+
+def _warm_password_hashing():
+    # 첫 hash 호출 시 bcrypt 백엔드가 로드됨
+    auth_service.get_pwd_context().hash("warm-up")
+
+def _warm_token_codec():
+    from jose import jwt  # noqa: F401
+
+def _warm_competition_statistics():
+    """학교 목록을 읽고 학교별 스냅샷과 도 전체 현황을 미리 계산"""
+    db = SessionLocal()
+    try:
+        for (school_id,) in db.query(models.School.id).all():
+            application_snapshots.refresh(school_id, db)
+        competition_service.get_overview(db)
+    finally:
+        db.close()
+
+def _warm_simulator():
+    from . import admission_simulation_service  # noqa: F401  (NumPy 로드)
+
+WARMUP_STEPS: List[Tuple[str, Callable[[], None]]] = [
+    ("database_pool", _warm_database_pool),
+    ("password_hashing", _warm_password_hashing),
+    ("token_codec", _warm_token_codec),
+    ("competition_statistics", _warm_competition_statistics),
+    ("simulator", _warm_simulator),
+]
+# 실패하면 준비되지 않은 것으로 보고하는 단계 (나머지는 캐시 예열이라 실패해도 요청 처리 가능)
+REQUIRED_WARMUP_STEPS = frozenset({"database_pool", "password_hashing", "token_codec"})
+
+class WarmupService:
+    """
+    Runs the warm-up steps once after startup and records their outcome.
+
+    Liveness does not depend on it; readiness reports not-ready until every step has
+    run, so the load balancer only routes traffic to a pre-heated instance, and stays
+    not-ready if a required step failed. A failing step is logged with its error and
+    reported only as "failed"; it does not block the remaining steps.
+    """
+
+    def __init__(self, steps: List[Tuple[str, Callable[[], None]]] = WARMUP_STEPS, required: Iterable[str] = REQUIRED_WARMUP_STEPS):
+        self._steps = steps
+        self._required = frozenset(required)
+        self._results: Dict[str, Dict] = {}
+        self._finished = threading.Event()
+        self._lock = threading.Lock()
+        self._started = False
+
+    @property
+    def is_finished(self) -> bool:
+        return self._finished.is_set()
+
+    @property
+    def is_ready(self) -> bool:
+        """모든 단계가 끝났고 필수 단계가 하나도 실패하지 않음"""
+        if not self.is_finished:
+            return False
+        return all(self._results.get(name, {}).get("status") != "failed" for name in self._required)
+
+    def run(self):
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        for name, step in self._steps:
+            started = time.perf_counter()
+            try:
+                step()
+                self._results[name] = {"status": "ok", "duration_ms": round((time.perf_counter() - started) * 1000, 1)}
+            except Exception:
+                # 오류 내용은 로그에만 남김 (readiness 응답은 인증 없이 노출됨)
+                logger.exception(f"Warm-up step {name} failed")
+                self._results[name] = {"status": "failed"}
+        self._finished.set()
+        logger.info(f"Warm-up finished: {self._results}")
+
+    def skip(self):
+        """워밍업 비활성화 시 즉시 준비 완료로 표시"""
+        self._started = True
+        self._finished.set()
+
+    def status(self) -> Dict:
+        return {"finished": self.is_finished, "steps": dict(self._results)}
+
+# Create service instance
+warmup_service = WarmupService()
@@ -0,0 +1,77 @@
+# backend/src/testing/admission_seed.py
+# Synthetic schools, students and applications for load tests
+
+import random
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from ..database import models
+from ..services import application_counter_service
+from ..services.school_service import compute_actual_competition_quota
+from ..utils.constants import PERCENTILE_SUBJECT, PriorityType
+
+GRADE_SHEET_HEADER = "학년,반,번호,성명,성별,F,G,H,I,J,K,L,M,N,내신석차백분율\n"
+
+def seed_admission_data(db: Session, high_school_count: int = 20, middle_school_count: int = 8, students_per_school: int = 300, seed: int = 0) -> Dict[str, List]:
+    """
+    Seed high schools, 3rd-year students of each middle school with a percentile grade,
+    and one application per student, then rebuild the application counters.
+
+    Returns:
+        {"high_school_ids": [...], "middle_school_ids": ["school-0", ...]}
+    """
+    # 전역 random 상태를 건드리지 않도록 시드별 난수 생성기 사용
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    schools = []
+    for index in range(high_school_count):
+        total = rng.randint(150, 350)
+        within = total // 10
+        schools.append(models.School(
+            name=f"고등학교 {index}", total_quota=total, priority_within_quota=within, priority_outside_quota=total // 20,
+            actual_competition_quota=compute_actual_competition_quota(total, within), created_at=now, updated_at=now,
+        ))
+    db.add_all(schools)
+    db.flush()
+
+    middle_school_ids = [f"school-{index}" for index in range(middle_school_count)]
+    for school_id in middle_school_ids:
+        for index in range(students_per_school):
+            class_number, number = divmod(index, 30)
+            student = models.Student(
+                name=f"학생 {index}", student_id_number=f"{school_id}-{index}", school_id=school_id,
+                grade=3, class_number=class_number + 1, number=number + 1, gender=rng.choice("남여"),
+            )
+            student.grades.append(models.Grade(subject=PERCENTILE_SUBJECT, percentile_rank=round(rng.uniform(0, 100), 2)))
+            priority = rng.random() < 0.05
+            student.applications.append(models.StudentApplication(
+                school_id=rng.choice(schools).id,
+                is_priority_selection=priority,
+                priority_type=PriorityType.WITHIN_QUOTA.value if priority else None,
+                created_at=now, updated_at=now,
+            ))
+            db.add(student)
+    db.commit()
+    application_counter_service.reconcile_counters(db, repair=True)
+    return {"high_school_ids": [school.id for school in schools], "middle_school_ids": middle_school_ids}
+
+def grade_sheet(db: Session, school_id: str, changed_ratio: float = 0.05, rng: Optional[random.Random] = None) -> bytes:
+    """
+    CSV grade sheet for every student of a middle school, with `changed_ratio` of the
+    percentiles shifted so each upload has a new content hash and a small diff.
+    Draws from `rng` (a fresh unseeded generator if omitted).
+    """
+    rng = rng or random.Random()
+    lines = []
+    students = (
+        db.query(models.Student)
+        .filter(models.Student.academic_year == models.current_academic_year(), models.Student.school_id == school_id)
+        .order_by(models.Student.id)
+        .all()
+    )
+    for student in students:
+        percentile = next((grade.percentile_rank for grade in student.grades if grade.subject == PERCENTILE_SUBJECT), 50.0)
+        if rng.random() < changed_ratio:
+            percentile = round(rng.uniform(0, 100), 2)
+        lines.append(f"{student.grade},{student.class_number},{student.number},{student.name},{student.gender},,,,,,,,,,{percentile}")
+    return (GRADE_SHEET_HEADER + "\n".join(lines) + "\n").encode("utf-8")
@@ -0,0 +1,83 @@
+# backend/src/testing/approval_seed.py
+# Synthetic users and approval logs for approval-subsystem tests and benchmarks
+
+import random
+from typing import Dict, List
+from ..database import schemas
+from ..utils.constants import UserRole
+
+TIMESTAMP = "2024-03-01T09:00:00"
+
+def _user(uid: str, role: UserRole, school_id: str, is_approved: bool, rng: random.Random) -> dict:
+    user = {
+        "uid": uid,
+        "email": f"{uid}@example.com",
+        "username": uid,
+        "full_name": f"교사 {uid}",
+        "role": role.value,
+        "is_active": True,
+        "is_approved": is_approved,
+        "school_id": school_id,
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+    }
+    if role == UserRole.THIRD_GRADE_HOMEROOM:
+        user.update(grade=3, class_number=rng.randint(1, 12), is_homeroom_teacher=True)
+    return user
+
+def seed_approval_data(client, user_count: int, school_count: int = 50, pending_ratio: float = 0.2, logs_per_head: int = 20, seed: int = 0) -> Dict[str, List[schemas.UserInDB]]:
+    """
+    Seed `users` and `approval_logs` into a FakeFirestore.
+
+    Every school gets one approved 3학년 부장; the remaining users are 담임/일반교사
+    (and a few 부장 candidates) of which `pending_ratio` are waiting for approval.
+
+    Returns:
+        Approvers to drive the workload with: {"admins": [...], "heads": [...]}
+    """
+    # 전역 random 상태를 건드리지 않도록 시드별 난수 생성기 사용
+    rng = random.Random(seed)
+    users, logs = {}, {}
+    admins = [_user("admin-0", UserRole.ADMIN, "school-0", True, rng)]
+    users["admin-0"] = admins[0]
+    heads = []
+    for school in range(school_count):
+        head = _user(f"head-{school}", UserRole.THIRD_GRADE_HEAD, f"school-{school}", True, rng)
+        head["is_homeroom_teacher"] = False
+        users[head["uid"]] = head
+        heads.append(head)
+
+    teacher_roles = [UserRole.THIRD_GRADE_HOMEROOM] * 6 + [UserRole.GENERAL_TEACHER] * 3 + [UserRole.THIRD_GRADE_HEAD]
+    for index in range(max(user_count - len(users), 0)):
+        role = rng.choice(teacher_roles)
+        uid = f"user-{index}"
+        users[uid] = _user(uid, role, f"school-{rng.randrange(school_count)}", rng.random() >= pending_ratio, rng)
+        if role == UserRole.THIRD_GRADE_HEAD:
+            users[uid]["is_homeroom_teacher"] = False
+
+    for head in heads:
+        for index in range(logs_per_head):
+            logs[f"{head['uid']}-log-{index}"] = {
+                "approver_uid": head["uid"],
+                "target_uid": f"user-{index}",
+                "action": "approved" if index % 4 else "rejected",
+                "reason": None,
+                "created_at": f"2024-03-01T09:{index % 60:02d}:00",
+            }
+
+    client.seed("users", users)
+    client.seed("approval_logs", logs)
+    return {
+        "admins": [schemas.UserInDB(**user) for user in admins],
+        "heads": [schemas.UserInDB(**user) for user in heads],
+    }
+
+def pending_targets(client, approver: schemas.UserInDB) -> List[str]:
+    """approver가 승인할 수 있는 대기 사용자 UID (지연 없이 직접 조회)"""
+    roles = {UserRole.THIRD_GRADE_HOMEROOM.value, UserRole.GENERAL_TEACHER.value}
+    with client._lock:
+        users = list(client._collection("users").values())
+    return [
+        user["uid"] for user in users
+        if not user["is_approved"] and user["role"] in roles and user["school_id"] == approver.school_id
+    ]
@@ -0,0 +1,335 @@
+# backend/src/testing/firestore_fake.py
+# In-memory Firestore stand-in for tests and benchmarks
+
+import itertools
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+class NotFound(LookupError):
+    """문서가 없을 때 update() (google.api_core.exceptions.NotFound 대응)"""
+
+class AlreadyExists(Exception):
+    """이미 있는 문서에 create() (google.api_core.exceptions.AlreadyExists 대응)"""
+
+class FailedPrecondition(Exception):
+    """last_update_time 조건 불일치 (google.api_core.exceptions.FailedPrecondition 대응)"""
+
+class WriteOption:
+    """client.write_option(last_update_time=...) 대응"""
+
+    def __init__(self, last_update_time: Any):
+        self.last_update_time = last_update_time
+
+class Increment:
+    """숫자 필드 증감 (google.cloud.firestore.Increment 대응)"""
+
+    def __init__(self, value: int):
+        self.value = value
+
+def _is_increment(value) -> bool:
+    # 실제 클라이언트의 Increment도 같은 형태(.value)로 처리
+    return type(value).__name__ == "Increment" and hasattr(value, "value")
+
+def _apply(current: Optional[dict], data: dict) -> dict:
+    merged = dict(current or {})
+    for field, value in data.items():
+        merged[field] = (merged.get(field) or 0) + value.value if _is_increment(value) else value
+    return merged
+
+def _after_cursor(data: dict, orders: Tuple, cursor: dict) -> bool:
+    """정렬 기준으로 cursor 값보다 뒤에 오는 문서인지"""
+    for field, descending in orders:
+        value, expected = data.get(field), cursor.get(field)
+        if value == expected:
+            continue
+        return value < expected if descending else value > expected
+    return False
+
+def _matches(value, op: str, expected) -> bool:
+    if op == "==":
+        return value == expected
+    if op == "!=":
+        return value != expected
+    if op == "in":
+        return value in expected
+    if op == "not-in":
+        return value not in expected
+    if op == "array-contains":
+        return isinstance(value, list) and expected in value
+    if op == "array-contains-any":
+        return isinstance(value, list) and any(item in value for item in expected)
+    if value is None:
+        return False
+    return {"<": value < expected, "<=": value <= expected, ">": value > expected, ">=": value >= expected}[op]
+
+class FakeDocumentSnapshot:
+    def __init__(self, reference: "FakeDocumentReference", data: Optional[dict], update_time: Optional[int] = None):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+        self.update_time = update_time
+
+    @property
+    def exists(self) -> bool:
+        return self._data is not None
+
+    def to_dict(self) -> Optional[dict]:
+        return dict(self._data) if self._data is not None else None
+
+    def get(self, field_path: str):
+        return (self._data or {}).get(field_path)
+
+class FakeDocumentReference:
+    def __init__(self, client: "FakeFirestore", collection_path: str, document_id: str):
+        self._client = client
+        self._collection_path = collection_path
+        self.id = document_id
+
+    @property
+    def path(self) -> str:
+        return f"{self._collection_path}/{self.id}"
+
+    def get(self, *args, **kwargs) -> FakeDocumentSnapshot:
+        self._client._round_trip()
+        with self._client._lock:
+            return self._client._snapshot(self)
+
+    def set(self, data: dict, merge: bool = False):
+        self._client._round_trip()
+        with self._client._lock:
+            self._client._write_set(self._collection_path, self.id, data, merge)
+
+    def create(self, data: dict):
+        self._client._round_trip()
+        with self._client._lock:
+            self._client._check("create", self, None)
+            self._client._write_set(self._collection_path, self.id, data, False)
+
+    def update(self, data: dict, option: Optional[WriteOption] = None):
+        self._client._round_trip()
+        with self._client._lock:
+            self._client._check("update", self, option)
+            self._client._write_update(self._collection_path, self.id, data)
+
+    def delete(self):
+        self._client._round_trip()
+        with self._client._lock:
+            self._client._delete(self._collection_path, self.id)
+
+    def collection(self, name: str) -> "FakeQuery":
+        return FakeQuery(self._client, f"{self.path}/{name}")
+
+class FakeQuery:
+    """
+    CollectionReference and Query in one: filters, ordering and limits are applied to a
+    snapshot of the collection when stream()/get() runs.
+    """
+
+    def __init__(self, client: "FakeFirestore", path: str, filters: Tuple = (), orders: Tuple = (), limit_count: Optional[int] = None, offset_count: int = 0, cursor: Optional[dict] = None):
+        self._client = client
+        self._path = path
+        self._filters = filters
+        self._orders = orders
+        self._limit = limit_count
+        self._offset = offset_count
+        self._cursor = cursor
+
+    @property
+    def id(self) -> str:
+        return self._path.rsplit("/", 1)[-1]
+
+    def _copy(self, **changes) -> "FakeQuery":
+        values = {"filters": self._filters, "orders": self._orders, "limit_count": self._limit, "offset_count": self._offset, "cursor": self._cursor}
+        values.update(changes)
+        return FakeQuery(self._client, self._path, **values)
+
+    def where(self, field_path: str = None, op_string: str = None, value: Any = None, filter=None):
+        if filter is not None:
+            field_path, op_string, value = filter.field_path, filter.op_string, filter.value
+        return self._copy(filters=self._filters + ((field_path, op_string, value),))
+
+    def order_by(self, field_path: str, direction: str = "ASCENDING"):
+        return self._copy(orders=self._orders + ((field_path, str(direction).upper().endswith("DESCENDING")),))
+
+    def limit(self, count: int):
+        return self._copy(limit_count=count)
+
+    def offset(self, count: int):
+        return self._copy(offset_count=count)
+
+    def start_after(self, document_fields):
+        """정렬 필드 값(dict) 또는 스냅샷 다음부터"""
+        if isinstance(document_fields, FakeDocumentSnapshot):
+            document_fields = document_fields.to_dict()
+        return self._copy(cursor=dict(document_fields))
+
+    def document(self, document_id: Optional[str] = None) -> FakeDocumentReference:
+        return FakeDocumentReference(self._client, self._path, document_id or uuid.uuid4().hex[:20])
+
+    def add(self, data: dict, document_id: Optional[str] = None):
+        reference = self.document(document_id)
+        reference.set(data)
+        return datetime.utcnow(), reference
+
+    def _results(self) -> List[FakeDocumentSnapshot]:
+        with self._client._lock:
+            items = list(self._client._collection(self._path).items())
+            update_times = {document_id: self._client._update_times.get((self._path, document_id)) for document_id, _ in items}
+        rows = [
+            (document_id, data) for document_id, data in items
+            if all(_matches(data.get(field), op, value) for field, op, value in self._filters)
+        ]
+        # 뒤의 정렬 기준부터 안정 정렬
+        for field, descending in reversed(self._orders):
+            rows.sort(key=lambda row: (row[1].get(field) is None, row[1].get(field)), reverse=descending)
+        if self._cursor is not None:
+            rows = [row for row in rows if _after_cursor(row[1], self._orders, self._cursor)]
+        rows = rows[self._offset:]
+        if self._limit is not None:
+            rows = rows[:self._limit]
+        return [
+            FakeDocumentSnapshot(FakeDocumentReference(self._client, self._path, document_id), dict(data), update_times[document_id])
+            for document_id, data in rows
+        ]
+
+    def stream(self, *args, **kwargs) -> Iterable[FakeDocumentSnapshot]:
+        self._client._round_trip()
+        yield from self._results()
+
+    def get(self, *args, **kwargs) -> List[FakeDocumentSnapshot]:
+        self._client._round_trip()
+        return self._results()
+
+class FakeWriteBatch:
+    """create/set/update/delete를 모았다가 commit 한 번(왕복 1회)에 원자적으로 적용"""
+
+    def __init__(self, client: "FakeFirestore"):
+        self._client = client
+        self._writes: List[Tuple] = []
+
+    def create(self, reference: FakeDocumentReference, data: dict):
+        self._writes.append(("create", reference, data, None))
+
+    def set(self, reference: FakeDocumentReference, data: dict, merge: bool = False):
+        self._writes.append(("set", reference, data, merge))
+
+    def update(self, reference: FakeDocumentReference, data: dict, option: Optional[WriteOption] = None):
+        self._writes.append(("update", reference, data, option))
+
+    def delete(self, reference: FakeDocumentReference):
+        self._writes.append(("delete", reference, None, None))
+
+    def commit(self):
+        self._client._round_trip()
+        with self._client._lock:
+            # 조건을 모두 확인한 뒤에 적용 (하나라도 어긋나면 아무것도 쓰지 않음)
+            for kind, reference, _, option in self._writes:
+                self._client._check(kind, reference, option)
+            for kind, reference, data, merge in self._writes:
+                if kind in ("create", "set"):
+                    self._client._write_set(reference._collection_path, reference.id, data, kind == "set" and merge)
+                elif kind == "update":
+                    self._client._write_update(reference._collection_path, reference.id, data)
+                else:
+                    self._client._delete(reference._collection_path, reference.id)
+        writes, self._writes = self._writes, []
+        return writes
+
+class FakeFirestore:
+    """
+    Thread-safe in-memory Firestore client.
+
+    Supports collection().where().order_by().start_after().limit().stream()/get(),
+    document() get/create/set/update/delete, add(), get_all(), Increment field transforms,
+    last_update_time preconditions, subcollections and write batches. Every round trip
+    sleeps for `latency` seconds (releasing the GIL, like network I/O) and is counted
+    in `rpc_count`.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self._data: Dict[str, Dict[str, dict]] = {}
+        # 문서별 마지막 쓰기 순번 (스냅샷의 update_time)
+        self._update_times: Dict[Tuple[str, str], int] = {}
+        self._write_counter = itertools.count(1)
+        self._lock = threading.RLock()
+        self._rpc_counter = itertools.count()
+        self._rpcs = 0
+
+    @property
+    def rpc_count(self) -> int:
+        return self._rpcs
+
+    def _round_trip(self):
+        self._rpcs = next(self._rpc_counter) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _collection(self, path: str) -> Dict[str, dict]:
+        return self._data.setdefault(path, {})
+
+    def _snapshot(self, reference: FakeDocumentReference) -> FakeDocumentSnapshot:
+        data = self._collection(reference._collection_path).get(reference.id)
+        update_time = self._update_times.get((reference._collection_path, reference.id))
+        return FakeDocumentSnapshot(reference, dict(data) if data is not None else None, update_time)
+
+    def _check(self, kind: str, reference: FakeDocumentReference, option: Optional[WriteOption]):
+        exists = reference.id in self._collection(reference._collection_path)
+        if kind == "create" and exists:
+            raise AlreadyExists(reference.path)
+        if kind == "update" and not exists:
+            raise NotFound(reference.path)
+        if isinstance(option, WriteOption) and self._update_times.get((reference._collection_path, reference.id)) != option.last_update_time:
+            raise FailedPrecondition(reference.path)
+
+    def _write_set(self, path: str, document_id: str, data: dict, merge: bool):
+        collection = self._collection(path)
+        collection[document_id] = _apply(collection.get(document_id) if merge else None, data)
+        self._update_times[(path, document_id)] = next(self._write_counter)
+
+    def _write_update(self, path: str, document_id: str, data: dict):
+        collection = self._collection(path)
+        if document_id not in collection:
+            raise NotFound(f"{path}/{document_id}")
+        collection[document_id] = _apply(collection[document_id], data)
+        self._update_times[(path, document_id)] = next(self._write_counter)
+
+    def _delete(self, path: str, document_id: str):
+        self._collection(path).pop(document_id, None)
+        self._update_times.pop((path, document_id), None)
+
+    def collection(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def document(self, path: str) -> FakeDocumentReference:
+        collection_path, document_id = path.rsplit("/", 1)
+        return FakeDocumentReference(self, collection_path, document_id)
+
+    def batch(self) -> FakeWriteBatch:
+        return FakeWriteBatch(self)
+
+    def write_option(self, last_update_time: Any) -> WriteOption:
+        return WriteOption(last_update_time)
+
+    def get_all(self, references: Iterable[FakeDocumentReference], *args, **kwargs) -> Iterable[FakeDocumentSnapshot]:
+        """여러 문서를 왕복 1회로 조회 (없는 문서는 exists=False 스냅샷)"""
+        self._round_trip()
+        with self._lock:
+            snapshots = []
+            for reference in references:
+                snapshots.append(self._snapshot(reference))
+        yield from snapshots
+
+    def seed(self, collection: str, documents: Dict[str, dict]):
+        """왕복 지연 없이 초기 데이터 적재"""
+        with self._lock:
+            self._collection(collection).update({document_id: dict(data) for document_id, data in documents.items()})
+            for document_id in documents:
+                self._update_times[(collection, document_id)] = next(self._write_counter)
+
+    def count(self, collection: str) -> int:
+        with self._lock:
+            return len(self._collection(collection))
@@ -1,8 +1,8 @@
 # backend/src/utils/auth_decorators.py
 # Role-based access control decorators
 
-from fastapi import Depends, HTTPException, status
-from typing import List
+from fastapi import Depends, HTTPException, Query, WebSocket, WebSocketException, status
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from ..database import schemas
 from ..services.auth_service import get_current_user_from_token, get_db
@@ -20,3 +20,28 @@ def has_role(roles: List[UserRole]):
             )
         return current_user
     return role_checker
+
+async def get_current_user_ws(websocket: WebSocket, token: Optional[str] = Query(None), db: Session = Depends(get_db)):
+    """
+    get_current_user for websocket routes. OAuth2PasswordBearer only reads HTTP requests,
+    and browsers cannot set headers on a websocket, so the bearer token is taken from the
+    Authorization header or the `token` query parameter. Failures close the socket
+    with 1008 before it is accepted.
+    """
+    scheme, _, credentials = websocket.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and credentials:
+        token = credentials
+    if not token:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Not authenticated")
+    try:
+        return await get_current_user_from_token(token, db)
+    except HTTPException:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Could not validate credentials")
+
+def has_role_ws(roles: List[UserRole]):
+    """has_role for websocket routes (see get_current_user_ws)"""
+    async def role_checker(current_user: schemas.UserInDB = Depends(get_current_user_ws)):
+        if current_user.role not in roles:
+            raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Not enough permissions")
+        return current_user
+    return role_checker
@@ -0,0 +1,30 @@
+# backend/src/utils/blocking.py
+# Dedicated thread pool for blocking Firestore/Firebase calls made from async handlers
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+from ..config import settings
+from .lazy import LazyProxy
+from .metrics import registry
+
+# 기본 스레드풀(동기 라우트, 40개)과 분리: Firestore 지연이 길어져도 다른 라우트가 밀리지 않게 함
+_executor = LazyProxy(lambda: ThreadPoolExecutor(max_workers=settings.FIRESTORE_THREADS, thread_name_prefix="firestore"))
+
+FIRESTORE_CALLS_IN_FLIGHT = registry.gauge("firestore_threadpool_calls_in_flight", "Blocking Firestore calls queued or running on the Firestore thread pool")
+
+async def run_blocking(function: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Await a blocking call on the Firestore thread pool instead of running it on the
+    event loop.
+
+    At most FIRESTORE_THREADS calls run at once; the rest wait in the pool's queue.
+    The caller's context variables (request trace, per-request RPC counter) are copied
+    into the worker thread, so the calls are still attributed to the request.
+    """
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, function, *args, **kwargs)
+    with FIRESTORE_CALLS_IN_FLIGHT.track_inprogress():
+        return await asyncio.get_running_loop().run_in_executor(_executor, call)
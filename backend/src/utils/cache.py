@@ -0,0 +1,46 @@
+# backend/src/utils/cache.py
+# Small thread-safe in-process TTL cache
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+class TTLCache:
+    """
+    Keeps computed values for `ttl_seconds`. get_or_set() computes a missing or
+    expired value once even when several requests miss at the same time. A value
+    whose computation overlapped an invalidate() is returned but not stored.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()  # 계산 직렬화 (동시 미스에 한 번만 계산)
+        self._state_lock = threading.Lock()  # 항목·세대 갱신 (계산 중에도 무효화가 기다리지 않도록 분리)
+        self._generation = 0
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        with self._lock:
+            # 다른 스레드가 먼저 계산했는지 다시 확인
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            generation = self._generation
+            value = factory()
+            with self._state_lock:
+                # 계산 도중 무효화되었으면 이전 데이터일 수 있으므로 저장하지 않음
+                if self._generation == generation:
+                    self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            return value
+
+    def invalidate(self, key: Hashable = None):
+        """키 하나 또는 (None이면) 전체 무효화"""
+        with self._state_lock:
+            self._generation += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
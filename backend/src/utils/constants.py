@@ -8,3 +8,38 @@ class UserRole(str, Enum):
     HEAD_TEACHER = "head_teacher" # 부장선생님
     HOMEROOM_TEACHER = "homeroom_teacher" # 담임선생님
     STUDENT = "student"
+
+class UploadStatus(str, Enum):
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    DUPLICATE = "duplicate" # 같은 파일을 다른 작업(프로세스)이 처리 중이라 이 작업은 반영하지 않음
+
+class UploadMode(str, Enum):
+    APPEND = "append" # 모든 행을 새 성적으로 저장
+    DIFF = "diff" # 기존 학생과 비교해 변경된 행만 반영 (시트에 있는 반에서 빠진 학생만 삭제)
+    FULL = "full" # diff와 같지만 시트를 해당 학년 전체 명단으로 보고 빠진 학생을 삭제
+
+# 성적 파일 O열(내신석차백분율)을 저장하는 Grade.subject 값
+PERCENTILE_SUBJECT = "내신석차백분율"
+
+class PriorityType(str, Enum):
+    WITHIN_QUOTA = "WITHIN_QUOTA" # 정원내 우선선발
+    OUTSIDE_QUOTA = "OUTSIDE_QUOTA" # 정원외 우선선발
+
+class NotificationChannel(str, Enum):
+    IN_APP = "in_app" # notifications 컬렉션 (앱 내 알림함)
+    EMAIL = "email"
+    WEBSOCKET = "websocket" # 접속 중인 사용자에게 즉시 전달
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    SUPERSEDED = "superseded" # 같은 알림의 최신 이벤트로 대체됨
+    FAILED = "failed" # 재시도 횟수 초과
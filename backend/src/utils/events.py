@@ -0,0 +1,30 @@
+# backend/src/utils/events.py
+# In-process change events between services
+
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 종류
+SCHOOL_QUOTA_CHANGED = "school_quota_changed"
+APPLICATIONS_CHANGED = "applications_changed"
+ACADEMIC_YEAR_ARCHIVED = "academic_year_archived"
+
+_subscribers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = defaultdict(list)
+
+def subscribe(event_type: str, handler: Callable[[Dict[str, Any]], None]):
+    """이벤트 구독 (모듈 import 시점에 등록)"""
+    _subscribers[event_type].append(handler)
+
+def publish(event_type: str, payload: Dict[str, Any]):
+    """
+    Deliver an event to every subscriber synchronously.
+    A failing subscriber is logged and does not stop the others.
+    """
+    for handler in list(_subscribers[event_type]):
+        try:
+            handler(payload)
+        except Exception:
+            logger.exception(f"Event handler failed for {event_type}")
@@ -0,0 +1,47 @@
+# backend/src/utils/fast_json.py
+# Fast JSON response path for large list responses
+
+import json
+from functools import lru_cache
+from typing import Any, List, Sequence, Type
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json 사용
+    orjson = None
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """모델별 List[model] TypeAdapter (스키마 빌드는 한 번만)"""
+    return TypeAdapter(List[model])
+
+def dump_list(model: Type[BaseModel], items: Sequence[Any]) -> bytes:
+    """
+    Serialize a list of `model` to JSON bytes.
+
+    Items that are already `model` instances are trusted and dumped as-is, skipping the
+    re-validation FastAPI's response_model does. Anything else (e.g. ORM rows) is
+    validated once with from_attributes.
+    """
+    adapter = list_adapter(model)
+    if not all(isinstance(item, model) for item in items):
+        items = adapter.validate_python(items, from_attributes=True)
+    return adapter.dump_json(items)
+
+def dumps(content: Any) -> bytes:
+    """dict/list 등 일반 값 직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+def list_response(model: Type[BaseModel], items: Sequence[Any], status_code: int = 200) -> Response:
+    """
+    Opt-in fast path for list endpoints. Keep response_model on the route for the
+    OpenAPI schema; returning a Response makes FastAPI skip its own encoding.
+    """
+    return Response(content=dump_list(model, items), status_code=status_code, media_type="application/json")
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    return Response(content=dumps(content), status_code=status_code, media_type="application/json")
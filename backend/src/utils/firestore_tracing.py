@@ -0,0 +1,285 @@
+# backend/src/utils/firestore_tracing.py
+# Per-request Firestore round-trip tracing and N+1 detection
+
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from ..config import settings
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# 라우트별 요청당 Firestore 호출 상한 (FIRESTORE_RPC_BUDGET_STRICT일 때 초과하면 실패)
+ROUTE_RPC_BUDGETS: Dict[str, int] = {
+    "/approval/pending-users": 2,
+    "/approval/approve-user": 5,
+    "/approval/history": 2,
+    "/approval/statistics": 4,
+    "/auth/me": 2,
+    "/auth/pending-users": 2,
+    "/notifications": 1,
+    "/notifications/unread-count": 1,
+    "/notifications/read": 2,
+}
+
+class RPCBudgetExceeded(AssertionError):
+    """Raised in strict mode when a request makes more Firestore calls than allowed."""
+
+@dataclass
+class FirestoreCall:
+    operation: str  # get | stream | add | set | update | delete | commit
+    shape: str  # 값이 아닌 형태: "users/*", "users where is_approved =="
+    duration_ms: float
+
+@dataclass
+class RequestTrace:
+    route: str = ""
+    calls: List[FirestoreCall] = field(default_factory=list)
+
+    @property
+    def rpc_count(self) -> int:
+        return len(self.calls)
+
+    def n_plus_one(self, threshold: int = None) -> Dict[str, int]:
+        """같은 형태의 읽기가 threshold번 이상 반복된 경우 (예: 루프 안의 document().get())"""
+        threshold = threshold or settings.FIRESTORE_N_PLUS_ONE_THRESHOLD
+        reads = Counter(f"{call.operation} {call.shape}" for call in self.calls if call.operation in ("get", "stream"))
+        return {shape: count for shape, count in reads.items() if count >= threshold}
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar("firestore_trace", default=None)
+
+def _record(operation: str, shape: str, started: float):
+    duration_ms = (time.perf_counter() - started) * 1000
+    metrics.count_firestore_rpc()
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.calls.append(FirestoreCall(operation, shape, round(duration_ms, 3)))
+
+class TracedDocument:
+    def __init__(self, reference, shape: str):
+        self._reference = reference
+        self._shape = shape
+
+    def _call(self, operation: str, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return getattr(self._reference, operation)(*args, **kwargs)
+        finally:
+            _record(operation, self._shape, started)
+
+    def get(self, *args, **kwargs):
+        return self._call("get", *args, **kwargs)
+
+    def create(self, *args, **kwargs):
+        return self._call("create", *args, **kwargs)
+
+    def set(self, *args, **kwargs):
+        return self._call("set", *args, **kwargs)
+
+    def update(self, *args, **kwargs):
+        return self._call("update", *args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        return self._call("delete", *args, **kwargs)
+
+    def collection(self, name: str):
+        return TracedQuery(self._reference.collection(name), f"{self._shape}/{name}")
+
+    def __getattr__(self, name: str):
+        return getattr(self._reference, name)
+
+class TracedQuery:
+    """Wraps a CollectionReference or Query; filters add to the shape, not the values."""
+
+    def __init__(self, query, shape: str):
+        self._query = query
+        self._shape = shape
+
+    def _chain(self, method: str, description: str, *args, **kwargs):
+        return TracedQuery(getattr(self._query, method)(*args, **kwargs), f"{self._shape} {description}")
+
+    def where(self, field_path=None, op_string=None, value=None, **kwargs):
+        if field_path is None:
+            return self._chain("where", "where <filter>", **kwargs)
+        return self._chain("where", f"where {field_path} {op_string}", field_path, op_string, value, **kwargs)
+
+    def order_by(self, field_path, *args, **kwargs):
+        return self._chain("order_by", f"order_by {field_path}", field_path, *args, **kwargs)
+
+    def limit(self, count):
+        return self._chain("limit", "limit", count)
+
+    def offset(self, count):
+        return self._chain("offset", "offset", count)
+
+    def start_after(self, *args, **kwargs):
+        return self._chain("start_after", "start_after", *args, **kwargs)
+
+    def document(self, document_id: str = None):
+        return TracedDocument(self._query.document(document_id), f"{self._shape}/*")
+
+    def add(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return self._query.add(*args, **kwargs)
+        finally:
+            _record("add", self._shape, started)
+
+    def get(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return self._query.get(*args, **kwargs)
+        finally:
+            _record("get", self._shape, started)
+
+    def stream(self, *args, **kwargs):
+        """스트림 전체를 소비할 때까지를 한 번의 호출로 기록"""
+        started = time.perf_counter()
+        try:
+            yield from self._query.stream(*args, **kwargs)
+        finally:
+            _record("stream", self._shape, started)
+
+    def __getattr__(self, name: str):
+        return getattr(self._query, name)
+
+class TracedBatch:
+    def __init__(self, batch):
+        self._batch = batch
+
+    def create(self, reference, *args, **kwargs):
+        return self._batch.create(getattr(reference, "_reference", reference), *args, **kwargs)
+
+    def set(self, reference, *args, **kwargs):
+        return self._batch.set(getattr(reference, "_reference", reference), *args, **kwargs)
+
+    def update(self, reference, *args, **kwargs):
+        return self._batch.update(getattr(reference, "_reference", reference), *args, **kwargs)
+
+    def delete(self, reference, *args, **kwargs):
+        return self._batch.delete(getattr(reference, "_reference", reference), *args, **kwargs)
+
+    def commit(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return self._batch.commit(*args, **kwargs)
+        finally:
+            _record("commit", "batch", started)
+
+    def __getattr__(self, name: str):
+        return getattr(self._batch, name)
+
+class TracedClient:
+    """
+    Drop-in wrapper around a Firestore client that times and counts every round trip
+    (document get/create/set/update/delete, query get/stream, add, batch commit, get_all).
+    """
+
+    def __init__(self, client):
+        self._client = client
+
+    def collection(self, name: str):
+        return TracedQuery(self._client.collection(name), name)
+
+    def document(self, path: str):
+        collection = path.split("/")[0]
+        return TracedDocument(self._client.document(path), f"{collection}/*")
+
+    def batch(self):
+        return TracedBatch(self._client.batch())
+
+    def get_all(self, references, *args, **kwargs):
+        """여러 문서를 한 번의 왕복으로 조회"""
+        references = list(references)
+        shape = getattr(references[0], "_shape", "documents") if references else "documents"
+        started = time.perf_counter()
+        try:
+            yield from self._client.get_all([getattr(reference, "_reference", reference) for reference in references], *args, **kwargs)
+        finally:
+            _record("get_all", shape, started)
+
+    def __getattr__(self, name: str):
+        return getattr(self._client, name)
+
+class RouteSummaries:
+    """라우트별 누적 Firestore 호출 통계"""
+
+    def __init__(self):
+        self._routes: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
+            "requests": 0, "rpcs": 0, "max_rpcs": 0, "rpc_ms": 0.0, "n_plus_one_requests": 0, "shapes": Counter(),
+        })
+        self._lock = threading.Lock()
+
+    def add(self, trace: RequestTrace, n_plus_one: Dict[str, int]):
+        with self._lock:
+            summary = self._routes[trace.route]
+            summary["requests"] += 1
+            summary["rpcs"] += trace.rpc_count
+            summary["max_rpcs"] = max(summary["max_rpcs"], trace.rpc_count)
+            summary["rpc_ms"] += sum(call.duration_ms for call in trace.calls)
+            summary["n_plus_one_requests"] += 1 if n_plus_one else 0
+            summary["shapes"].update(f"{call.operation} {call.shape}" for call in trace.calls)
+
+    def report(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            routes = [(route, dict(summary, shapes=summary["shapes"].most_common(5))) for route, summary in self._routes.items()]
+        return [
+            {
+                "route": route,
+                "requests": summary["requests"],
+                "avg_rpcs": round(summary["rpcs"] / summary["requests"], 2),
+                "max_rpcs": summary["max_rpcs"],
+                "avg_rpc_ms": round(summary["rpc_ms"] / summary["requests"], 2),
+                "budget": ROUTE_RPC_BUDGETS.get(route),
+                "n_plus_one_requests": summary["n_plus_one_requests"],
+                "top_calls": [{"call": shape, "count": count} for shape, count in summary["shapes"]],
+            }
+            for route, summary in sorted(routes, key=lambda item: item[1]["rpcs"], reverse=True)
+        ]
+
+    def clear(self):
+        with self._lock:
+            self._routes.clear()
+
+route_summaries = RouteSummaries()
+
+@contextmanager
+def trace_firestore(route: str = ""):
+    """이 블록 안의 Firestore 호출을 하나의 RequestTrace로 수집"""
+    trace = RequestTrace(route=route)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+def check_budget(trace: RequestTrace, budget: Optional[int]):
+    if budget is not None and trace.rpc_count > budget:
+        calls = ", ".join(f"{shape} x{count}" for shape, count in Counter(f"{c.operation} {c.shape}" for c in trace.calls).most_common())
+        raise RPCBudgetExceeded(f"{trace.route or 'block'} made {trace.rpc_count} Firestore calls (budget {budget}): {calls}")
+
+@contextmanager
+def assert_rpc_budget(budget: int, route: str = ""):
+    """테스트용: 블록 안의 Firestore 호출이 budget을 넘으면 실패"""
+    with trace_firestore(route) as trace:
+        yield trace
+    check_budget(trace, budget)
+
+async def firestore_tracing_middleware(request, call_next):
+    with trace_firestore() as trace:
+        response = await call_next(request)
+        trace.route = getattr(request.scope.get("route"), "path", "unmatched")
+    if not trace.calls:
+        return response
+    n_plus_one = trace.n_plus_one()
+    if n_plus_one:
+        logger.warning(f"Possible N+1 Firestore reads on {request.method} {trace.route}: {n_plus_one}")
+    route_summaries.add(trace, n_plus_one)
+    if settings.FIRESTORE_RPC_BUDGET_STRICT:
+        check_budget(trace, ROUTE_RPC_BUDGETS.get(trace.route))
+    return response
@@ -0,0 +1,92 @@
+# backend/src/utils/import_profile.py
+# Import-time profiling (python -X importtime) for the cold-start budget
+#
+# Usage (from backend/): python -m src.utils.import_profile src.app --output importtime.txt
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+from ..config import settings
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+@dataclass(frozen=True)
+class ImportEntry:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """Parsed -X importtime output of one fresh interpreter."""
+    modules: Sequence[str]
+    entries: List[ImportEntry]
+
+    @property
+    def total_ms(self) -> float:
+        """최상위 import 누적 시간 합 (ms)"""
+        return sum(entry.cumulative_us for entry in self.entries if entry.depth == 0) / 1000
+
+    @property
+    def module_names(self) -> set:
+        return {entry.module for entry in self.entries}
+
+    def slowest(self, count: int = 25) -> List[ImportEntry]:
+        return sorted(self.entries, key=lambda entry: entry.cumulative_us, reverse=True)[:count]
+
+    def report(self, count: int = 25, budget_ms: Optional[float] = None) -> str:
+        lines = [f"import profile: {', '.join(self.modules)}", f"total: {self.total_ms:.1f} ms"]
+        if budget_ms is not None:
+            lines.append(f"budget: {budget_ms:.1f} ms ({'ok' if self.total_ms <= budget_ms else 'EXCEEDED'})")
+        lines.append(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for entry in self.slowest(count):
+            lines.append(f"{entry.cumulative_us / 1000:>14.1f} {entry.self_us / 1000:>9.1f}  {'  ' * entry.depth}{entry.module}")
+        return "\n".join(lines) + "\n"
+
+def parse_importtime(output: str) -> List[ImportEntry]:
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        entries.append(ImportEntry(module=name.strip(), self_us=int(self_us), cumulative_us=int(cumulative_us), depth=depth))
+    return entries
+
+def profile_imports(modules: Sequence[str], cwd: Path = BACKEND_DIR) -> ImportProfile:
+    """
+    Import `modules` in a fresh interpreter with -X importtime and parse the result.
+
+    Raises:
+        RuntimeError: if the import itself fails
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        cwd=cwd, capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        # -X importtime 줄을 빼고 남은 traceback의 마지막 줄(예외 메시지)을 사용
+        errors = [line for line in completed.stderr.splitlines() if line.strip() and not line.startswith("import time:")]
+        raise RuntimeError(errors[-1] if errors else "import failed")
+    return ImportProfile(modules=tuple(modules), entries=parse_importtime(completed.stderr))
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time profile against COLD_START_BUDGET_MS")
+    parser.add_argument("modules", nargs="*", default=["src.app"])
+    parser.add_argument("--output", type=Path, help="write the report to this file")
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args()
+
+    profile = profile_imports(args.modules)
+    report = profile.report(args.top, settings.COLD_START_BUDGET_MS)
+    if args.output:
+        args.output.write_text(report, encoding="utf-8")
+    print(report, end="")
+    sys.exit(0 if profile.total_ms <= settings.COLD_START_BUDGET_MS else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# backend/src/utils/lazy.py
+# Deferred initialization of heavy clients
+
+import threading
+from typing import Any, Callable
+
+class LazyProxy:
+    """
+    Stands in for an object that is expensive to create (e.g. the Firestore client).
+    The factory runs once, on the first attribute access, instead of at import time.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_target", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _resolve(self) -> Any:
+        target = object.__getattribute__(self, "_target")
+        if target is None:
+            with object.__getattribute__(self, "_lock"):
+                target = object.__getattribute__(self, "_target")
+                if target is None:
+                    target = object.__getattribute__(self, "_factory")()
+                    object.__setattr__(self, "_target", target)
+        return target
+
+    @property
+    def is_initialized(self) -> bool:
+        return object.__getattribute__(self, "_target") is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._resolve(), name, value)
@@ -0,0 +1,224 @@
+# backend/src/utils/metrics.py
+# In-process metrics registry exported in Prometheus text format
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# 기본 지연 시간 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class _ThreadShards:
+    """
+    One value dict per thread. Writers only touch their own thread's dict, so updates
+    need no lock; readers sum every shard at scrape time.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._lock = threading.Lock()
+
+    def local(self) -> dict:
+        try:
+            return self._local.values
+        except AttributeError:
+            values = {}
+            with self._lock:
+                self._shards.append(values)
+            self._local.values = values
+            return values
+
+    def shards(self) -> List[dict]:
+        with self._lock:
+            return [dict(shard) for shard in self._shards]
+
+def _label_key(label_names: Sequence[str], labels: dict) -> Tuple[str, ...]:
+    return tuple(str(labels.get(name, "")) for name in label_names)
+
+def _format_labels(label_names: Sequence[str], key: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{value}"' for name, value in zip(label_names, key)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name, self.help_text, self.label_names = name, help_text, tuple(label_names)
+        self._shards = _ThreadShards()
+
+    def inc(self, amount: float = 1, **labels):
+        values = self._shards.local()
+        key = _label_key(self.label_names, labels)
+        values[key] = values.get(key, 0) + amount
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        totals: Dict[Tuple[str, ...], float] = {}
+        for shard in self._shards.shards():
+            for key, value in shard.items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def render(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self.label_names, key)} {value}" for key, value in sorted(self.values().items())]
+
+class Gauge(Counter):
+    """inc/dec 게이지 (스레드별 합산) 또는 수집 시점에 값을 읽는 콜백 게이지"""
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (), callback: Optional[Callable[[], float]] = None):
+        super().__init__(name, help_text, label_names)
+        self._callback = callback
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    @contextmanager
+    def track_inprogress(self, **labels):
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        if self._callback is not None:
+            return {(): self._callback()}
+        return super().values()
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name, self.help_text, self.label_names = name, help_text, tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._shards = _ThreadShards()
+
+    def observe(self, value: float, **labels):
+        values = self._shards.local()
+        key = _label_key(self.label_names, labels)
+        state = values.get(key)
+        if state is None:
+            # 버킷별 개수 + (+Inf), 합계
+            state = values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def values(self) -> Dict[Tuple[str, ...], list]:
+        totals: Dict[Tuple[str, ...], list] = {}
+        for shard in self._shards.shards():
+            for key, state in shard.items():
+                total = totals.setdefault(key, [0] * len(state))
+                for index, value in enumerate(list(state)):
+                    total[index] += value
+        return totals
+
+    def render(self) -> List[str]:
+        lines = []
+        for key, state in sorted(self.values().items()):
+            cumulative = 0
+            for bound, count in zip(list(self.buckets) + ["+Inf"], state[:-1]):
+                cumulative += count
+                bucket_label = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, bucket_label)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {state[-1]}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, key)} {cumulative}")
+        return lines
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, label_names))
+
+    def gauge(self, name: str, help_text: str, label_names: Sequence[str] = (), callback: Optional[Callable[[], float]] = None) -> Gauge:
+        return self._register(Gauge(name, help_text, label_names, callback))
+
+    def histogram(self, name: str, help_text: str, label_names: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, label_names, buckets))
+
+    def get(self, name: str):
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        lines = []
+        for metric in list(self._metrics.values()):
+            try:
+                samples = metric.render()
+            except Exception:
+                continue  # 콜백 실패는 해당 지표만 생략
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+registry = MetricsRegistry()
+
+# 요청 단위 지표
+HTTP_REQUEST_DURATION = registry.histogram("http_request_duration_seconds", "Request latency by route", ("method", "route", "status"))
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge("http_requests_in_flight", "Requests currently being handled")
+FIRESTORE_RPCS_PER_REQUEST = registry.histogram("firestore_rpcs_per_request", "Firestore round trips per request", ("route",), buckets=(0, 1, 2, 5, 10, 20, 50, 100))
+
+# 업무 지표
+GRADE_UPLOAD_JOBS = registry.counter("grade_upload_jobs_total", "Finished grade upload jobs", ("status",))
+GRADE_UPLOAD_ROWS = registry.counter("grade_upload_rows_total", "Grade rows processed by upload jobs")
+RANKING_RECOMPUTE_SECONDS = registry.histogram("ranking_recompute_seconds", "Time to recompute one school's rankings")
+SNAPSHOT_REFRESH_SECONDS = registry.histogram("competition_snapshot_refresh_seconds", "Time to rebuild one school's competition snapshot")
+WEBSOCKET_SUBSCRIBERS = registry.gauge("websocket_subscribers", "Open websocket subscriptions", ("channel",))
+
+# 요청 처리 중 Firestore 호출 횟수 (미들웨어가 요청마다 새 카운터를 설정)
+_firestore_rpcs: ContextVar[Optional[list]] = ContextVar("firestore_rpcs", default=None)
+
+def count_firestore_rpc(amount: int = 1):
+    """Firestore 왕복 1회 기록 (요청 밖에서는 무시)"""
+    counter = _firestore_rpcs.get()
+    if counter is not None:
+        counter[0] += amount
+
+@contextmanager
+def firestore_rpc_scope():
+    counter = [0]
+    token = _firestore_rpcs.set(counter)
+    try:
+        yield counter
+    finally:
+        _firestore_rpcs.reset(token)
+
+async def metrics_middleware(request, call_next):
+    """요청별 지연 시간, 처리 중 요청 수, Firestore 호출 횟수 기록"""
+    started = time.perf_counter()
+    status_code = 500
+    with HTTP_REQUESTS_IN_FLIGHT.track_inprogress(), firestore_rpc_scope() as firestore_rpcs:
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            # 경로 템플릿을 라벨로 사용 (/students/{student_id}), 매칭 실패는 하나로 묶음
+            route = getattr(request.scope.get("route"), "path", "unmatched")
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, method=request.method, route=route, status=status_code)
+            FIRESTORE_RPCS_PER_REQUEST.observe(firestore_rpcs[0], route=route)
@@ -0,0 +1,180 @@
+# backend/src/utils/profiling.py
+# Opt-in sampling profiler for individual requests (collapsed-stack output)
+
+import asyncio
+import hmac
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+from ..config import settings
+
+PROFILE_HEADER = "x-profile-token"
+SAMPLER_THREAD_NAME = "request-profiler"
+MAX_STACK_DEPTH = 128
+
+# 대기 중인 스레드의 맨 위 프레임 (샘플에서 제외)
+IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+# 요약에 쓰는 프레임 분류 (파일 경로에 포함된 문자열)
+CATEGORIES = {
+    "firestore": ("google/cloud/firestore", "grpc", "firebase_admin"),
+    "pydantic": ("pydantic",),
+    "crypto": ("cryptography", "bcrypt", "passlib", "jose", "encryption"),
+    "database": ("sqlalchemy",),
+}
+
+@dataclass
+class RequestProfile:
+    """One captured request profile."""
+    profile_id: str
+    method: str
+    path: str
+    status_code: int
+    duration_ms: float
+    samples: int
+    stacks: Dict[str, int]
+    categories: Dict[str, float]
+    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+    def collapsed(self) -> str:
+        """flamegraph.pl / speedscope 입력용 collapsed-stack 텍스트"""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+    def summary(self) -> dict:
+        return {
+            "profile_id": self.profile_id,
+            "method": self.method,
+            "path": self.path,
+            "status_code": self.status_code,
+            "duration_ms": self.duration_ms,
+            "samples": self.samples,
+            "categories": self.categories,
+            "created_at": self.created_at,
+        }
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+def _collapse(frame) -> Optional[str]:
+    """루트부터 ';'로 이은 스택, 대기 중인 스레드면 None"""
+    leaf = frame.f_code
+    if (os.path.basename(leaf.co_filename), leaf.co_name) in IDLE_LEAVES:
+        return None
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+class StackSampler(threading.Thread):
+    """
+    Samples every busy thread's Python stack at a fixed interval until stopped.
+
+    Threads are sampled from outside via sys._current_frames(), so the profiled code
+    runs unmodified. Async handlers share the event loop thread, so a sample can include
+    other requests in flight at the same time.
+    """
+
+    def __init__(self, interval: float):
+        super().__init__(name=SAMPLER_THREAD_NAME, daemon=True)
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.category_samples: Counter = Counter()
+        self.samples = 0
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            self.samples += 1
+            for thread_id, frame in sys._current_frames().items():
+                name = names.get(thread_id, str(thread_id))
+                if name.startswith(SAMPLER_THREAD_NAME):
+                    continue
+                stack = _collapse(frame)
+                if stack is None:
+                    continue
+                self.stacks[f"{name};{stack}"] += 1
+                for category, markers in CATEGORIES.items():
+                    if any(marker in stack for marker in markers):
+                        self.category_samples[category] += 1
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+class ProfileStore:
+    """최근 프로파일 보관 (오래된 것부터 밀려남)"""
+
+    def __init__(self, max_profiles: int = settings.PROFILE_RETENTION):
+        self._profiles = deque(maxlen=max_profiles)
+        self._lock = threading.Lock()
+
+    def add(self, profile: RequestProfile):
+        with self._lock:
+            self._profiles.append(profile)
+
+    def list(self) -> List[RequestProfile]:
+        with self._lock:
+            return list(reversed(self._profiles))
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        return next((profile for profile in self.list() if profile.profile_id == profile_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._profiles.clear()
+
+profile_store = ProfileStore()
+
+def should_profile(request) -> bool:
+    """
+    Profile when the request carries the admin profiling token, or when it falls in
+    the PROFILE_SAMPLE_RATE sample. Costs one header lookup when profiling is off.
+    """
+    token = request.headers.get(PROFILE_HEADER)
+    # 상수 시간 비교 (응답 시간으로 토큰을 추측하지 못하게 함)
+    if token is not None and settings.PROFILING_TOKEN and hmac.compare_digest(token.encode(), settings.PROFILING_TOKEN.encode()):
+        return True
+    return settings.PROFILE_SAMPLE_RATE > 0 and random.random() < settings.PROFILE_SAMPLE_RATE
+
+async def profiling_middleware(request, call_next):
+    if not should_profile(request):
+        return await call_next(request)
+
+    sampler = StackSampler(settings.PROFILE_INTERVAL_MS / 1000)
+    started = time.perf_counter()
+    sampler.start()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        # stop()은 샘플러 스레드를 join하므로 이벤트 루프 밖에서 기다림
+        await asyncio.get_running_loop().run_in_executor(None, sampler.stop)
+        busy = sum(sampler.stacks.values()) or 1
+        profile = RequestProfile(
+            profile_id=uuid.uuid4().hex,
+            method=request.method,
+            path=request.url.path,
+            status_code=status_code,
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+            samples=sampler.samples,
+            stacks=dict(sampler.stacks),
+            categories={category: round(count / busy, 3) for category, count in sampler.category_samples.items()},
+        )
+        profile_store.add(profile)
+    response.headers["X-Profile-Id"] = profile.profile_id
+    return response
@@ -0,0 +1,130 @@
+# backend/tests/test_admission_simulation.py
+# Unit tests for the admission allocation and Monte Carlo simulation
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+from unittest.mock import patch
+
+from src.database import models, schemas
+from src.services import admission_simulation_service as simulation
+from src.services.admission_simulation_service import SimulationInputs, TRACK_GENERAL, TRACK_WITHIN, TRACK_OUTSIDE
+from src.utils.constants import PERCENTILE_SUBJECT, PriorityType
+
+def make_inputs(schools, applicants):
+    """schools: (within, outside, competition, gender_type) / applicants: (school_index, percentile, gender, track)"""
+    school_array = np.array(schools, dtype=np.int64).reshape(-1, 4)
+    applicant_array = np.array(applicants, dtype=np.float64).reshape(-1, 4)
+    return SimulationInputs(
+        school_ids=np.arange(1, len(school_array) + 1, dtype=np.int64),
+        priority_within_quota=school_array[:, 0],
+        priority_outside_quota=school_array[:, 1],
+        competition_quota=school_array[:, 2],
+        school_gender_type=school_array[:, 3].astype(np.int8),
+        application_ids=np.arange(len(applicant_array), dtype=np.int64),
+        student_ids=np.arange(len(applicant_array), dtype=np.int64),
+        school_index=applicant_array[:, 0].astype(np.int64),
+        percentile=applicant_array[:, 1],
+        gender=applicant_array[:, 2].astype(np.int8),
+        track=applicant_array[:, 3].astype(np.int8),
+    )
+
+class TestAllocation:
+    """Test cases for a single provincial allocation"""
+
+    def test_general_seats_go_to_best_percentiles(self):
+        inputs = make_inputs([(0, 0, 2, 0)], [(0, 30, 1, TRACK_GENERAL), (0, 10, 1, TRACK_GENERAL), (0, 20, 2, TRACK_GENERAL)])
+
+        assert simulation.allocate(inputs).tolist() == [False, True, True]
+
+    def test_gender_type_excludes_other_gender(self):
+        inputs = make_inputs([(0, 0, 2, 1)], [(0, 5, 2, TRACK_GENERAL), (0, 40, 1, TRACK_GENERAL), (0, 50, 1, TRACK_GENERAL)])
+
+        assert simulation.allocate(inputs).tolist() == [False, True, True]
+
+    def test_priority_losers_compete_and_unfilled_within_seats_roll_over(self):
+        # 정원내 우선 2석 중 1명만 지원 → 1석 일반전형 이월, 정원외 1석에 2명 지원
+        inputs = make_inputs(
+            [(2, 1, 1, 0)],
+            [
+                (0, 50, 1, TRACK_WITHIN),
+                (0, 60, 1, TRACK_OUTSIDE),
+                (0, 70, 1, TRACK_OUTSIDE),
+                (0, 10, 1, TRACK_GENERAL),
+                (0, 20, 1, TRACK_GENERAL),
+                (0, 30, 1, TRACK_GENERAL),
+            ],
+        )
+
+        assert simulation.allocate(inputs).tolist() == [True, True, False, True, True, False]
+
+class TestMonteCarlo:
+    """Test cases for Monte Carlo admission probabilities"""
+
+    inputs = make_inputs([(0, 0, 1, 0)], [(0, 10, 1, TRACK_GENERAL), (0, 10.5, 1, TRACK_GENERAL), (0, 90, 1, TRACK_GENERAL)])
+
+    @patch.object(simulation.settings, "SIMULATION_WORKERS", 1)
+    def test_probabilities_are_reproducible_with_seed(self):
+        first = simulation.run_monte_carlo(self.inputs, runs=200, noise=1.0, seed=7)
+        second = simulation.run_monte_carlo(self.inputs, runs=200, noise=1.0, seed=7)
+
+        assert np.array_equal(first, second)
+        assert first.sum() == pytest.approx(1.0)
+        assert 0.3 < first[0] < 0.9
+        assert first[2] == 0.0
+
+    @patch.object(simulation.settings, "SIMULATION_WORKERS", 2)
+    def test_runs_are_split_across_process_pool(self):
+        try:
+            probabilities = simulation.run_monte_carlo(self.inputs, runs=101, noise=1.0, seed=7)
+            assert simulation._process_pool._mp_context.get_start_method() == "spawn"
+        finally:
+            simulation.shutdown_process_pool()
+
+        assert probabilities.sum() == pytest.approx(1.0)
+        assert simulation._process_pool is None
+
+class TestSimulateAdmission:
+    """Test cases for database-backed simulation scenarios"""
+
+    def test_quota_override_changes_outcome(self, db):
+        school = models.School(name="제주고등학교", total_quota=1, priority_within_quota=0, actual_competition_quota=1, gender_type="COED")
+        db.add(school)
+        for number, percentile in enumerate([10.0, 20.0], start=1):
+            student = models.Student(name=f"학생{number}", student_id_number=f"s-{number}", gender="남")
+            student.grades.append(models.Grade(subject=PERCENTILE_SUBJECT, percentile_rank=percentile))
+            student.applications.append(models.StudentApplication(school=school))
+            db.add(student)
+        db.commit()
+
+        baseline = simulation.simulate_admission(db, schemas.AdmissionSimulationRequest(runs=0))
+        what_if = simulation.simulate_admission(db, schemas.AdmissionSimulationRequest(
+            runs=0, quota_overrides={str(school.id): schemas.SchoolQuotaUpdate(total_quota=2)},
+        ))
+
+        assert [a.admitted for a in baseline.applicants] == [True, False]
+        assert baseline.schools[0].cutoff_percentile == 10.0
+        assert [a.admission_probability for a in what_if.applicants] == [100.0, 100.0]
+
+    def test_cutoff_counts_priority_applicants_admitted_through_general(self, db):
+        # 정원외 1석에 2명 지원 → 탈락한 1명(30.0)이 일반전형 2석 중 하나로 합격
+        school = models.School(name="제주고등학교", total_quota=2, priority_within_quota=0, priority_outside_quota=1, actual_competition_quota=2, gender_type="COED")
+        db.add(school)
+        for number, (percentile, priority_type) in enumerate([(5.0, PriorityType.OUTSIDE_QUOTA), (30.0, PriorityType.OUTSIDE_QUOTA), (10.0, None), (40.0, None)], start=1):
+            student = models.Student(name=f"학생{number}", student_id_number=f"s-{number}", gender="남")
+            student.grades.append(models.Grade(subject=PERCENTILE_SUBJECT, percentile_rank=percentile))
+            student.applications.append(models.StudentApplication(school=school, is_priority_selection=priority_type is not None, priority_type=priority_type))
+            db.add(student)
+        db.commit()
+
+        result = simulation.simulate_admission(db, schemas.AdmissionSimulationRequest(runs=0))
+
+        assert [a.admitted for a in result.applicants] == [True, True, True, False]
+        assert result.schools[0].cutoff_percentile == 30.0
+
+    def test_non_numeric_override_key_is_rejected(self):
+        with pytest.raises(ValidationError):
+            schemas.AdmissionSimulationRequest(quota_overrides={"jeju": schemas.SchoolQuotaUpdate(total_quota=2)})
+
+        request = schemas.AdmissionSimulationRequest(quota_overrides={"3": schemas.SchoolQuotaUpdate(total_quota=2)})
+        assert list(request.quota_overrides) == [3]
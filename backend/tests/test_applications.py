@@ -1,2 +1,245 @@
 # backend/tests/test_applications.py
 # Unit and integration tests for applications
+
+import asyncio
+import threading
+import pytest
+from sqlalchemy.orm import sessionmaker
+from unittest.mock import patch
+
+from src.config import settings
+from src.database import models, schemas
+from src.services import application_counter_service, application_service, competition_service, ranking_service
+from src.services.applicant_pool import ApplicantPool
+from src.services.application_snapshot_service import ApplicationSnapshotStore, application_snapshots
+from src.utils.constants import PERCENTILE_SUBJECT, PriorityType
+
+@pytest.fixture
+def school(db):
+    school = models.School(name="제주고등학교", total_quota=100, actual_competition_quota=90)
+    db.add(school)
+    db.commit()
+    yield school
+    application_snapshots.clear()
+
+def add_student(db, number, percentile):
+    student = models.Student(name=f"학생{number}", student_id_number=f"s-{number}", school_id="middle-1", grade=3, class_number=1, number=number)
+    student.grades.append(models.Grade(subject=PERCENTILE_SUBJECT, percentile_rank=percentile))
+    db.add(student)
+    db.commit()
+    return student
+
+class TestApplicationSnapshots:
+    """Test cases for per-school application snapshots"""
+
+    def test_application_write_publishes_new_snapshot(self, db, school):
+        first = add_student(db, 1, 20.0)
+        second = add_student(db, 2, 10.0)
+
+        application_service.create_student_application(db, schemas.StudentApplicationCreate(student_id=str(first.id), school_id=str(school.id)))
+        before = application_snapshots.get(school.id)
+        application_service.create_student_application(db, schemas.StudentApplicationCreate(
+            student_id=str(second.id), school_id=str(school.id),
+            is_priority_selection=True, priority_type=PriorityType.WITHIN_QUOTA,
+        ))
+        after = application_snapshots.get(school.id)
+
+        # 이전 스냅샷은 그대로 유지 (copy-on-write)
+        assert before.detail.statistics.total_applicants == 1
+        assert after.version == before.version + 1
+        assert after.etag != before.etag
+        assert after.status.statistics.total_applicants == 2
+        assert after.status.statistics.priority_within_applicants == 1
+        assert [r.student_name for r in after.detail.rankings] == ["학생2", "학생1"]
+        assert application_snapshots.detail_json(after) == after.detail.model_dump_json().encode("utf-8")
+
+    def test_moving_application_refreshes_both_schools(self, db, school):
+        other = models.School(name="서귀포고등학교", total_quota=50, actual_competition_quota=50)
+        db.add(other)
+        db.commit()
+        student = add_student(db, 1, 20.0)
+        application = application_service.create_student_application(db, schemas.StudentApplicationCreate(student_id=str(student.id), school_id=str(school.id)))
+
+        application_service.update_student_application(db, application, schemas.StudentApplicationCreate(student_id=str(student.id), school_id=str(other.id)))
+
+        assert application_snapshots.get(school.id).status.statistics.total_applicants == 0
+        assert application_snapshots.get(other.id).status.statistics.total_applicants == 1
+
+    def test_snapshot_ranks_match_ranking_service(self, db, school):
+        for number, percentile in enumerate([30.0, 10.0, 10.0, None, 20.0], start=1):
+            student = add_student(db, number, percentile)
+            application_service.create_student_application(db, schemas.StudentApplicationCreate(student_id=str(student.id), school_id=str(school.id)))
+
+        ranking_service.recompute_school_rankings(db, school.id)
+        rankings = application_snapshots.refresh(school.id, db).detail.rankings
+
+        stored = {str(a.student_id): a.rank_in_school for a in db.query(models.StudentApplication) if a.rank_in_school is not None}
+        assert {r.student_id: r.rank for r in rankings} == stored
+        assert [r.rank for r in rankings] == [1, 1, 3, 4]
+
+    def test_async_miss_rebuilds_off_the_event_loop(self, db, school):
+        store = ApplicationSnapshotStore(session_factory=sessionmaker(bind=db.get_bind()))
+        threads = []
+        refresh = store.refresh
+        store.refresh = lambda *args: threads.append(threading.current_thread()) or refresh(*args)
+
+        async def read_twice():
+            first = await store.get_async(school.id)
+            return first, await store.get_async(school.id), threading.current_thread()
+
+        first, second, loop_thread = asyncio.run(read_twice())
+
+        assert first is second and first.school_id == school.id
+        assert len(threads) == 1 and threads[0] is not loop_thread
+
+class TestApplicationCounters:
+    """Test cases for materialized per-school application counters"""
+
+    def counters(self, db, school_id):
+        return application_counter_service.current_counter(db, school_id)
+
+    def test_first_counter_is_created_by_upsert(self, db, school):
+        year = models.current_academic_year()
+        application_counter_service.record_change(db, None, (year, school.id, "general_applicants"))
+        application_counter_service.record_change(db, None, (year, school.id, "priority_within_applicants"))
+        db.commit()
+
+        counter = self.counters(db, school.id)
+        assert (counter.total_applicants, counter.general_applicants, counter.priority_within_applicants) == (2, 1, 1)
+
+    def test_counter_update_falls_back_without_upsert(self, db, school):
+        key = (models.current_academic_year(), school.id, "general_applicants")
+        with patch.object(application_counter_service, "UPSERT_INSERTS", {}):
+            application_counter_service.record_change(db, None, key)
+            application_counter_service.record_change(db, None, key)
+        db.commit()
+
+        assert self.counters(db, school.id).general_applicants == 2
+
+    def test_counters_follow_application_writes(self, db, school):
+        other = models.School(name="서귀포고등학교", total_quota=50, actual_competition_quota=50)
+        db.add(other)
+        db.commit()
+        first = add_student(db, 1, 20.0)
+        second = add_student(db, 2, 10.0)
+        application = application_service.create_student_application(db, schemas.StudentApplicationCreate(student_id=str(first.id), school_id=str(school.id)))
+        application_service.create_student_application(db, schemas.StudentApplicationCreate(
+            student_id=str(second.id), school_id=str(school.id),
+            is_priority_selection=True, priority_type=PriorityType.OUTSIDE_QUOTA,
+        ))
+
+        counter = self.counters(db, school.id)
+        assert (counter.total_applicants, counter.general_applicants, counter.priority_outside_applicants) == (2, 1, 1)
+
+        # 같은 학교에서 우선선발로 변경
+        application_service.update_student_application(db, application, schemas.StudentApplicationCreate(
+            student_id=str(first.id), school_id=str(school.id),
+            is_priority_selection=True, priority_type=PriorityType.WITHIN_QUOTA,
+        ))
+        db.refresh(counter)
+        assert (counter.total_applicants, counter.general_applicants, counter.priority_within_applicants) == (2, 0, 1)
+
+        # 다른 학교로 이동
+        application_service.update_student_application(db, application, schemas.StudentApplicationCreate(student_id=str(first.id), school_id=str(other.id)))
+        db.refresh(counter)
+        assert (counter.total_applicants, counter.priority_within_applicants) == (1, 0)
+        assert self.counters(db, other.id).general_applicants == 1
+        assert application_counter_service.reconcile_counters(db).mismatches == []
+
+    def test_reconcile_repairs_drifted_counters(self, db, school):
+        student = add_student(db, 1, 20.0)
+        application_service.create_student_application(db, schemas.StudentApplicationCreate(student_id=str(student.id), school_id=str(school.id)))
+        counter = self.counters(db, school.id)
+        counter.general_applicants = 5
+        db.commit()
+
+        report = application_counter_service.reconcile_counters(db)
+
+        assert report.repaired
+        assert [(m.field, m.stored, m.actual) for m in report.mismatches] == [("general_applicants", 5, 1)]
+        db.refresh(counter)
+        assert counter.general_applicants == 1
+        assert application_counter_service.reconcile_counters(db).mismatches == []
+
+class TestCompetitionOverview:
+    """Test cases for the province-wide competition overview"""
+
+    def test_overview_includes_every_school(self, db, school):
+        empty = models.School(name="서귀포고등학교", total_quota=50, actual_competition_quota=0)
+        db.add(empty)
+        db.commit()
+        student = add_student(db, 1, 20.0)
+        application_service.create_student_application(db, schemas.StudentApplicationCreate(student_id=str(student.id), school_id=str(school.id)))
+
+        overview = competition_service.build_overview(db)
+
+        assert [status.school_name for status in overview] == ["제주고등학교", "서귀포고등학교"]
+        assert overview[0].statistics.general_applicants == 1
+        assert overview[0].statistics.competition_ratio == round(1 / 90, 2)
+        assert overview[1].statistics.total_applicants == 0
+        assert overview[1].statistics.competition_ratio == 0.0
+
+    def test_overview_cache_is_dropped_on_application_change(self, db, school):
+        competition_service.invalidate_overview()
+        etag, body = competition_service.get_overview(db)
+        assert competition_service.get_overview(db) == (etag, body)
+
+        student = add_student(db, 1, 20.0)
+        application_service.create_student_application(db, schemas.StudentApplicationCreate(student_id=str(student.id), school_id=str(school.id)))
+
+        new_etag, new_body = competition_service.get_overview(db)
+        assert new_etag != etag
+        assert b'"total_applicants":1' in new_body
+
+class TestApplicantPool:
+    """Test cases for the compact applicant representation"""
+
+    rows = [
+        {
+            "student_id": str(index), "student_name": f"학생{index}", "rank": index + 1, "percentile_rank": index * 1.5,
+            "is_priority_selection": index == 0, "priority_type": PriorityType.WITHIN_QUOTA if index == 0 else None,
+            "priority_category": "농어촌" if index == 0 else None, "school_name": f"middle-{index % 2}",
+            "grade": 3, "class_number": 1, "number": index + 1,
+        }
+        for index in range(4)
+    ]
+
+    def test_round_trips_to_student_rankings(self):
+        pool = ApplicantPool.from_rows(self.rows)
+
+        assert len(pool) == 4
+        assert pool.to_schemas() == [schemas.StudentRanking(**row) for row in self.rows]
+        assert pool.ranking(0).priority_type == PriorityType.WITHIN_QUOTA.value
+        assert [ranking.student_id for ranking in pool.to_schemas([3, 1])] == ["3", "1"]
+
+    def test_repeated_strings_are_interned(self):
+        pool = ApplicantPool.from_rows(self.rows * 100)
+
+        assert pool.school_names == (None, "middle-0", "middle-1")
+        assert pool.categories == (None, "농어촌")
+        assert pool.nbytes == 400 * (8 + 4 + 8 + 1 + 1 + 2 + 2 + 1 + 1 + 1)
+
+    def test_snapshot_keeps_pool_not_models(self, db, school):
+        student = add_student(db, 1, 20.0)
+        application_service.create_student_application(db, schemas.StudentApplicationCreate(student_id=str(student.id), school_id=str(school.id)))
+
+        snapshot = application_snapshots.get(school.id)
+
+        assert isinstance(snapshot.applicants, ApplicantPool)
+        assert snapshot.detail.rankings[0].student_name == "학생1"
+
+    def test_detail_bodies_are_serialized_lazily_and_bounded(self, db, school):
+        student = add_student(db, 1, 20.0)
+        application_service.create_student_application(db, schemas.StudentApplicationCreate(student_id=str(student.id), school_id=str(school.id)))
+        store = ApplicationSnapshotStore(session_factory=sessionmaker(bind=db.get_bind()))
+        first = store.refresh(school.id, db)
+        assert store._detail_bodies == {}
+
+        body = store.detail_json(first)
+        assert store.detail_json(first) is body
+        with patch.object(settings, "SNAPSHOT_DETAIL_CACHE_SIZE", 1):
+            second = store.refresh(school.id, db)
+            store.detail_json(second)
+
+        assert list(store._detail_bodies) == [(school.id, second.version)]
+        assert asyncio.run(store.detail_json_async(second)) == second.detail.model_dump_json().encode("utf-8")
@@ -0,0 +1,138 @@
+# backend/tests/test_approval_fake_firestore.py
+# ApprovalService behaviour and round-trip budgets on the in-memory Firestore fake
+
+import asyncio
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.services.approval_service import approval_service
+from src.services.notification_service import InAppChannel, NotificationDispatcher
+from src.testing.approval_seed import pending_targets, seed_approval_data
+from src.testing.firestore_fake import AlreadyExists, FailedPrecondition, FakeFirestore, Increment
+from src.utils.firestore_tracing import TracedClient, assert_rpc_budget, trace_firestore
+
+@pytest.fixture
+def dispatcher():
+    """Outbox dispatcher without the background thread; tests deliver with flush()"""
+    return NotificationDispatcher(channels=[InAppChannel()])
+
+@pytest.fixture
+def firestore(dispatcher):
+    """Seeded in-memory Firestore wired into ApprovalService through the tracing client"""
+    client = FakeFirestore()
+    approvers = seed_approval_data(client, user_count=1000, school_count=10)
+    traced = TracedClient(client)
+    with patch('src.services.approval_service.db', traced), patch('src.services.notification_service.db', traced), \
+            patch('src.services.notification_service._increment', Increment), \
+            patch('src.services.notification_service._write_conflicts', lambda: (AlreadyExists, FailedPrecondition)), \
+            patch('src.services.approval_service.notification_dispatcher', dispatcher):
+        yield client, approvers
+
+class TestApprovalServiceOnFakeFirestore:
+    """Behaviour and Firestore round-trip budgets of ApprovalService on the in-memory fake"""
+
+    def test_pending_lookup_is_one_query(self, firestore):
+        client, approvers = firestore
+        head = approvers["heads"][0]
+
+        with assert_rpc_budget(1):
+            pending = approval_service.get_pending_users_for_approver(head)
+
+        assert sorted(user.uid for user in pending) == sorted(pending_targets(client, head))
+        assert all(user.school_id == head.school_id for user in pending)
+
+    def test_round_trips_do_not_grow_with_user_count(self):
+        rpcs = []
+        for user_count in (500, 2000):
+            client = FakeFirestore()
+            approvers = seed_approval_data(client, user_count=user_count, school_count=10)
+            with patch('src.services.approval_service.db', TracedClient(client)), trace_firestore() as trace:
+                approval_service.get_approval_statistics(approvers["heads"][0])
+            rpcs.append(trace.rpc_count)
+
+        assert rpcs[0] == rpcs[1] == 2
+
+    def test_approve_writes_user_log_and_outbox_entry(self, firestore, dispatcher):
+        client, approvers = firestore
+        head = approvers["heads"][0]
+        target_uid = pending_targets(client, head)[0]
+        logs_before = client.count("approval_logs")
+
+        with assert_rpc_budget(4):
+            result = approval_service.approve_user_hierarchical(head, target_uid, True)
+
+        assert result["success"] is True
+        assert client.document(f"users/{target_uid}").get().get("is_approved") is True
+        assert client.count("approval_logs") == logs_before + 1
+        # 발송은 디스패처가 비동기로 처리
+        assert client.count("notification_outbox") == 1
+        assert client.count("notifications") == 0
+
+        dispatcher.flush()
+        assert client.count("notifications") == 1
+
+    def test_rejection_after_approval_is_delivered(self, firestore, dispatcher):
+        client, approvers = firestore
+        target_uid = pending_targets(client, approvers["heads"][0])[0]
+        target = SimpleNamespace(uid=target_uid, email=f"{target_uid}@example.com")
+
+        approval_service._send_approval_notification(target, True)
+        dispatcher.flush()
+        approval_service._send_approval_notification(target, False, "서류 미비")
+        dispatcher.flush()
+
+        notifications = [doc.to_dict() for doc in client.collection("notifications").where("user_uid", "==", target_uid).stream()]
+        assert sorted(notification["is_approved"] for notification in notifications) == [False, True]
+
+    def test_concurrent_approvals(self, firestore, dispatcher):
+        client, approvers = firestore
+        work = [(head, uid) for head in approvers["heads"] for uid in pending_targets(client, head)[:5]]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda item: approval_service.approve_user_hierarchical(item[0], item[1], True), work))
+        dispatcher.flush()
+
+        assert all(result["success"] for result in results)
+        assert all(client.document(f"users/{uid}").get().get("is_approved") for _, uid in work)
+        assert client.count("notifications") == len(work)
+
+    def test_async_statistics_overlaps_reads(self):
+        client = FakeFirestore(latency=0.2)
+        approvers = seed_approval_data(client, user_count=200, school_count=5)
+        head = approvers["heads"][0]
+
+        with patch('src.services.approval_service.db', TracedClient(client)):
+            expected = approval_service.get_approval_statistics(head)
+            with trace_firestore() as trace:
+                started = time.perf_counter()
+                result = asyncio.run(approval_service.get_approval_statistics_async(head))
+                elapsed = time.perf_counter() - started
+
+        assert result == expected
+        assert trace.rpc_count == 2
+        # 두 조회가 순차였다면 0.4초 이상
+        assert elapsed < 0.35
+
+class TestApprovalSeed:
+    """Synthetic approval data is reproducible and leaves the global RNG alone"""
+
+    def test_same_seed_same_users(self):
+        first, second = FakeFirestore(), FakeFirestore()
+        seed_approval_data(first, user_count=200, school_count=5, seed=3)
+        seed_approval_data(second, user_count=200, school_count=5, seed=3)
+
+        assert first._collection("users") == second._collection("users")
+
+    def test_global_random_state_is_untouched(self):
+        random.seed(42)
+        expected = [random.random() for _ in range(3)]
+        random.seed(42)
+
+        seed_approval_data(FakeFirestore(), user_count=50, school_count=2)
+
+        assert [random.random() for _ in range(3)] == expected
@@ -270,7 +270,7 @@ class TestApprovalRoutes:
         assert data[1]["action"] == "rejected"
         assert data[1]["reason"] == "자격 요건 미충족"
     
-    @patch('src.services.approval_service.approval_service.get_approval_statistics')
+    @patch('src.services.approval_service.approval_service.get_approval_statistics_async')
     def test_get_approval_statistics_success(self, mock_get_stats):
         """Test getting approval statistics successfully"""
         # Mock approval statistics
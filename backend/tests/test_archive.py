@@ -0,0 +1,193 @@
+# backend/tests/test_archive.py
+# Tests for academic-year partitioning and archive rollover
+
+import gzip
+import json
+import pytest
+from datetime import datetime
+from sqlalchemy.orm import sessionmaker
+from unittest.mock import patch
+
+from src.config import settings
+from src.database import models, schemas
+from src.services import application_counter_service, application_service, archive_service, competition_service
+from src.services.application_snapshot_service import ApplicationSnapshotStore, application_snapshots
+from src.services.grade_service import _load_students
+from src.utils.constants import PERCENTILE_SUBJECT
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    with patch.object(settings, "ARCHIVE_DIR", str(tmp_path / "archives")), patch.object(settings, "CURRENT_ACADEMIC_YEAR", 2025):
+        yield tmp_path / "archives"
+    application_snapshots.clear()
+
+@pytest.fixture
+def school(db):
+    school = models.School(name="제주고등학교", total_quota=100, actual_competition_quota=90)
+    db.add(school)
+    db.commit()
+    return school
+
+def add_applicants(db, school, academic_year, count):
+    """학년도별 학생·성적·지원서 (순위는 백분율 순)"""
+    for number in range(1, count + 1):
+        student = models.Student(
+            academic_year=academic_year, name=f"{academic_year}-학생{number}", student_id_number=f"s-{number}",
+            school_id="middle-1", grade=3, class_number=1, number=number,
+        )
+        student.grades.append(models.Grade(academic_year=academic_year, subject=PERCENTILE_SUBJECT, percentile_rank=number * 1.5))
+        student.applications.append(models.StudentApplication(
+            academic_year=academic_year, school_id=school.id, rank_in_school=number, percentile_rank=number * 1.5,
+        ))
+        db.add(student)
+    db.commit()
+
+def year_count(db, model, academic_year):
+    return db.query(model).filter(model.academic_year == academic_year).count()
+
+class TestAcademicYearPartitioning:
+    """Current-year reads only see the current academic year"""
+
+    def test_new_rows_default_to_current_year(self, db, archive_dir):
+        student = models.Student(name="학생", student_id_number="s-1")
+        student.grades.append(models.Grade(subject=PERCENTILE_SUBJECT, percentile_rank=10.0))
+        db.add(student)
+        db.commit()
+
+        assert student.academic_year == 2025
+        assert student.grades[0].academic_year == 2025
+
+    def test_year_turns_over_in_march(self):
+        with patch.object(settings, "CURRENT_ACADEMIC_YEAR", None):
+            assert models.current_academic_year(datetime(2026, 2, 28, 23, 59, tzinfo=models.KST)) == 2025
+            assert models.current_academic_year(datetime(2026, 3, 1, tzinfo=models.KST)) == 2026
+        with patch.object(settings, "CURRENT_ACADEMIC_YEAR", 2030):
+            assert models.current_academic_year(datetime(2026, 3, 1, tzinfo=models.KST)) == 2030
+
+    def test_grades_and_applications_take_the_student_year(self, db, school, archive_dir):
+        student = models.Student(academic_year=2024, name="학생", student_id_number="s-1")
+        db.add(student)
+        db.commit()
+
+        # 학년도가 바뀐 뒤에 저장해도 학생의 학년도를 따름
+        student.grades.append(models.Grade(subject=PERCENTILE_SUBJECT, percentile_rank=10.0))
+        db.commit()
+        application = application_service.create_student_application(db, schemas.StudentApplicationCreate(student_id=str(student.id), school_id=str(school.id)))
+
+        assert student.grades[0].academic_year == 2024
+        assert application.academic_year == 2024
+
+    def test_counters_are_kept_per_academic_year(self, db, school, archive_dir):
+        student = models.Student(name="학생", student_id_number="s-1")
+        db.add(student)
+        db.commit()
+        application = application_service.create_student_application(db, schemas.StudentApplicationCreate(student_id=str(student.id), school_id=str(school.id)))
+
+        # 3월 전환 후, 2025학년도 보관 전
+        with patch.object(settings, "CURRENT_ACADEMIC_YEAR", 2026):
+            assert competition_service.build_overview(db)[0].statistics.total_applicants == 0
+            assert application_counter_service.reconcile_counters(db).mismatches == []
+            # 학년도가 끝난 뒤의 변경은 그 학년도 카운터로
+            application_service.update_student_application(db, application, schemas.StudentApplicationCreate(student_id=str(student.id), school_id=None))
+            assert application_counter_service.current_counter(db, school.id) is None
+
+        counter = application_counter_service.current_counter(db, school.id)
+        db.refresh(counter)
+        assert (counter.total_applicants, counter.general_applicants) == (0, 0)
+        assert application_counter_service.reconcile_counters(db, academic_year=2025).mismatches == []
+
+    def test_snapshot_is_rebuilt_when_year_turns_over(self, db, school, archive_dir):
+        add_applicants(db, school, 2025, 2)
+        store = ApplicationSnapshotStore(session_factory=sessionmaker(bind=db.get_bind()))
+        before = store.get(school.id)
+        assert store.get(school.id) is before
+
+        with patch.object(settings, "CURRENT_ACADEMIC_YEAR", 2026):
+            after = store.get(school.id)
+
+        assert before.status.statistics.total_applicants == 2
+        assert after.academic_year == 2026 and after.status.statistics.total_applicants == 0
+
+    def test_same_class_number_allowed_in_different_years(self, db, school, archive_dir):
+        add_applicants(db, school, 2024, 3)
+        add_applicants(db, school, 2025, 3)
+
+        assert year_count(db, models.Student, 2024) == year_count(db, models.Student, 2025) == 3
+
+    def test_current_year_queries_skip_previous_years(self, db, school, archive_dir):
+        add_applicants(db, school, 2024, 5)
+        add_applicants(db, school, 2025, 2)
+
+        assert len(_load_students(db, "middle-1")) == 2
+        assert application_counter_service.recount(db)[school.id]["total_applicants"] == 2
+        assert application_snapshots.refresh(school.id, db).statistics.total_applicants == 2
+
+class TestRollover:
+    """Moving a finished year into the gzip JSONL archive"""
+
+    def test_rollover_archives_and_removes_year(self, db, school, archive_dir):
+        add_applicants(db, school, 2024, 5)
+        add_applicants(db, school, 2025, 2)
+        before = archive_service.historical_applicants(db, 2024, school.id)
+
+        report = archive_service.rollover(db, 2024)
+
+        assert report.row_counts == {"students": 5, "student_applications": 5, "grades": 5}
+        assert not report.already_archived
+        for model in (models.Student, models.StudentApplication, models.Grade):
+            assert year_count(db, model, 2024) == 0
+            assert year_count(db, model, 2025) == 2
+        with gzip.open(archive_dir / "2024" / "students.jsonl.gz", "rt", encoding="utf-8") as file:
+            assert [json.loads(line)["name"] for line in file] == [f"2024-학생{number}" for number in range(1, 6)]
+        assert [year.academic_year for year in archive_service.list_archived_years()] == [2024]
+
+        after = archive_service.historical_applicants(db, 2024, school.id)
+        assert before.source == "database" and after.source == "archive"
+        assert after.applicants == before.applicants
+        assert [applicant.rank for applicant in after.applicants] == [1, 2, 3, 4, 5]
+
+    def test_rerun_is_a_no_op(self, db, school, archive_dir):
+        add_applicants(db, school, 2024, 3)
+        archive_service.rollover(db, 2024)
+
+        report = archive_service.rollover(db, 2024)
+
+        assert report.already_archived
+        assert report.row_counts["students"] == 3
+
+    def test_resumes_after_failed_delete(self, db, school, archive_dir):
+        add_applicants(db, school, 2024, 3)
+        with patch.object(db, "commit", side_effect=RuntimeError("connection lost")):
+            with pytest.raises(RuntimeError):
+                archive_service.rollover(db, 2024)
+        db.rollback()
+        assert year_count(db, models.Student, 2024) == 3
+
+        report = archive_service.rollover(db, 2024)
+
+        assert not report.already_archived
+        assert year_count(db, models.Student, 2024) == 0
+
+    def test_rejects_current_year_and_empty_year(self, db, school, archive_dir):
+        add_applicants(db, school, 2025, 1)
+
+        with pytest.raises(ValueError):
+            archive_service.rollover(db, 2025)
+        with pytest.raises(ValueError):
+            archive_service.rollover(db, 2023)
+        assert not (archive_dir / "2023").exists()
+
+    def test_rollover_drops_the_year_counters(self, db, school, archive_dir):
+        with patch.object(settings, "CURRENT_ACADEMIC_YEAR", 2024):
+            student = models.Student(name="학생", student_id_number="s-1", school_id="middle-1", grade=3, class_number=1, number=1)
+            db.add(student)
+            db.commit()
+            application_service.create_student_application(db, schemas.StudentApplicationCreate(student_id=str(student.id), school_id=str(school.id)))
+        counter_key = {"academic_year": 2024, "school_id": school.id}
+        assert db.get(models.SchoolApplicationCounter, counter_key).total_applicants == 1
+
+        archive_service.rollover(db, 2024)
+
+        db.expire_all()
+        assert db.get(models.SchoolApplicationCounter, counter_key) is None
+        assert application_counter_service.reconcile_counters(db, repair=False).mismatches == []
@@ -10,3 +10,33 @@ def test_read_main():
     # assert response.status_code == 200
     # assert response.json() == {"message": "Welcome to the Jeju High School Admission API"}
     pass
+
+import pytest
+from pydantic import ValidationError
+
+from src.database import schemas
+from src.utils.constants import UserRole
+
+SIGNUP = {"username": "teacher", "email": "teacher@example.com", "password": "secret", "school_id": "school-1"}
+
+class TestSignupSchemas:
+    """Test cases for role-based signup validation"""
+
+    def test_role_must_be_selectable(self):
+        with pytest.raises(ValidationError, match="가입 시 선택할 수 없는 역할"):
+            schemas.UserCreate(**SIGNUP, role=UserRole.ADMIN)
+
+    def test_homeroom_requires_class(self):
+        with pytest.raises(ValidationError, match="담당 반"):
+            schemas.UserCreate(**SIGNUP, role=UserRole.THIRD_GRADE_HOMEROOM, grade=3)
+
+        user = schemas.UserCreate(**SIGNUP, role=UserRole.THIRD_GRADE_HOMEROOM, grade=3, class_number=2)
+        assert user.is_homeroom_teacher is True
+
+    def test_invitation_signup_keeps_role_validation(self):
+        with pytest.raises(ValidationError, match="담당 반"):
+            schemas.UserCreateWithInvitation(**SIGNUP, role=UserRole.THIRD_GRADE_HOMEROOM, grade=3, invitation_code="abc")
+
+        user = schemas.UserCreateWithInvitation(**SIGNUP, role=UserRole.GENERAL_TEACHER, school_name="중학교", invitation_code="abc")
+        assert user.school_name is None
+        assert user.grade is None
@@ -0,0 +1,213 @@
+# backend/tests/test_cutoff_index.py
+# Tests for the historical admission cutoff index
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from src.config import settings
+from src.database import models, schemas
+from src.services import application_service, archive_service, cutoff_index_service
+from src.services.cutoff_index_service import CACHE_FILE_NAME, build_year_table, cutoff_index
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    with patch.object(settings, "ARCHIVE_DIR", str(tmp_path / "archives")), patch.object(settings, "CURRENT_ACADEMIC_YEAR", 2025):
+        cutoff_index.invalidate()
+        yield tmp_path / "archives"
+    cutoff_index.invalidate()
+
+@pytest.fixture
+def school(db):
+    school = models.School(name="제주고등학교", total_quota=100, actual_competition_quota=90)
+    db.add(school)
+    db.commit()
+    return school
+
+def add_year(db, school, academic_year, count, accepted, step=1.5, class_number=1):
+    """백분율 순으로 앞의 accepted명이 합격"""
+    for number in range(1, count + 1):
+        student = models.Student(
+            academic_year=academic_year, name=f"{academic_year}-학생{number}", student_id_number=f"s-{number}",
+            school_id="middle-1", grade=3, class_number=class_number, number=number,
+        )
+        student.applications.append(models.StudentApplication(
+            academic_year=academic_year, school_id=school.id, rank_in_school=number,
+            percentile_rank=number * step, is_accepted=number <= accepted,
+        ))
+        db.add(student)
+    db.commit()
+
+class TestYearTable:
+    """Reducing one year's applications to per-school quantile arrays"""
+
+    def test_groups_by_school(self):
+        rows = [
+            {"school_id": 2, "percentile_rank": 30.0, "is_accepted": False},
+            {"school_id": 1, "percentile_rank": 10.0, "is_accepted": True},
+            {"school_id": 2, "percentile_rank": 20.0, "is_accepted": True},
+            {"school_id": 1, "percentile_rank": 50.0, "is_accepted": False},
+            {"school_id": 1, "percentile_rank": 5.0, "is_accepted": True},
+            {"school_id": None, "percentile_rank": 1.0, "is_accepted": True},
+            {"school_id": 1, "percentile_rank": None, "is_accepted": False},
+        ]
+
+        table = build_year_table(2024, rows)
+
+        assert table.school_ids.tolist() == [1, 2]
+        assert table.applicants.tolist() == [3, 2]
+        assert table.accepted.tolist() == [2, 1]
+        assert table.accepted_quantiles.dtype == np.float32
+        assert table.accepted_quantiles[0, 0] == 5.0 and table.accepted_quantiles[0, -1] == 10.0
+        assert table.applicant_quantiles[1, -1] == 30.0
+        assert table.row(3) is None
+
+    def test_empty_year(self):
+        table = build_year_table(2024, [])
+
+        assert table.school_ids.size == 0
+        assert table.row(1) is None
+
+class TestAdmissionEstimates:
+    """Vectorized probability and rank estimates from past years"""
+
+    def test_probability_follows_past_admits(self, db, school, archive_dir):
+        # 2024학년도: 백분율 1.5 ~ 15.0 중 상위 5명(7.5 이하) 합격
+        add_year(db, school, 2024, 10, accepted=5)
+
+        years, probabilities, ranks = cutoff_index.estimate(db, school.id, [1.0, 4.5, 9.0, 20.0])
+
+        assert years == [2024]
+        assert probabilities.tolist() == pytest.approx([100.0, 100.0, 0.0, 0.0])
+        assert ranks[0] == pytest.approx(1.0) and ranks[-1] == pytest.approx(10.0)
+
+    def test_at_and_just_inside_cutoff(self, db, school, archive_dir):
+        # 합격선 7 * 1.1은 float32로 저장하면 원래 값보다 조금 작아짐
+        add_year(db, school, 2024, 10, accepted=7, step=1.1)
+        cutoff = 7 * 1.1
+
+        _, probabilities, _ = cutoff_index.estimate(db, school.id, [cutoff - 0.01, cutoff, cutoff + 0.01])
+
+        assert probabilities.tolist() == [100.0, 100.0, 0.0]
+        assert cutoff_index.school_cutoffs(db, school.id)[0].cutoff_percentile == pytest.approx(cutoff)
+
+    def test_years_are_averaged(self, db, school, archive_dir):
+        # 합격선 2023년 5.0, 2024년 10.0
+        add_year(db, school, 2023, 10, accepted=5, step=1.0)
+        add_year(db, school, 2024, 10, accepted=5, step=2.0)
+
+        years, probabilities, _ = cutoff_index.estimate(db, school.id, [5.0, 7.0, 10.5])
+
+        assert years == [2023, 2024]
+        assert probabilities.tolist() == [100.0, 50.0, 0.0]
+
+    def test_school_without_history(self, db, school, archive_dir):
+        add_year(db, school, 2025, 3, accepted=0)
+
+        result = cutoff_index_service.estimate_percentiles(db, schemas.AdmissionEstimateRequest(school_id=school.id, percentiles=[10.0]))
+
+        assert result.years == []
+        assert result.estimates[0].admission_probability is None
+        assert result.estimates[0].student_rank is None
+
+    def test_expected_rank_scales_to_current_applicants(self, db, school, archive_dir):
+        add_year(db, school, 2024, 10, accepted=5)
+        add_year(db, school, 2025, 101, accepted=0)
+
+        result = cutoff_index_service.estimate_percentiles(db, schemas.AdmissionEstimateRequest(school_id=school.id, percentiles=[8.25]))
+
+        # 지난해 지원자 분포의 중앙 → 올해 101명 중 51등
+        assert result.estimates[0].student_rank == 51
+
+    def test_expected_rank_ignores_other_years_and_counters(self, db, school, archive_dir):
+        add_year(db, school, 2024, 10, accepted=5)
+        add_year(db, school, 2025, 21, accepted=0)
+        # 재집계 전의 어긋난 카운터는 예상 석차에 쓰이지 않는다
+        db.add(models.SchoolApplicationCounter(academic_year=2025, school_id=school.id, total_applicants=-3))
+        db.commit()
+
+        result = cutoff_index_service.estimate_percentiles(db, schemas.AdmissionEstimateRequest(school_id=school.id, percentiles=[8.25]))
+
+        # 지난해 지원자는 빼고 올해 21명 기준: 지난해 분포의 중앙 → 11등
+        assert result.estimates[0].student_rank == 11
+
+    def test_class_estimates(self, db, school, archive_dir):
+        add_year(db, school, 2024, 10, accepted=5)
+        add_year(db, school, 2025, 3, accepted=0, step=3.0, class_number=2)
+
+        estimates = cutoff_index_service.estimate_class(db, "middle-1", 3, 2)
+
+        assert [estimate.number for estimate in estimates] == [1, 2, 3]
+        assert [estimate.student_rank for estimate in estimates] == [1, 2, 3]
+        # 지난해 합격선 7.5: 3.0, 6.0은 안쪽, 9.0은 바깥
+        assert [estimate.admission_probability for estimate in estimates] == [100.0, 100.0, 0.0]
+        assert cutoff_index_service.estimate_class(db, "middle-1", 3, 1) == []
+
+class TestCutoffIndexCache:
+    """Archived years are computed once and the index follows rollovers"""
+
+    def test_archived_year_table_is_cached_on_disk(self, db, school, archive_dir):
+        add_year(db, school, 2024, 10, accepted=5)
+        archive_service.rollover(db, 2024)
+
+        first = cutoff_index.school_cutoffs(db, school.id)
+        assert (archive_dir / "2024" / CACHE_FILE_NAME).exists()
+        cutoff_index.invalidate()
+        with patch.object(archive_service, "read_archive", side_effect=AssertionError("archive re-read")):
+            second = cutoff_index.school_cutoffs(db, school.id)
+
+        assert first == second
+        assert first[0].cutoff_percentile == pytest.approx(7.5)
+        assert first[0].median_accepted_percentile == pytest.approx(4.5)
+        assert (first[0].applicants, first[0].accepted) == (10, 5)
+
+    def test_rollover_invalidates_index(self, db, school, archive_dir):
+        add_year(db, school, 2023, 10, accepted=5)
+        assert [cutoff.academic_year for cutoff in cutoff_index.school_cutoffs(db, school.id)] == [2023]
+
+        add_year(db, school, 2024, 10, accepted=5)
+        assert [cutoff.academic_year for cutoff in cutoff_index.school_cutoffs(db, school.id)] == [2023]
+        archive_service.rollover(db, 2024)
+
+        assert [cutoff.academic_year for cutoff in cutoff_index.school_cutoffs(db, school.id)] == [2023, 2024]
+
+    def test_past_year_result_update_invalidates_index(self, db, school, archive_dir):
+        add_year(db, school, 2024, 4, accepted=0)
+        assert cutoff_index.estimate(db, school.id, [1.5])[0] == []
+
+        # 학년도가 끝난 뒤 합격 결과 입력
+        application = db.query(models.StudentApplication).filter(models.StudentApplication.percentile_rank == 3.0).one()
+        application_service.update_student_application(db, application, schemas.StudentApplicationCreate(
+            student_id=str(application.student_id), school_id=str(school.id), is_accepted=True,
+        ))
+
+        years, probabilities, _ = cutoff_index.estimate(db, school.id, [1.5, 4.5])
+        assert years == [2024]
+        assert probabilities.tolist() == [100.0, 0.0]
+
+    def test_current_year_writes_keep_index(self, db, school, archive_dir):
+        add_year(db, school, 2024, 4, accepted=2)
+        tables = cutoff_index.tables(db)
+        student = models.Student(academic_year=2025, name="학생", student_id_number="s-new")
+        db.add(student)
+        db.commit()
+
+        application_service.create_student_application(db, schemas.StudentApplicationCreate(student_id=str(student.id), school_id=str(school.id)))
+
+        assert cutoff_index.tables(db) is tables
+
+    def test_database_years_expire_but_archived_years_do_not(self, db, school, archive_dir):
+        add_year(db, school, 2024, 4, accepted=2)
+        with patch.object(settings, "CUTOFF_INDEX_TTL_SECONDS", 0):
+            tables = cutoff_index.tables(db)
+            assert cutoff_index.tables(db) is not tables
+
+            archive_service.rollover(db, 2024)
+            archived = cutoff_index.tables(db)
+            assert cutoff_index.tables(db) is archived
+
+    def test_only_recent_years_are_used(self, db, school, archive_dir):
+        for year in (2020, 2021, 2022, 2023, 2024):
+            add_year(db, school, year, 4, accepted=2)
+
+        assert [table.academic_year for table in cutoff_index.tables(db)] == [2022, 2023, 2024]
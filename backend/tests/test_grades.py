@@ -1,2 +1,452 @@
 # backend/tests/test_grades.py
 # Unit and integration tests for grades
+
+import threading
+import pytest
+from unittest.mock import patch
+from src.database import models, schemas
+from src.services import application_counter_service, application_service, grade_service
+from src.services.grade_validation_service import GradeValidationError, rows_to_columns, validate_grade_columns
+from src.utils import events
+from src.utils.constants import UploadStatus, UploadMode
+
+HEADER = "학년,반,번호,성명,성별,F,G,H,I,J,K,L,M,N,내신석차백분율\n"
+
+def make_sheet(rows):
+    """A–E, O 열만 채운 CSV 성적 파일 생성"""
+    lines = [f"{g},{c},{n},{name},{gender},,,,,,,,,,{p}" for g, c, n, name, gender, p in rows]
+    return (HEADER + "\n".join(lines) + "\n").encode("utf-8")
+
+class TestGradeValidation:
+    """Test cases for column-wise grade sheet validation"""
+
+    def test_report_collects_every_cell_error(self):
+        rows = [
+            [3, 1, 1, "학생1", "남"] + [None] * 9 + [12.5],
+            [3, 21, 2, "학생2", "여"] + [None] * 9 + [101],
+            ["삼", 1, 3, "", "남"] + [None] * 9 + [40],
+            [3, 1, 4, "학생4", None] + [None] * 9 + ["abc"],
+        ]
+
+        report, students = validate_grade_columns(rows_to_columns(rows), [2, 3, 4, 5])
+
+        assert report.total_rows == 4
+        assert report.valid_rows == 1
+        assert {(e.row, e.column) for e in report.errors} == {
+            (3, "B"), (3, "O"), (4, "A"), (4, "D"), (5, "E"), (5, "O"),
+        }
+        assert students[0].name == "학생1"
+        assert students[0].percentile_rank == 12.5
+
+    def test_duplicate_student_numbers_are_reported(self):
+        rows = [[3, 1, 1, f"학생{i}", "남"] + [None] * 9 + [10.0] for i in range(2)]
+
+        report, students = validate_grade_columns(rows_to_columns(rows), [2, 3])
+
+        assert report.error_count == 2
+        assert all(e.column == "C" for e in report.errors)
+        assert students == []
+
+    def test_large_sheet_matches_cell_rules(self):
+        rows = [[1 + i // 1980, i // 99 % 20 + 1, i % 99 + 1, f"학생{i}", "남"] + [None] * 9 + [i % 1000 / 10] for i in range(5000)]
+        text_rows = [["" if value is None else str(value) for value in row] for row in rows]
+        text_rows[10][14] = "1e1"
+        text_rows[20][0] = "3.5"
+        text_rows[30][1] = " 1 "
+        text_rows[40][14] = "십"
+        text_rows[51][:3] = text_rows[50][:3]
+        row_numbers = list(range(2, 5002))
+
+        report, students = validate_grade_columns(rows_to_columns(rows), row_numbers)
+        assert (report.error_count, len(students)) == (0, 5000)
+        assert students[-1].percentile_rank == pytest.approx(99.9)
+
+        report, students = validate_grade_columns(rows_to_columns(text_rows), row_numbers)
+        assert {(e.row, e.column) for e in report.errors} == {(22, "A"), (42, "O"), (52, "C"), (53, "C")}
+        assert len(students) == 4996
+        assert students[10].percentile_rank == 10.0 and students[29].class_number == 1
+
+    def test_invalid_sheet_is_rejected_before_writing(self, db):
+        content = make_sheet([(3, 1, 1, "학생1", "남", 10.0), (3, 1, 2, "학생2", "남", 150.0)])
+
+        with pytest.raises(GradeValidationError) as exc_info:
+            grade_service.process_grades_file(db, content, "grades.csv", school_id="school-1")
+
+        assert exc_info.value.report.error_count == 1
+        assert exc_info.value.report.errors[0].row == 3
+        assert db.query(models.GradeUpload).count() == 0
+
+class TestGradeUpload:
+    """Test cases for idempotent grade file processing"""
+
+    rows = [(3, 1, n, f"학생{n}", "남" if n % 2 else "여", n * 1.5) for n in range(1, 8)]
+
+    def test_parse_grades_file_reads_columns(self):
+        students = grade_service.parse_grades_file(make_sheet(self.rows[:1]), "grades.csv")
+
+        assert len(students) == 1
+        assert students[0].grade == 3
+        assert students[0].name == "학생1"
+        assert students[0].percentile_rank == 1.5
+
+    def test_identical_reupload_returns_prior_result(self, db):
+        content = make_sheet(self.rows)
+
+        first = grade_service.process_grades_file(db, content, "grades.csv", school_id="school-1")
+        second = grade_service.process_grades_file(db, content, "grades.csv", school_id="school-1")
+
+        assert first.status == UploadStatus.COMPLETED
+        assert first.is_duplicate is False
+        assert second.is_duplicate is True
+        assert second.upload_id == first.upload_id
+        assert db.query(models.Grade).count() == len(self.rows)
+        assert db.query(models.GradeUpload).count() == 1
+
+    def test_same_file_from_another_school_is_processed(self, db):
+        content = make_sheet(self.rows)
+
+        first = grade_service.process_grades_file(db, content, "grades.csv", school_id="school-1")
+        second = grade_service.process_grades_file(db, content, "grades.csv", school_id="school-2")
+
+        assert second.is_duplicate is False
+        assert second.upload_id != first.upload_id
+        assert db.query(models.Student).filter_by(school_id="school-2").count() == len(self.rows)
+
+    def test_reupload_after_school_data_changed_is_processed(self, db):
+        original = make_sheet(self.rows)
+        corrected = make_sheet([(3, 1, 1, "학생1", "남", 9.5)] + self.rows[1:])
+        grade_service.process_grades_file(db, original, "grades.csv", school_id="school-1")
+        grade_service.process_grades_file(db, corrected, "grades.csv", school_id="school-1")
+
+        reverted = grade_service.process_grades_file(db, original, "grades.csv", school_id="school-1")
+
+        assert reverted.is_duplicate is False
+        assert reverted.changes.updated == 1
+        student = db.query(models.Student).filter_by(class_number=1, number=1).one()
+        assert grade_service._current_percentile_grade(student).percentile_rank == 1.5
+        # 다시 반영한 뒤 같은 파일은 중복으로 처리
+        assert grade_service.process_grades_file(db, original, "grades.csv", school_id="school-1").is_duplicate is True
+
+    def test_failed_upload_resumes_from_last_committed_chunk(self, db):
+        content = make_sheet(self.rows)
+        save_chunk = grade_service._save_chunk
+        calls = []
+
+        def failing_save_chunk(*args):
+            calls.append(args)
+            if len(calls) == 2:
+                raise RuntimeError("connection lost")
+            return save_chunk(*args)
+
+        with patch.object(grade_service, "UPLOAD_CHUNK_SIZE", 3):
+            with patch.object(grade_service, "_save_chunk", side_effect=failing_save_chunk):
+                with pytest.raises(RuntimeError):
+                    grade_service.process_grades_file(db, content, "grades.csv", school_id="school-1", mode=UploadMode.APPEND)
+
+            upload = db.query(models.GradeUpload).one()
+            assert upload.status == UploadStatus.FAILED
+            assert upload.processed_rows == 3
+            assert db.query(models.Grade).count() == 3
+
+            result = grade_service.process_grades_file(db, content, "grades.csv", school_id="school-1", mode=UploadMode.APPEND)
+
+        assert result.status == UploadStatus.COMPLETED
+        assert result.processed_rows == len(self.rows)
+        assert db.query(models.Grade).count() == len(self.rows)
+        assert db.query(models.Student).count() == len(self.rows)
+
+class TestGradeDiffUpload:
+    """Test cases for diff-based re-upload"""
+
+    rows = [(3, 1, n, f"학생{n}", "남", float(n)) for n in range(1, 6)]
+
+    def test_reupload_writes_only_changed_rows(self, db):
+        grade_service.process_grades_file(db, make_sheet(self.rows), "grades.csv", school_id="school-1")
+        corrected = [row for row in self.rows if row[2] != 5]
+        corrected[0] = (3, 1, 1, "학생1", "남", 9.5)
+        corrected.append((3, 2, 1, "전학생", "여", 3.0))
+
+        result = grade_service.process_grades_file(db, make_sheet(corrected), "grades.csv", school_id="school-1")
+
+        assert result.changes.inserted == 1
+        assert result.changes.updated == 1
+        assert result.changes.deleted == 1
+        assert result.changes.unchanged == 3
+        assert db.query(models.Student).count() == 5
+        assert db.query(models.Grade).count() == 5
+        student = db.query(models.Student).filter_by(class_number=1, number=1).one()
+        assert student.grades[0].percentile_rank == 9.5
+
+    def test_rankings_recomputed_only_for_affected_schools(self, db):
+        grade_service.process_grades_file(db, make_sheet(self.rows), "grades.csv", school_id="school-1")
+        students = {s.number: s for s in db.query(models.Student)}
+        db.add_all([
+            models.StudentApplication(student_id=students[1].id, school_id=10),
+            models.StudentApplication(student_id=students[2].id, school_id=10),
+            models.StudentApplication(student_id=students[3].id, school_id=20),
+        ])
+        db.commit()
+        corrected = list(self.rows)
+        corrected[0] = (3, 1, 1, "학생1", "남", 4.5)
+
+        with patch.object(grade_service.ranking_service, "recompute_school_rankings", wraps=grade_service.ranking_service.recompute_school_rankings) as recompute:
+            result = grade_service.process_grades_file(db, make_sheet(corrected), "grades.csv", school_id="school-1")
+
+        assert result.changes.affected_school_ids == [10]
+        recompute.assert_called_once_with(db, 10)
+        ranks = {a.student_id: a.rank_in_school for a in db.query(models.StudentApplication).filter_by(school_id=10)}
+        assert ranks == {students[2].id: 1, students[1].id: 2}
+
+class TestGradeDiffDeletes:
+    """Deletes stay inside the uploaded classes and never drop applications unconfirmed"""
+
+    rows = [(3, c, n, f"학생{c}-{n}", "남", float(c * 10 + n)) for c in (1, 2) for n in (1, 2)]
+
+    def upload(self, db, rows, **kwargs):
+        return grade_service.process_grades_file(db, make_sheet(rows), "grades.csv", school_id="school-1", **kwargs)
+
+    def apply(self, db, class_number, number):
+        student = db.query(models.Student).filter_by(class_number=class_number, number=number).one()
+        db.add(models.StudentApplication(student_id=student.id, school_id=10))
+        db.commit()
+        return student
+
+    def test_single_class_sheet_keeps_other_classes(self, db):
+        self.upload(db, self.rows)
+
+        result = self.upload(db, [(3, 2, 1, "학생2-1", "남", 21.0)])
+
+        assert result.changes.deleted == 1
+        assert {(s.class_number, s.number) for s in db.query(models.Student)} == {(1, 1), (1, 2), (2, 1)}
+
+    def test_full_roster_deletes_whole_grade(self, db):
+        self.upload(db, self.rows)
+
+        result = self.upload(db, [(3, 2, 1, "학생2-1", "남", 21.0)], mode=UploadMode.FULL)
+
+        assert result.changes.deleted == 3
+        assert db.query(models.Student).count() == 1
+
+    def test_students_with_applications_need_confirmation(self, db):
+        self.upload(db, self.rows)
+        applied = self.apply(db, 2, 2)
+        sheet = [row for row in self.rows if row[1] == 2 and row[2] == 1]
+
+        held = self.upload(db, sheet)
+
+        assert held.changes.deleted == 0
+        assert held.changes.held_student_ids == [str(applied.id)]
+        assert db.query(models.StudentApplication).count() == 1
+
+        confirmed = self.upload(db, sheet, confirm_deletes=True)
+
+        assert confirmed.is_duplicate is False
+        assert confirmed.changes.deleted == 1
+        assert db.query(models.StudentApplication).count() == 0
+
+    def test_deleted_applications_update_counters_and_notify(self, db):
+        self.upload(db, self.rows)
+        school = models.School(name="제주고등학교", total_quota=10, actual_competition_quota=10)
+        db.add(school)
+        db.commit()
+        for number in (1, 2):
+            student = db.query(models.Student).filter_by(class_number=2, number=number).one()
+            application_service.create_student_application(db, schemas.StudentApplicationCreate(student_id=str(student.id), school_id=str(school.id)))
+        published = []
+
+        with patch.object(grade_service.events, "publish", side_effect=lambda name, payload: published.append((name, payload))):
+            self.upload(db, [row for row in self.rows if row[1] == 2 and row[2] == 1], confirm_deletes=True)
+
+        counter = application_counter_service.current_counter(db, school.id)
+        db.refresh(counter)
+        assert (counter.total_applicants, counter.general_applicants) == (1, 1)
+        assert (events.APPLICATIONS_CHANGED, {"school_ids": [school.id]}) in published
+        assert application_counter_service.reconcile_counters(db, repair=False).mismatches == []
+
+    def test_progress_is_reported_in_sheet_rows(self, db):
+        self.upload(db, self.rows)
+        corrected = list(self.rows[:3]) + [(3, 2, 3, "전학생", "여", 5.0)]
+        corrected[0] = (3, 1, 1, "학생1-1", "남", 1.0)
+        progress = []
+
+        with patch.object(grade_service, "UPLOAD_CHUNK_SIZE", 1):
+            result = self.upload(db, corrected, progress_callback=lambda done, total: progress.append((done, total)))
+
+        assert (result.changes.inserted, result.changes.updated, result.changes.deleted) == (1, 1, 1)
+        assert all(total == len(corrected) for _, total in progress)
+        # 변경 없는 2행에서 시작, 삭제는 행 수에 더하지 않음
+        assert [done for done, _ in progress] == [2, 2, 3, 4]
+        assert result.processed_rows == result.total_rows == len(corrected)
+
+class TestGradeJobQueue:
+    """Test cases for background grade processing jobs"""
+
+    @patch("src.services.grade_job_service.SessionLocal")
+    @patch("src.services.grade_job_service.grade_service.process_grades_file")
+    def test_job_reports_progress_and_result(self, mock_process, mock_session):
+        from src.database import schemas
+        from src.services.grade_job_service import GradeJobQueue
+        from src.utils.constants import JobStatus
+
+        result = schemas.GradeUploadResult(
+            upload_id=1, content_hash="abc", filename="grades.csv", status="completed",
+            total_rows=4, processed_rows=4, message="done",
+        )
+
+        def process(db, content, filename, school_id, uploaded_by, mode, progress_callback, confirm_deletes):
+            progress_callback(2, 4)
+            return result
+
+        mock_process.side_effect = process
+        queue = GradeJobQueue(max_workers=1)
+
+        job = queue.submit(b"content", "grades.csv", school_id="school-1")
+        queue._executor.shutdown(wait=True)
+
+        assert queue.get(job.job_id) is job
+        assert job.status == JobStatus.COMPLETED
+        assert job.to_schema().result.total_rows == 4
+        mock_session.return_value.close.assert_called_once()
+
+    @patch("src.services.grade_job_service.SessionLocal")
+    @patch("src.services.grade_job_service.grade_service.process_grades_file")
+    def test_failed_job_keeps_error(self, mock_process, mock_session):
+        from src.services.grade_job_service import GradeJobQueue
+        from src.utils.constants import JobStatus
+
+        mock_process.side_effect = ValueError("row 3: invalid grade")
+        queue = GradeJobQueue(max_workers=1)
+
+        job = queue.submit(b"content", "grades.csv", school_id="school-1")
+        queue._executor.shutdown(wait=True)
+
+        assert job.status == JobStatus.FAILED
+        assert job.errors == ["row 3: invalid grade"]
+
+    @patch("src.services.grade_job_service.SessionLocal")
+    @patch("src.services.grade_job_service.grade_service.process_grades_file")
+    def test_same_file_from_two_schools_gets_two_jobs(self, mock_process, mock_session):
+        from src.database import schemas
+        from src.services.grade_job_service import GradeJobQueue
+
+        release = threading.Event()
+        result = schemas.GradeUploadResult(
+            upload_id=1, content_hash="abc", filename="grades.csv", status="completed",
+            total_rows=1, processed_rows=1, message="done",
+        )
+        mock_process.side_effect = lambda *args, **kwargs: release.wait(1) and result
+        queue = GradeJobQueue(max_workers=2)
+
+        first = queue.submit(b"content", "grades.csv", school_id="school-1")
+        again = queue.submit(b"content", "grades.csv", school_id="school-1")
+        other = queue.submit(b"content", "grades.csv", school_id="school-2")
+        release.set()
+        queue._executor.shutdown(wait=True)
+
+        assert again is first
+        assert other is not first
+
+    @patch("src.services.grade_job_service.SessionLocal")
+    @patch("src.services.grade_job_service.grade_service.process_grades_file")
+    def test_same_file_with_other_options_conflicts(self, mock_process, mock_session):
+        from fastapi import HTTPException
+        from src.services.grade_job_service import GradeJobQueue
+
+        release = threading.Event()
+        mock_process.side_effect = lambda *args, **kwargs: release.wait(1) and None
+        queue = GradeJobQueue(max_workers=1)
+
+        first = queue.submit(b"content", "grades.csv", school_id="school-1")
+        try:
+            with pytest.raises(HTTPException) as confirm_conflict:
+                queue.submit(b"content", "grades.csv", school_id="school-1", confirm_deletes=True)
+            with pytest.raises(HTTPException) as mode_conflict:
+                queue.submit(b"content", "grades.csv", school_id="school-1", mode=UploadMode.FULL)
+            again = queue.submit(b"content", "grades.csv", school_id="school-1")
+        finally:
+            release.set()
+            queue._executor.shutdown(wait=True)
+
+        assert confirm_conflict.value.status_code == mode_conflict.value.status_code == 409
+        assert first.job_id in confirm_conflict.value.detail
+        assert again is first
+
+    @patch("src.services.grade_job_service.SessionLocal")
+    @patch("src.services.grade_job_service.grade_service.process_grades_file")
+    def test_upload_processing_elsewhere_is_not_completed(self, mock_process, mock_session):
+        from src.database import schemas
+        from src.services.grade_job_service import GradeJobQueue
+        from src.utils.constants import JobStatus
+
+        mock_process.return_value = schemas.GradeUploadResult(
+            upload_id=1, content_hash="abc", filename="grades.csv", status=UploadStatus.PROCESSING,
+            total_rows=10, processed_rows=4, is_duplicate=True, message="동일한 파일을 처리 중입니다.",
+        )
+        queue = GradeJobQueue(max_workers=1)
+
+        job = queue.submit(b"content", "grades.csv", school_id="school-1")
+        queue._executor.shutdown(wait=True)
+
+        assert job.status == JobStatus.DUPLICATE
+        assert job.is_finished
+        assert job.to_schema().result.processed_rows == 4
+
+class TestGradeJobWebsocket:
+    """The job progress websocket has the same access rule as GET /grades/jobs/{job_id}"""
+
+    @pytest.fixture
+    def client(self):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from src.routes import grades
+        from src.services import auth_service
+
+        app = FastAPI()
+        app.include_router(grades.router)
+        app.dependency_overrides[auth_service.get_db] = lambda: None
+        return TestClient(app)
+
+    @pytest.fixture
+    def job(self):
+        from src.services.grade_job_service import GradeJob
+        from src.utils.constants import JobStatus
+
+        job = GradeJob("abc", "grades.csv", school_id="school-1", uploaded_by="head-1")
+        job.status = JobStatus.COMPLETED
+        with patch("src.routes.grades.grade_job_queue.get", return_value=job):
+            yield job
+
+    @staticmethod
+    def user(school_id, role=None):
+        from src.database import schemas
+        from src.utils.constants import UserRole
+
+        async def authenticate(token, db):
+            return schemas.UserInDB.model_construct(uid="head-1", school_id=school_id, role=role or UserRole.HEAD_TEACHER)
+        return patch("src.utils.auth_decorators.get_current_user_from_token", side_effect=authenticate)
+
+    def test_rejects_missing_token(self, client, job):
+        from starlette.websockets import WebSocketDisconnect
+
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with client.websocket_connect(f"/grades/jobs/{job.job_id}/ws") as websocket:
+                websocket.receive_text()
+
+        assert exc_info.value.code == 1008
+
+    def test_rejects_other_school(self, client, job):
+        from starlette.websockets import WebSocketDisconnect
+
+        with self.user("school-2"), pytest.raises(WebSocketDisconnect) as exc_info:
+            with client.websocket_connect(f"/grades/jobs/{job.job_id}/ws?token=t") as websocket:
+                websocket.receive_text()
+
+        assert exc_info.value.code == 4404
+
+    def test_uploading_school_receives_status(self, client, job):
+        with self.user("school-1"):
+            with client.websocket_connect(f"/grades/jobs/{job.job_id}/ws", headers={"Authorization": "Bearer t"}) as websocket:
+                payload = websocket.receive_json()
+
+        assert payload["job_id"] == job.job_id
+        assert payload["status"] == "completed"
@@ -0,0 +1,78 @@
+# backend/tests/test_health.py
+# Tests for health probes and startup warm-up
+
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from src.routes import health
+from src.services.warmup_service import WarmupService
+
+def make_client():
+    app = FastAPI()
+    app.include_router(health.router)
+    return TestClient(app)
+
+class TestWarmup:
+    """Test cases for the warm-up service and readiness probe"""
+
+    def test_failed_step_does_not_stop_warmup(self):
+        calls = []
+
+        def broken():
+            raise RuntimeError("no connection")
+
+        service = WarmupService(steps=[("broken", broken), ("cache", lambda: calls.append("cache"))])
+        service.run()
+        service.run()  # 두 번째 호출은 무시
+
+        assert service.is_finished
+        assert calls == ["cache"]
+        assert service.status()["steps"]["broken"] == {"status": "failed"}
+        assert service.status()["steps"]["cache"]["status"] == "ok"
+        assert service.is_ready
+
+    def test_failed_required_step_keeps_instance_not_ready(self):
+        def broken():
+            raise RuntimeError("password=secret@db-host")
+
+        service = WarmupService(steps=[("database_pool", broken)], required={"database_pool"})
+        client = make_client()
+
+        with patch.object(health, "warmup_service", service), patch.object(health, "engine", create_engine("sqlite://")):
+            service.run()
+            response = client.get("/health/ready")
+
+        assert service.is_finished and not service.is_ready
+        assert response.status_code == 503
+        assert "secret" not in response.text
+
+    def test_database_error_is_not_exposed(self):
+        service = WarmupService(steps=[])
+        service.run()
+        client = make_client()
+
+        with patch.object(health, "warmup_service", service), patch.object(health, "engine") as engine:
+            engine.connect.side_effect = RuntimeError("could not connect to postgres://admin:secret@db")
+            response = client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["database"] == "unavailable"
+        assert "secret" not in response.text
+
+    def test_readiness_waits_for_warmup(self):
+        service = WarmupService(steps=[])
+        client = make_client()
+
+        with patch.object(health, "warmup_service", service), patch.object(health, "engine", create_engine("sqlite://")):
+            assert client.get("/health/live").status_code == 200
+            not_ready = client.get("/health/ready")
+            service.run()
+            ready = client.get("/health/ready")
+
+        assert not_ready.status_code == 503
+        assert not_ready.json()["status"] == "not_ready"
+        assert ready.status_code == 200
+        assert ready.json()["database"] == "ok"
@@ -0,0 +1,425 @@
+# backend/tests/test_notifications.py
+# Tests for the notification outbox dispatcher
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+
+from fastapi import HTTPException
+from src.services.notification_service import (
+    EmailChannel, InAppChannel, NotificationDispatcher, NotificationHub, NotificationInbox, WebSocketChannel
+)
+from src.testing.firestore_fake import AlreadyExists, FailedPrecondition, FakeFirestore, FakeWriteBatch, Increment
+from src.utils.constants import OutboxStatus
+from src.utils.firestore_tracing import TracedClient, assert_rpc_budget
+
+class FlakyChannel:
+    """처음 failures번은 실패하는 채널"""
+    name = "flaky"
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.sent = []
+
+    def send(self, notifications):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("channel unavailable")
+        self.sent.extend(notifications)
+
+@pytest.fixture
+def client():
+    client = FakeFirestore()
+    with patch('src.services.notification_service.db', TracedClient(client)), \
+            patch('src.services.notification_service._increment', Increment), \
+            patch('src.services.notification_service._write_conflicts', lambda: (AlreadyExists, FailedPrecondition)):
+        yield client
+
+def outbox_statuses(client):
+    return sorted(doc.to_dict()["status"] for doc in client.collection("notification_outbox").stream())
+
+def enqueue(dispatcher, uid, key=None, message="계정이 승인되었습니다."):
+    return dispatcher.enqueue(
+        recipient_uid=uid, recipient_email=f"{uid}@example.com", kind="approval_status",
+        title="계정 승인 완료", message=message, dedupe_key=key or f"approval_status:{uid}"
+    )
+
+class TestNotificationDispatcher:
+    """Batching, dedupe, digests and retries of the outbox dispatcher"""
+
+    def test_enqueue_only_writes_outbox(self, client):
+        dispatcher = NotificationDispatcher(channels=[InAppChannel()])
+        enqueue(dispatcher, "teacher-1")
+
+        assert dispatcher.pending_count() == 1
+        assert client.count("notifications") == 0
+        assert outbox_statuses(client) == [OutboxStatus.PENDING.value]
+
+    def test_bulk_approvals_are_written_in_batches(self, client):
+        dispatcher = NotificationDispatcher(channels=[InAppChannel()])
+        for index in range(1200):
+            enqueue(dispatcher, f"teacher-{index}")
+        rpcs_before = client.rpc_count
+
+        outcome = dispatcher.flush()
+
+        assert outcome == {OutboxStatus.SENT.value: 1200}
+        assert client.count("notifications") == 1200
+        # 알림·카운터 5번 (250건 단위) + 아웃박스 상태 3번 (500건 단위)의 일괄 쓰기
+        assert client.rpc_count - rpcs_before == 8
+        assert dispatcher.pending_count() == 0
+
+    def test_same_dedupe_key_keeps_latest_event(self, client):
+        dispatcher = NotificationDispatcher(channels=[InAppChannel()])
+        enqueue(dispatcher, "teacher-1", message="계정이 거부되었습니다.")
+        enqueue(dispatcher, "teacher-1", message="계정이 승인되었습니다.")
+
+        dispatcher.flush()
+
+        notifications = [doc.to_dict() for doc in client.collection("notifications").stream()]
+        assert [notification["message"] for notification in notifications] == ["계정이 승인되었습니다."]
+        assert outbox_statuses(client) == [OutboxStatus.SENT.value, OutboxStatus.SUPERSEDED.value]
+
+    def test_recently_delivered_key_is_not_sent_again(self, client):
+        dispatcher = NotificationDispatcher(channels=[InAppChannel()])
+        enqueue(dispatcher, "teacher-1")
+        dispatcher.flush()
+        enqueue(dispatcher, "teacher-1")
+        dispatcher.flush()
+
+        assert client.count("notifications") == 1
+
+    def test_changed_message_under_delivered_key_is_sent(self, client):
+        dispatcher = NotificationDispatcher(channels=[InAppChannel()])
+        enqueue(dispatcher, "teacher-1", message="계정이 승인되었습니다.")
+        dispatcher.flush()
+        enqueue(dispatcher, "teacher-1", message="계정이 거부되었습니다.")
+        dispatcher.flush()
+
+        assert sorted(doc.to_dict()["message"] for doc in client.collection("notifications").stream()) == ["계정이 거부되었습니다.", "계정이 승인되었습니다."]
+
+    def test_burst_for_one_recipient_becomes_digest(self, client):
+        dispatcher = NotificationDispatcher(channels=[InAppChannel()])
+        for index in range(5):
+            enqueue(dispatcher, "head-1", key=f"pending_signup:{index}", message=f"가입 승인 요청 {index}")
+
+        dispatcher.flush()
+
+        notifications = [doc.to_dict() for doc in client.collection("notifications").stream()]
+        assert len(notifications) == 1
+        assert notifications[0]["type"] == "digest"
+        assert len(notifications[0]["items"]) == 5
+
+    def test_failed_channel_is_retried_with_backoff(self, client):
+        channel = FlakyChannel(failures=1)
+        dispatcher = NotificationDispatcher(channels=[InAppChannel(), channel])
+        entry = enqueue(dispatcher, "teacher-1")
+
+        assert dispatcher.flush(now=0) == {}
+        assert entry.pending_channels == {"flaky"}
+        assert entry.next_attempt_at > 0
+        # 대기 시간 전에는 다시 보내지 않음
+        assert dispatcher.flush(now=entry.next_attempt_at - 0.1) == {}
+
+        assert dispatcher.flush(now=entry.next_attempt_at) == {OutboxStatus.SENT.value: 1}
+        assert len(channel.sent) == 1
+        # 이미 성공한 앱 내 알림은 다시 쓰지 않음
+        assert client.count("notifications") == 1
+
+    def test_retry_after_partial_in_app_write_does_not_duplicate(self, client):
+        dispatcher = NotificationDispatcher(channels=[InAppChannel()])
+        for index in range(6):
+            enqueue(dispatcher, f"teacher-{index}")
+        commit = FakeWriteBatch.commit
+        commits = []
+
+        def second_commit_fails(batch):
+            commits.append(batch)
+            if len(commits) == 2:
+                raise ConnectionError("deadline exceeded")
+            return commit(batch)
+
+        # 250건 대신 2건씩 묶어 두 번째 묶음만 실패시킴
+        with patch('src.services.notification_service.BATCH_WRITE_LIMIT', 4), patch.object(FakeWriteBatch, "commit", second_commit_fails):
+            assert dispatcher.flush(now=0) == {}
+        assert client.count("notifications") == 2
+
+        assert dispatcher.flush(now=1000) == {OutboxStatus.SENT.value: 6}
+        assert client.count("notifications") == 6
+        assert all(client.document(f"notification_counters/teacher-{index}").get().get("unread") == 1 for index in range(6))
+
+    def test_gives_up_after_max_attempts(self, client):
+        dispatcher = NotificationDispatcher(channels=[FlakyChannel(failures=100)])
+        entry = enqueue(dispatcher, "teacher-1")
+
+        with patch('src.services.notification_service.settings.NOTIFICATION_MAX_ATTEMPTS', 3):
+            outcomes = [dispatcher.flush(now=1000 * attempt) for attempt in range(3)]
+
+        assert outcomes[-1] == {OutboxStatus.FAILED.value: 1}
+        assert entry.attempts == 3
+        assert dispatcher.pending_count() == 0
+        assert client.document(f"notification_outbox/{entry.entry_id}").get().get("failed_channels") == ["flaky"]
+
+    def test_recover_requeues_pending_outbox_entries(self, client):
+        # 점유 기간 0: 기록한 디스패처가 곧바로 멈춘 것과 같음
+        with patch('src.services.notification_service.settings.NOTIFICATION_LEASE_SECONDS', 0):
+            enqueue(NotificationDispatcher(channels=[InAppChannel()]), "teacher-1")
+        restarted = NotificationDispatcher(channels=[InAppChannel()])
+
+        assert restarted.recover() == 1
+        restarted.flush()
+
+        assert client.count("notifications") == 1
+        assert outbox_statuses(client) == [OutboxStatus.SENT.value]
+
+    def test_recover_leaves_entries_leased_by_a_live_dispatcher(self, client):
+        running = NotificationDispatcher(channels=[InAppChannel()])
+        enqueue(running, "teacher-1")
+
+        assert NotificationDispatcher(channels=[InAppChannel()]).recover() == 0
+        assert running.flush() == {OutboxStatus.SENT.value: 1}
+
+    def test_each_expired_entry_is_claimed_by_one_dispatcher(self, client):
+        with patch('src.services.notification_service.settings.NOTIFICATION_LEASE_SECONDS', 0):
+            stopped = NotificationDispatcher(channels=[InAppChannel()])
+            for index in range(3):
+                enqueue(stopped, f"teacher-{index}")
+        first, second = NotificationDispatcher(channels=[InAppChannel()]), NotificationDispatcher(channels=[InAppChannel()])
+        # 두 디스패처가 같은 시점에 읽은 문서로 점유를 시도
+        documents = list(client.collection("notification_outbox").stream())
+        client.document(f"notification_outbox/{documents[1].id}").update({"attempts": 1})
+
+        claimed_first = first._claim(documents)
+        claimed_second = second._claim(documents)
+
+        # 읽은 뒤 바뀐 문서는 아무도 가져가지 않고, 나머지는 먼저 쓴 쪽만 가져감
+        assert sorted(entry.entry_id for entry in claimed_first) == sorted([documents[0].id, documents[2].id])
+        assert claimed_second == []
+        assert {doc.get("owner") for doc in client.collection("notification_outbox").stream() if doc.id != documents[1].id} == {first._owner}
+
+    def test_background_thread_delivers(self, client):
+        dispatcher = NotificationDispatcher(channels=[InAppChannel()])
+        with patch('src.services.notification_service.settings.NOTIFICATION_BATCH_WINDOW_SECONDS', 0.01):
+            dispatcher.start()
+            try:
+                enqueue(dispatcher, "teacher-1")
+                for _ in range(200):
+                    if client.count("notifications"):
+                        break
+                    threading.Event().wait(0.01)
+            finally:
+                dispatcher.stop()
+
+        assert client.count("notifications") == 1
+
+def deliver(client, uid, count):
+    dispatcher = NotificationDispatcher(channels=[InAppChannel()])
+    with patch('src.services.notification_service.settings.NOTIFICATION_DIGEST_THRESHOLD', count + 1):
+        for index in range(count):
+            enqueue(dispatcher, uid, key=f"event:{index}", message=f"알림 {index}")
+        dispatcher.flush()
+
+class TestNotificationInbox:
+    """Cursor feed, unread counter and bulk mark-as-read"""
+
+    def test_unread_count_is_one_read(self, client):
+        deliver(client, "teacher-1", 7)
+        deliver(client, "teacher-2", 2)
+        inbox = NotificationInbox()
+
+        with assert_rpc_budget(1):
+            assert inbox.unread_count("teacher-1") == 7
+        assert inbox.unread_count("teacher-2") == 2
+        assert inbox.unread_count("nobody") == 0
+
+    def test_feed_pages_newest_first_with_cursor(self, client):
+        deliver(client, "teacher-1", 25)
+        deliver(client, "teacher-2", 3)
+        inbox = NotificationInbox()
+
+        seen, cursor = [], None
+        while True:
+            with assert_rpc_budget(1):
+                page = inbox.get_feed("teacher-1", limit=10, cursor=cursor)
+            seen.extend(page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert len(seen) == 25
+        assert len({item.id for item in seen}) == 25
+        assert all(item.user_uid == "teacher-1" and not item.is_read for item in seen)
+        assert [item.created_at for item in seen] == sorted((item.created_at for item in seen), reverse=True)
+
+    def test_invalid_cursor_is_rejected(self, client):
+        with pytest.raises(HTTPException) as exc_info:
+            NotificationInbox().get_feed("teacher-1", cursor="%%%")
+
+        assert exc_info.value.status_code == 400
+
+    def test_mark_read_updates_counter(self, client):
+        deliver(client, "teacher-1", 5)
+        deliver(client, "teacher-2", 1)
+        inbox = NotificationInbox()
+        items = inbox.get_feed("teacher-1").items
+        other = inbox.get_feed("teacher-2").items[0]
+
+        with assert_rpc_budget(2):
+            updated = inbox.mark_read("teacher-1", [items[0].id, items[1].id, other.id, "missing"])
+
+        assert updated == 2
+        assert inbox.unread_count("teacher-1") == 3
+        assert inbox.unread_count("teacher-2") == 1
+        # 이미 읽은 알림은 다시 차감하지 않음
+        assert inbox.mark_read("teacher-1", [items[0].id]) == 0
+        assert inbox.unread_count("teacher-1") == 3
+
+    def test_concurrent_mark_read_decrements_once(self, client):
+        deliver(client, "teacher-1", 3)
+        inbox = NotificationInbox()
+        # 두 요청이 같은 알림을 읽지 않은 상태로 읽어 둔 뒤 차례로 commit
+        stale = list(client.collection("notifications").where("is_read", "==", False).stream())
+
+        assert inbox._commit_read("teacher-1", stale[:2]) == 2
+        assert inbox._commit_read("teacher-1", stale) == 1
+
+        assert client.document("notification_counters/teacher-1").get().get("unread") == 0
+        assert inbox.mark_read("teacher-1", [doc.id for doc in stale]) == 0
+
+    def test_reconcile_repairs_drifted_counter(self, client):
+        deliver(client, "teacher-1", 4)
+        inbox = NotificationInbox()
+        inbox.mark_read("teacher-1", [inbox.get_feed("teacher-1").items[0].id])
+        client.document("notification_counters/teacher-1").set({"unread": 9})
+
+        report = inbox.reconcile_unread("teacher-1")
+
+        assert (report.stored, report.actual, report.repaired) == (9, 3, True)
+        assert inbox.unread_count("teacher-1") == 3
+        assert not inbox.reconcile_unread("teacher-1").repaired
+        assert inbox.reconcile_unread("nobody").actual == 0
+
+    def test_negative_counter_is_recounted(self, client):
+        deliver(client, "teacher-1", 2)
+        client.document("notification_counters/teacher-1").set({"unread": -1})
+
+        assert NotificationInbox().unread_count("teacher-1") == 2
+        assert client.document("notification_counters/teacher-1").get().get("unread") == 2
+
+    def test_mark_all_read(self, client):
+        deliver(client, "teacher-1", 4)
+        inbox = NotificationInbox()
+
+        assert inbox.mark_all_read("teacher-1") == 4
+        assert inbox.unread_count("teacher-1") == 0
+        assert all(item.is_read for item in inbox.get_feed("teacher-1").items)
+
+        # 새 알림은 다시 집계
+        deliver(client, "teacher-1", 1)
+        assert inbox.unread_count("teacher-1") == 1
+
+class TestNotificationChannels:
+    """Email and websocket delivery"""
+
+    def test_email_batch_uses_one_smtp_connection(self, client):
+        smtp = MagicMock()
+        smtp.__enter__.return_value = smtp
+        factory = MagicMock(return_value=smtp)
+        dispatcher = NotificationDispatcher(channels=[EmailChannel(smtp_factory=factory)])
+        for index in range(3):
+            enqueue(dispatcher, f"teacher-{index}")
+
+        dispatcher.flush()
+
+        factory.assert_called_once()
+        assert smtp.send_message.call_count == 3
+        assert smtp.send_message.call_args[0][0]["To"].endswith("@example.com")
+
+    def test_websocket_subscriber_receives_notification(self, client):
+        hub = NotificationHub()
+        dispatcher = NotificationDispatcher(channels=[WebSocketChannel(hub)])
+
+        async def receive():
+            queue = hub.subscribe("teacher-1")
+            # 디스패처는 별도 스레드에서 발송
+            await asyncio.get_running_loop().run_in_executor(None, lambda: (enqueue(dispatcher, "teacher-1"), dispatcher.flush()))
+            payload = await asyncio.wait_for(queue.get(), timeout=1)
+            hub.unsubscribe("teacher-1", queue)
+            return payload
+
+        payload = asyncio.run(receive())
+
+        assert payload["user_uid"] == "teacher-1"
+        assert payload["type"] == "approval_status"
+
+class TestNotificationWebsocket:
+    """The websocket authenticates from the query or header and cleans up on disconnect"""
+
+    @pytest.fixture
+    def hub(self):
+        hub = NotificationHub()
+        with patch("src.routes.notifications.notification_hub", hub):
+            yield hub
+
+    @pytest.fixture
+    def app_client(self, hub):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from src.database import schemas
+        from src.routes import notifications
+        from src.services import auth_service
+        from src.utils.constants import UserRole
+
+        async def authenticate(token, db):
+            if token != "t":
+                raise HTTPException(status_code=401, detail="Could not validate credentials")
+            return schemas.UserInDB.model_construct(uid="teacher-1", role=UserRole.HOMEROOM_TEACHER)
+
+        app = FastAPI()
+        app.include_router(notifications.router)
+        app.dependency_overrides[auth_service.get_db] = lambda: None
+        with patch("src.utils.auth_decorators.get_current_user_from_token", side_effect=authenticate):
+            yield TestClient(app)
+
+    @staticmethod
+    def wait_until(condition, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    @staticmethod
+    def open_sockets():
+        from src.utils import metrics
+
+        return metrics.WEBSOCKET_SUBSCRIBERS.values().get(("notifications",), 0)
+
+    def test_rejects_invalid_token(self, app_client):
+        from starlette.websockets import WebSocketDisconnect
+
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with app_client.websocket_connect("/notifications/ws?token=wrong") as websocket:
+                websocket.receive_json()
+
+        assert exc_info.value.code == 1008
+
+    def test_pushes_notifications_to_query_token_user(self, app_client, hub):
+        with app_client.websocket_connect("/notifications/ws?token=t") as websocket:
+            self.wait_until(lambda: "teacher-1" in hub._subscribers)
+            hub.publish("teacher-1", {"type": "approval_status"})
+            payload = websocket.receive_json()
+
+        assert payload == {"type": "approval_status"}
+
+    def test_disconnect_without_notifications_unsubscribes(self, app_client, hub):
+        before = self.open_sockets()
+
+        with app_client.websocket_connect("/notifications/ws", headers={"Authorization": "Bearer t"}):
+            self.wait_until(lambda: "teacher-1" in hub._subscribers)
+            assert self.open_sockets() == before + 1
+
+        # 알림이 한 건도 없었어도 연결 종료 시 구독과 게이지가 정리된다
+        self.wait_until(lambda: "teacher-1" not in hub._subscribers)
+        self.wait_until(lambda: self.open_sockets() == before)
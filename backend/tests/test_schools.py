@@ -1,2 +1,63 @@
 # backend/tests/test_schools.py
 # Unit and integration tests for schools
+
+from unittest.mock import patch
+
+import pytest
+
+from src.database import models, schemas
+from src.services import school_service
+from src.services.application_snapshot_service import application_snapshots
+from src.utils import events
+
+@pytest.fixture
+def schools(db):
+    first = models.School(name="제주고등학교", total_quota=100, priority_within_quota=10, actual_competition_quota=90)
+    second = models.School(name="서귀포고등학교", total_quota=50, actual_competition_quota=50)
+    db.add_all([first, second])
+    db.commit()
+    yield first, second
+    application_snapshots.clear()
+
+class TestSchoolQuotaUpdate:
+    """Test cases for the school quota update pipeline"""
+
+    def test_recomputes_actual_competition_quota(self, db, schools):
+        school, _ = schools
+
+        with patch.object(events, "publish") as publish:
+            changes = school_service.update_school_quota(db, school, schemas.SchoolQuotaUpdate(total_quota=120, priority_within_quota=15))
+
+        assert school.actual_competition_quota == 105
+        assert changes == {"total_quota": (100, 120), "priority_within_quota": (10, 15), "actual_competition_quota": (90, 105)}
+        publish.assert_called_once_with(events.SCHOOL_QUOTA_CHANGED, {"school_id": school.id, "changes": changes})
+
+    def test_unchanged_quota_is_a_no_op(self, db, schools):
+        school, _ = schools
+        updated_at = school.updated_at
+
+        with patch.object(events, "publish") as publish:
+            changes = school_service.update_school_quota(db, school, schemas.SchoolQuotaUpdate(total_quota=100, priority_within_quota=10))
+
+        assert changes is None
+        assert school.updated_at == updated_at
+        publish.assert_not_called()
+
+    def test_outside_quota_does_not_change_competition_quota(self, db, schools):
+        school, _ = schools
+
+        changes = school_service.update_school_quota(db, school, schemas.SchoolQuotaUpdate(priority_outside_quota=5))
+
+        assert changes == {"priority_outside_quota": (0, 5)}
+        assert school.actual_competition_quota == 90
+
+    def test_invalidates_only_the_changed_school(self, db, schools):
+        school, other = schools
+        application_snapshots.refresh(school.id, db)
+        application_snapshots.refresh(other.id, db)
+
+        school_service.update_school_quota(db, school, schemas.SchoolQuotaUpdate(total_quota=80))
+
+        assert school.id not in application_snapshots._snapshots
+        assert other.id in application_snapshots._snapshots
+        assert application_snapshots.refresh(school.id, db).status.actual_competition_quota == 70
@@ -0,0 +1,43 @@
+# backend/tests/test_startup.py
+# Cold-start checks: import-time profile and lazily loaded heavy dependencies
+
+import os
+from pathlib import Path
+import pytest
+
+from src.config import settings
+from src.utils.import_profile import profile_imports
+from src.utils.lazy import LazyProxy
+
+ROUTE_MODULES = ["src.routes.schools", "src.routes.students", "src.routes.grades", "src.routes.applications", "src.routes.competition"]
+# 첫 사용 시 로드해야 하는 무거운 의존성
+LAZY_DEPENDENCIES = {"numpy", "passlib", "jose", "openpyxl", "firebase_admin"}
+
+class TestColdStart:
+    """Test cases for cold-start import cost"""
+
+    def test_route_imports_skip_heavy_dependencies(self, tmp_path):
+        profile = profile_imports(ROUTE_MODULES)
+
+        # CI에서 IMPORT_PROFILE_DIR를 지정하면 보고서를 산출물로 보관 (시간 예산은 보고만 하고 검사하지 않음)
+        artifact_dir = Path(os.getenv("IMPORT_PROFILE_DIR", tmp_path))
+        artifact_dir.mkdir(parents=True, exist_ok=True)
+        (artifact_dir / "importtime.txt").write_text(profile.report(budget_ms=settings.COLD_START_BUDGET_MS), encoding="utf-8")
+
+        assert set(ROUTE_MODULES) <= profile.module_names
+        assert not LAZY_DEPENDENCIES & profile.module_names
+
+    def test_failed_import_reports_the_exception(self):
+        with pytest.raises(RuntimeError) as exc_info:
+            profile_imports(["src.routes.schools", "src.no_such_module"])
+
+        assert str(exc_info.value).startswith("ModuleNotFoundError")
+
+    def test_lazy_proxy_defers_factory(self):
+        calls = []
+        proxy = LazyProxy(lambda: calls.append(1) or {"collection": "users"})
+
+        assert not proxy.is_initialized
+        assert proxy.get("collection") == "users"
+        assert proxy.get("collection") == "users"
+        assert calls == [1]
@@ -0,0 +1,273 @@
+# backend/tests/test_utils.py
+# Unit tests for shared utilities
+
+import json
+import threading
+import time
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.config import settings
+from src.database import models, schemas
+from src.database.hydration import hydrate
+from src.services import grade_service
+from src.utils import fast_json, firestore_tracing, metrics, profiling
+from src.utils.cache import TTLCache
+from src.utils.constants import UserRole
+
+class TestFastJson:
+    """Test cases for the fast JSON response path"""
+
+    def test_list_response_matches_model_dump(self):
+        grades = [schemas.Grade(id="1", student_id="7", subject="국어", score=90), schemas.Grade(id="2", student_id="7", subject="내신석차백분율", percentile_rank=12.5)]
+
+        response = fast_json.list_response(schemas.Grade, grades)
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == [grade.model_dump() for grade in grades]
+
+    def test_student_grades_include_percentile_rows(self, db):
+        student = models.Student(name="학생", student_id_number="s-1")
+        student.grades.append(models.Grade(subject="내신석차백분율", percentile_rank=3.5))
+        db.add(student)
+        db.commit()
+
+        body = fast_json.dump_list(schemas.Grade, [grade_service.to_grade_schema(g) for g in grade_service.get_grades_by_student_id(db, student.id)])
+
+        assert json.loads(body) == [{"subject": "내신석차백분율", "score": None, "id": "1", "student_id": str(student.id), "percentile_rank": 3.5}]
+
+    def test_dumps_handles_non_json_types(self):
+        assert json.loads(fast_json.dumps({"count": 1, "at": date(2024, 1, 1)})) == {"count": 1, "at": "2024-01-01"}
+
+class TestTTLCache:
+    """Values are computed once per miss and invalidation wins over in-flight computations"""
+
+    def test_concurrent_misses_compute_once(self):
+        cache = TTLCache(ttl_seconds=60)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            time.sleep(0.05)
+            return "value"
+
+        threads = [threading.Thread(target=cache.get_or_set, args=("key", factory)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert cache.get_or_set("key", lambda: "other") == "value"
+
+    def test_invalidate_during_computation_discards_stale_value(self):
+        cache = TTLCache(ttl_seconds=60)
+        started, release = threading.Event(), threading.Event()
+
+        def stale_factory():
+            started.set()
+            release.wait(1)
+            return "stale"
+
+        result = []
+        worker = threading.Thread(target=lambda: result.append(cache.get_or_set("key", stale_factory)))
+        worker.start()
+        started.wait(1)
+        # 계산이 끝나기를 기다리지 않고 바로 무효화된다
+        cache.invalidate()
+        release.set()
+        worker.join()
+
+        assert result == ["stale"]
+        assert cache.get_or_set("key", lambda: "fresh") == "fresh"
+
+class TestMetrics:
+    """Test cases for the in-process metrics registry"""
+
+    def test_counter_sums_thread_shards(self):
+        counter = metrics.MetricsRegistry().counter("jobs_total", "Jobs", ("status",))
+        threads = [threading.Thread(target=lambda: [counter.inc(status="ok") for _ in range(1000)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.inc(status="failed")
+
+        assert counter.values() == {("ok",): 4000, ("failed",): 1}
+        assert 'jobs_total{status="ok"} 4000' in counter.render()
+
+    def test_histogram_renders_cumulative_buckets(self):
+        registry = metrics.MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        text = registry.render()
+
+        assert '# TYPE latency_seconds histogram' in text
+        assert 'latency_seconds_bucket{le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{le="1.0"} 2' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+        assert 'latency_seconds_count 3' in text
+
+    def test_middleware_labels_route_template(self):
+        app = FastAPI()
+        app.middleware("http")(metrics.metrics_middleware)
+
+        @app.get("/items/{item_id}")
+        def read_item(item_id: int):
+            metrics.count_firestore_rpc(2)
+            return {"id": item_id}
+
+        TestClient(app).get("/items/7")
+
+        durations = metrics.HTTP_REQUEST_DURATION.values()
+        assert ("GET", "/items/{item_id}", "200") in durations
+        assert metrics.FIRESTORE_RPCS_PER_REQUEST.values()[("/items/{item_id}",)][-1] >= 2
+        assert metrics.HTTP_REQUESTS_IN_FLIGHT.values()[()] == 0
+
+    def test_scrape_endpoint_requires_token(self):
+        from src.routes import metrics as metrics_routes
+
+        app = FastAPI()
+        app.include_router(metrics_routes.router)
+        client = TestClient(app)
+
+        with patch.object(settings, "METRICS_TOKEN", "secret"):
+            assert client.get("/metrics").status_code == 401
+            assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+            response = client.get("/metrics", headers={"Authorization": "Bearer secret"})
+
+        assert response.status_code == 200
+        assert "# TYPE" in response.text
+
+class TestProfiling:
+    """Test cases for per-request sampling profiles"""
+
+    def make_client(self):
+        app = FastAPI()
+        app.middleware("http")(profiling.profiling_middleware)
+
+        @app.get("/slow")
+        def slow_dashboard():
+            deadline = time.perf_counter() + 0.1
+            while time.perf_counter() < deadline:
+                sum(range(1000))
+            return {"ok": True}
+
+        return TestClient(app)
+
+    def test_profile_captured_with_admin_token(self):
+        profiling.profile_store.clear()
+        with patch.object(settings, "PROFILING_TOKEN", "secret"), patch.object(settings, "PROFILE_INTERVAL_MS", 1):
+            response = self.make_client().get("/slow", headers={"X-Profile-Token": "secret"})
+
+        profile = profiling.profile_store.get(response.headers["X-Profile-Id"])
+        assert profile.samples > 0
+        assert "slow_dashboard (test_utils.py:" in profile.collapsed()
+
+    def test_no_profile_without_token(self):
+        profiling.profile_store.clear()
+        with patch.object(settings, "PROFILING_TOKEN", "secret"):
+            response = self.make_client().get("/slow", headers={"X-Profile-Token": "wrong"})
+
+        assert "X-Profile-Id" not in response.headers
+        assert profiling.profile_store.list() == []
+
+    def test_sampler_is_stopped_off_the_event_loop(self):
+        profiling.profile_store.clear()
+        stop = profiling.StackSampler.stop
+        stopped_on = []
+
+        def recording_stop(sampler):
+            stopped_on.append(threading.current_thread())
+            stop(sampler)
+
+        with patch.object(settings, "PROFILING_TOKEN", "secret"), patch.object(profiling.StackSampler, "stop", recording_stop):
+            with self.make_client() as client:
+                loop_thread = client.portal.call(threading.current_thread)
+                client.get("/slow", headers={"X-Profile-Token": "secret"})
+
+        assert len(stopped_on) == 1 and stopped_on[0] is not loop_thread
+
+class TestFirestoreTracing:
+    """Test cases for Firestore round-trip tracing"""
+
+    def make_client(self):
+        client = MagicMock()
+        client.collection.return_value.where.return_value.stream.return_value = iter([MagicMock(), MagicMock()])
+        return firestore_tracing.TracedClient(client)
+
+    def test_counts_round_trips_and_flags_n_plus_one(self):
+        client = self.make_client()
+
+        with firestore_tracing.trace_firestore("/approval/history") as trace:
+            docs = list(client.collection("approval_logs").where("approver_uid", "==", "uid-1").stream())
+            for index in range(len(docs) * 3):
+                client.collection("users").document(f"uid-{index}").get()
+            client.collection("approval_logs").add({"action": "approved"})
+
+        assert trace.rpc_count == 8
+        assert [call.operation for call in trace.calls[:2]] == ["stream", "get"]
+        assert trace.calls[0].shape == "approval_logs where approver_uid =="
+        assert trace.n_plus_one(threshold=5) == {"get users/*": 6}
+
+    def test_rpc_budget_fails_when_exceeded(self):
+        client = self.make_client()
+
+        with pytest.raises(firestore_tracing.RPCBudgetExceeded, match="3 Firestore calls"):
+            with firestore_tracing.assert_rpc_budget(2):
+                for uid in ("a", "b", "c"):
+                    client.collection("users").document(uid).get()
+
+    def test_middleware_reports_route_summary(self):
+        firestore_tracing.route_summaries.clear()
+        client = self.make_client()
+        app = FastAPI()
+        app.middleware("http")(firestore_tracing.firestore_tracing_middleware)
+
+        @app.get("/users/{uid}")
+        def read_user(uid: str):
+            client.collection("users").document(uid).get()
+            return {"uid": uid}
+
+        TestClient(app).get("/users/abc")
+
+        [summary] = firestore_tracing.route_summaries.report()
+        assert summary["route"] == "/users/{uid}"
+        assert summary["max_rpcs"] == 1
+        assert summary["top_calls"] == [{"call": "get users/*", "count": 1}]
+
+USER_DOCUMENT = {
+    "uid": "user-1", "email": "teacher@example.com", "username": "teacher", "role": "third_grade_homeroom",
+    "is_active": True, "is_approved": False, "school_id": "school-1", "grade": 3, "class_number": 2,
+    "created_at": "2024-03-01T09:00:00", "updated_at": "2024-03-01T09:00:00", "approved_by": None,
+}
+
+class TestHydration:
+    """Test cases for trusted schema construction from stored documents"""
+
+    def test_matches_validated_model(self):
+        user = hydrate(schemas.UserInDB, USER_DOCUMENT)
+
+        assert user.role is UserRole.THIRD_GRADE_HOMEROOM
+        assert user.model_dump() == schemas.UserInDB(**USER_DOCUMENT).model_dump()
+        assert user.model_dump_json() == schemas.UserInDB(**USER_DOCUMENT).model_dump_json()
+
+    def test_missing_required_field_is_validated(self):
+        document = {key: value for key, value in USER_DOCUMENT.items() if key != "uid"}
+
+        with pytest.raises(ValidationError):
+            hydrate(schemas.UserInDB, document)
+
+    def test_shape_check_validates_everything(self):
+        document = dict(USER_DOCUMENT, email="not-an-email")
+        assert hydrate(schemas.UserInDB, document).email == "not-an-email"
+
+        with patch.object(settings, "SCHEMA_SHAPE_CHECK", True), pytest.raises(ValidationError):
+            hydrate(schemas.UserInDB, document)
@@ -1,8 +1,31 @@
 // js/api.js
 
 const API_BASE_URL = 'http://localhost:5000'; // 백엔드 서버 주소 (추후 변경 가능)
+const JOB_POLL_INTERVAL_MS = 1000; // 성적 처리 작업 상태 확인 주기
 
-async function uploadExcelFile(file) {
+// 업로드 후 백그라운드 처리 작업이 끝날 때까지 상태를 확인합니다.
+async function waitForGradeJob(jobId, onProgress) {
+    while (true) {
+        const response = await fetch(`${API_BASE_URL}/grades/jobs/${jobId}`);
+        if (!response.ok) {
+            throw new Error('처리 상태 조회 실패');
+        }
+
+        const job = await response.json();
+        if (onProgress) {
+            onProgress(job);
+        }
+        if (job.status === 'completed') {
+            return job.result;
+        }
+        if (job.status === 'failed') {
+            throw new Error(job.errors.join(', ') || '파일 처리 실패');
+        }
+        await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    }
+}
+
+async function uploadExcelFile(file, onProgress) {
     const formData = new FormData();
     formData.append('excelFile', file);
 
@@ -17,7 +40,12 @@ async function uploadExcelFile(file) {
             throw new Error(errorData.message || '파일 업로드 실패');
         }
 
-        return await response.json();
+        const result = await response.json();
+        // 202: 서버가 백그라운드에서 처리 중 (작업 ID 반환)
+        if (response.status === 202 && result.job_id) {
+            return await waitForGradeJob(result.job_id, onProgress);
+        }
+        return result;
     } catch (error) {
         console.error('Error uploading file:', error);
         throw error;
@@ -20,7 +20,9 @@ document.addEventListener('DOMContentLoaded', () => {
         uploadStatus.style.color = 'orange';
 
         try {
-            const result = await uploadExcelFile(file); // api.js의 함수 호출
+            const result = await uploadExcelFile(file, (job) => {
+                uploadStatus.textContent = `파일 처리 중... (${job.rows_processed}/${job.total_rows})`;
+            }); // api.js의 함수 호출
             uploadStatus.textContent = '파일 업로드 성공!';
             uploadStatus.style.color = 'green';
 